@@ -12,12 +12,17 @@ process and own its lifecycle in the FastAPI lifespan.
 
 Index/key creation is one-shot: call :func:`setup_checkpointer_indexes`
 once at app startup (from the lifespan handler).
+
+Checkpoint keys expire after ``settings.CHECKPOINT_TTL_MINUTES`` without
+activity: every read pushes the expiry out again, so live conversations
+never lose state while threads from clients that vanished are reclaimed.
 """
 
 from __future__ import annotations
 
 import logging
 from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from langgraph.checkpoint.redis import AsyncRedisSaver, RedisSaver
 
@@ -26,16 +31,26 @@ from src.app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _ttl_config() -> Optional[Dict[str, Any]]:
+    """Saver TTL settings, or None to keep checkpoints forever."""
+    if settings.CHECKPOINT_TTL_MINUTES <= 0:
+        return None
+    return {
+        "default_ttl": settings.CHECKPOINT_TTL_MINUTES,
+        "refresh_on_read": True,
+    }
+
+
 @lru_cache(maxsize=1)
 def get_redis_saver() -> RedisSaver:
     """Return the shared sync :class:`RedisSaver` (constructed lazily)."""
-    return RedisSaver(redis_url=settings.REDIS_URL)
+    return RedisSaver(redis_url=settings.REDIS_URL, ttl=_ttl_config())
 
 
 @lru_cache(maxsize=1)
 def get_async_redis_saver() -> AsyncRedisSaver:
     """Return the shared :class:`AsyncRedisSaver` (constructed lazily)."""
-    return AsyncRedisSaver(redis_url=settings.REDIS_URL)
+    return AsyncRedisSaver(redis_url=settings.REDIS_URL, ttl=_ttl_config())
 
 
 async def setup_checkpointer_indexes() -> None:
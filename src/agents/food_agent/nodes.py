@@ -26,6 +26,9 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from src.app.core.config import settings
+from src.app.core.database import run_in_thread
+from src.app.models.order import Order
+from src.app.models.user import get_user_by_uid
 from src.app.services.graphiti import contract
 from src.app.services.mcp_service import mcp_service
 from src.app.services.profile_service import profile_service
@@ -428,12 +431,8 @@ async def _persist_order_to_neo4j(
     if not user_id:
         return None
 
-    from src.app.core.database import run_in_thread
-    from src.app.models.order import Order
-    from src.app.models.user import User
-
     def _persist() -> Optional[str]:
-        user = User.nodes.filter(uid=user_id).first()
+        user = get_user_by_uid(user_id)
         if not user:
             return None
         try:
@@ -450,7 +449,7 @@ async def _persist_order_to_neo4j(
             user.orders.connect(order)
         except Exception:
             logger.exception("User.orders.connect(order) failed")
-        return getattr(order, "uid", None)
+        return order.order_id
 
     return await run_in_thread(_persist)
 
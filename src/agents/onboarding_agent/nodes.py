@@ -1,8 +1,10 @@
-from .tools import transcribe_audio, extract_user_information, convert_text_to_speech, generate_dietary_question, validate_dietary_response, get_user_onboarding_state, generate_contextual_onboarding_question
+import random
+
+from .tools import transcribe_audio, extract_user_information, convert_text_to_speech, generate_dietary_question, validate_dietary_response, get_user_onboarding_state, generate_contextual_onboarding_question, save_user_to_graph_db, UNANSWERED
 from .state import OnboardingAgentState
 
 # Onboarding-specific required fields (sign-up fields are already collected)
-ONBOARDING_REQUIRED_FIELDS = [
+ONBOARDING_REQUIRED_FIELDS = (
     "age",
     "dietary_restrictions",
     "cuisine_preferences",
@@ -11,8 +13,8 @@ ONBOARDING_REQUIRED_FIELDS = [
     "cultural_background",
     "food_allergies",
     "spice_tolerance",
-    "preferred_languages"
-]
+    "preferred_languages",
+)
 
 
 # Node Functions
@@ -42,10 +44,11 @@ async def transcription_node(state: OnboardingAgentState) -> OnboardingAgentStat
 
 async def information_extraction_node(state: OnboardingAgentState) -> OnboardingAgentState:
     """Extract user information from transcribed text and synthesize next onboarding question based on database state"""
+    state["profile_complete"] = False
     try:
         text = state.get("transcribed_text")
         if text:
-            extracted = extract_user_information(text)
+            extracted = await extract_user_information(text)
             # Convert Pydantic model to dict if needed
             if hasattr(extracted, "dict"):
                 extracted = extracted.dict()
@@ -55,28 +58,13 @@ async def information_extraction_node(state: OnboardingAgentState) -> Onboarding
             current_info.update(extracted)
             state["extracted_information"] = current_info
             
-            # Immediately save extracted information to database
-            user_email = current_info.get("email")
-            if user_email and extracted:
-                try:
-                    from src.app.models.user import User
-                    user = User.nodes.filter(email=user_email).first()
-                    if user:
-                        # Update user fields with extracted information
-                        for field, value in extracted.items():
-                            if hasattr(user, field) and value is not None:
-                                setattr(user, field, value)
-                        user.save()
-                        print(f"DEBUG - Saved extracted info to database: {extracted}")
-                except Exception as e:
-                    print(f"DEBUG - Error saving extracted info: {str(e)}")
-                    pass
-
             # Get user's current database state - THIS IS THE KEY CHANGE
             user_email = current_info.get("email")
             if user_email:
-                # Always refresh database state after saving new information
-                db_state = await get_user_onboarding_state(user_email)
+                # Save the newly extracted information and read back the
+                # refreshed database state in one round trip
+                updates = {k: v for k, v in extracted.items() if v is not None}
+                db_state = await get_user_onboarding_state(user_email, updates=updates)
                 print(f"DEBUG - Database state: {db_state}")
                 
                 if db_state.get("success"):
@@ -93,23 +81,24 @@ async def information_extraction_node(state: OnboardingAgentState) -> Onboarding
                     
                     if not missing_fields:
                         state["onboarding_status"] = "ready"
+                        state["profile_complete"] = True
                         state["system_response"] = "Perfect! We have all the information we need to personalize your Aurasense experience."
                     else:
                         state["onboarding_status"] = "pending_info"
                         # Generate contextual question based on missing field and current state
                         next_field = missing_fields[0]
-                        question = generate_contextual_onboarding_question(next_field, merged_state)
+                        question = await generate_contextual_onboarding_question(next_field, merged_state)
                         state["system_response"] = question
                 else:
                     # Fallback to old logic if database query fails
-                    missing_fields = [f for f in ONBOARDING_REQUIRED_FIELDS if not current_info.get(f)]
+                    missing_fields = [f for f in ONBOARDING_REQUIRED_FIELDS if current_info.get(f) in UNANSWERED]
                     if not missing_fields:
                         state["onboarding_status"] = "ready"
                         state["system_response"] = "Perfect! We have all the information we need to personalize your Aurasense experience."
                     else:
                         state["onboarding_status"] = "pending_info"
                         next_field = missing_fields[0]
-                        question = generate_contextual_onboarding_question(next_field, current_info)
+                        question = await generate_contextual_onboarding_question(next_field, current_info)
                         state["system_response"] = question
             else:
                 # No email found - ask for it first
@@ -136,14 +125,17 @@ async def onboarding_complete_node(state: OnboardingAgentState) -> OnboardingAge
         user_email = info.get("email")
         
         if user_email:
-            # Check current database state to see what's still missing
-            db_state = await get_user_onboarding_state(user_email)
+            # Check current database state to see what's still missing,
+            # unless extraction just read it back with nothing missing
+            if state.get("profile_complete"):
+                db_state = {"success": True, "missing_fields": []}
+            else:
+                db_state = await get_user_onboarding_state(user_email)
             if db_state.get("success"):
                 missing_fields = db_state.get("missing_fields", [])
                 
                 if not missing_fields:
                     # All required fields are present, complete onboarding
-                    from .tools import save_user_to_graph_db
                     save_result = await save_user_to_graph_db(info)
                     if save_result.get("success"):
                         state["onboarding_status"] = "onboarded"
@@ -160,8 +152,7 @@ async def onboarding_complete_node(state: OnboardingAgentState) -> OnboardingAge
                     state["system_response"] = f"We still need {missing_count} more piece{'s' if missing_count > 1 else ''} of information to personalize your experience."
             else:
                 # Fallback to old logic if database query fails
-                if all(info.get(f) for f in ONBOARDING_REQUIRED_FIELDS):
-                    from .tools import save_user_to_graph_db
+                if all(info.get(f) not in UNANSWERED for f in ONBOARDING_REQUIRED_FIELDS):
                     save_result = await save_user_to_graph_db(info)
                     if save_result.get("success"):
                         state["onboarding_status"] = "onboarded"
@@ -194,8 +185,6 @@ async def verification_initiation_node(state: OnboardingAgentState) -> Onboardin
             "The ocean waves crash against the shore",
         ]
 
-        import random
-
         sentence = random.choice(verification_sentences)
         state["verification_sentence"] = sentence
         state["system_response"] = (
@@ -27,3 +27,7 @@ class OnboardingAgentState(BaseAgentState, total=False):
 
     # Indicates if the agent is waiting for a specific user action.
     awaiting_user_action: Optional[str]
+
+    # True when this turn's database read (in information extraction)
+    # found no missing onboarding fields, so completion needn't re-read.
+    profile_complete: bool
@@ -1,49 +1,68 @@
 # tools.py
 
-import os
+import asyncio
+import io
+import logging
+import random
 import uuid
-import aiofiles
+from difflib import SequenceMatcher
 import json
-import tempfile
+import orjson
 from pathlib import Path
 from typing import Literal, TypedDict, Optional, Union, Dict, Any
 from rich import print
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from pydantic import BaseModel, Field, field_validator
 from typing import List
 from datetime import datetime
 
 # Import your LLM clients
 from .llm import stt_client, tts_client, llm_llama3, llm_deepseek, llm_qwen
 from src.app.core.config import settings
+from src.app.core.database import redis_cache, run_in_thread
+from src.app.models.user import (
+    get_onboarding_profile,
+    update_onboarding_profile,
+    update_user_by_email,
+)
 import re
 
+logger = logging.getLogger(__name__)
+
+
+# Compiled once; filter_thinking_tokens runs on every generated question.
+# <think>/<thinking> blocks are removed in one pass, as are free-text
+# reasoning preambles.
+_THINK_BLOCK_RE = re.compile(
+    r"<(think|thinking)>.*?</\1>", re.DOTALL | re.IGNORECASE
+)
+_REASONING_RE = re.compile(
+    r"(?:Let me think|I need to).*?(?=\n\n|\n[A-Z]|$)", re.DOTALL | re.IGNORECASE
+)
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
 
 def filter_thinking_tokens(text: str) -> str:
     """Remove thinking tokens and reasoning from LLM responses"""
     if not text:
         return text
-    
-    # Remove content between <think> and </think> tags
-    text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Remove content between <thinking> and </thinking> tags
-    text = re.sub(r'<thinking>.*?</thinking>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Remove any other reasoning patterns
-    text = re.sub(r'Let me think.*?(?=\n\n|\n[A-Z]|$)', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'I need to.*?(?=\n\n|\n[A-Z]|$)', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
+
+    text = _THINK_BLOCK_RE.sub("", text)
+    text = _REASONING_RE.sub("", text)
+
     # Clean up extra whitespace
-    text = re.sub(r'\n\s*\n', '\n', text)
-    text = text.strip()
-    
-    return text
+    return _BLANK_LINES_RE.sub("\n", text).strip()
+
+
+# Cheap shape check for LLM-extracted emails. Full RFC validation
+# (EmailStr / email-validator) is left to the registration route, which is
+# where an address actually becomes an account identifier.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class UserInformation(BaseModel):
     """Pydantic model for user information extracted from text"""
 
-    email: Optional[EmailStr] = Field(None, description="User's email address")
+    email: Optional[str] = Field(None, description="User's email address")
     first_name: Optional[str] = Field(None, description="User's first name")
     last_name: Optional[str] = Field(None, description="User's last name")
     username: Optional[str] = Field(None, description="User's username")
@@ -75,6 +94,12 @@ class UserInformation(BaseModel):
         default=["en"], description="User's preferred languages"
     )
 
+    @field_validator("email")
+    def validate_email(cls, v):
+        if v is not None and not _EMAIL_RE.match(v):
+            return None  # Same non-raising policy as price_range below
+        return v
+
     @field_validator("price_range")
     def validate_price_range(cls, v):
         if v is not None and v not in ["budget", "mid-range", "premium", "luxury"]:
@@ -103,6 +128,16 @@ class UserInformation(BaseModel):
         }
 
 
+# JSON schema for UserInformation, rendered once at import. It's inlined in
+# the extraction prompt so the model can answer in plain JSON mode instead
+# of going through LangChain's tool-calling structured-output wrapper.
+_USER_INFORMATION_SCHEMA = orjson.dumps(UserInformation.model_json_schema()).decode()
+
+# Qwen bound to Groq's JSON mode: the response content is a single JSON
+# object we decode ourselves.
+_extraction_llm = llm_qwen.bind(response_format={"type": "json_object"})
+
+
 class TranscriptionParams(TypedDict, total=False):
     """Type-safe transcription parameters for audio transcription"""
 
@@ -118,14 +153,17 @@ class TranscriptionParams(TypedDict, total=False):
 async def transcribe_audio(
     audio_input: Union[str, bytes],
     response_format: Literal["json", "text", "verbose_json", "srt", "vtt"] = "text",
+    return_bytes: bool = False,
     **kwargs,
-) -> Union[str, Dict[str, Any]]:
+) -> Union[str, bytes, Dict[str, Any]]:
     """
     Transcribe audio input to text.
 
     Args:
         audio_input: Either a file path (str) or audio bytes
         response_format: Format for the response
+        return_bytes: For non-text formats, return the response as
+            JSON-encoded bytes (ready for an HTTP/WS body) instead of a dict
         **kwargs: Additional parameters for transcription
 
     Returns:
@@ -141,8 +179,6 @@ async def transcribe_audio(
         **kwargs,
     }
 
-    temp_file = None
-
     try:
         if isinstance(audio_input, str):
             # Handle file path
@@ -150,48 +186,43 @@ async def transcribe_audio(
             if not audio_path.exists():
                 raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-            with open(audio_path, "rb") as audio_file:
-                transcription_params["file"] = audio_file
-                response = stt_client.audio.transcriptions.create(
-                    **transcription_params
-                )
-
-        elif isinstance(audio_input, bytes):
-            # Handle bytes - write to temp file, transcribe, then cleanup
-            try:
-                # Create temporary file
-                temp_fd, temp_file = tempfile.mkstemp(suffix=".wav")
-                os.close(temp_fd)
-                temp_path = Path(temp_file)
-
-                # Write bytes to temp file
-                async with aiofiles.open(temp_path, "wb") as f:
-                    await f.write(audio_input)
-
-                # Transcribe the temp file
-                with open(temp_path, "rb") as audio_file:
+            # Open, read and upload in a worker thread: both the file read
+            # and the SDK call block.
+            def _transcribe_file():
+                with open(audio_path, "rb") as audio_file:
                     transcription_params["file"] = audio_file
-                    response = stt_client.audio.transcriptions.create(
+                    return stt_client.audio.transcriptions.create(
                         **transcription_params
                     )
 
-            finally:
-                # Clean up temp file
-                if temp_file and Path(temp_file).exists():
-                    Path(temp_file).unlink()
+            response = await asyncio.to_thread(_transcribe_file)
+
+        elif isinstance(audio_input, bytes):
+            # Already in memory: hand the SDK a named buffer rather than
+            # round-tripping through a temp file. The name carries the
+            # format hint the API uses.
+            bio = io.BytesIO(audio_input)
+            bio.name = "audio.wav"
+            transcription_params["file"] = bio
+            response = await asyncio.to_thread(
+                stt_client.audio.transcriptions.create, **transcription_params
+            )
         else:
             raise ValueError("audio_input must be either a string (file path) or bytes")
 
-        # Handle different response formats
+        # Handle different response formats. text / srt / vtt usually come
+        # back as plain strings already; check that before probing attributes.
+        if isinstance(response, str):
+            return response
         if response_format == "text":
-            return response.text if hasattr(response, "text") else str(response)
-        else:
-            return response.dict() if hasattr(response, "dict") else response
+            return response.text
+        if return_bytes:
+            # pydantic-core serializes straight to JSON without building
+            # an intermediate dict.
+            return response.model_dump_json().encode()
+        return response.model_dump()
 
     except Exception as e:
-        # Clean up temp file on error
-        if temp_file and Path(temp_file).exists():
-            Path(temp_file).unlink()
         raise Exception(f"Transcription failed: {str(e)}")
 
 
@@ -230,47 +261,43 @@ async def convert_text_to_speech(
             **kwargs,
         }
 
-        # Generate speech
-        response = tts_client.audio.speech.create(**tts_params)
+        # Generate speech (the Groq SDK call blocks; keep it off the loop)
+        response = await asyncio.to_thread(
+            tts_client.audio.speech.create, **tts_params
+        )
 
         if not output_path:
-            # Generate a random file name
-            output_path = Path(f"output_{uuid.uuid4()}.{response_format}")
-
-        # Save to file
-        if stream and hasattr(response, "stream_to_file"):
-            response.stream_to_file(output_path)
-        elif hasattr(response, "write_to_file"):
-            response.write_to_file(output_path)
-        else:
-            # Fallback: write response content to file
-            with open(output_path, "wb") as f:
-                f.write(response.content)
-
+            # Hand the audio back in memory; callers that want a file pass
+            # `output_path`. No temp file write + re-read per turn.
+            return response.read()
+
+        # Save to file. Disk writes block, so do them in a worker thread.
+        def _save() -> None:
+            if stream and hasattr(response, "stream_to_file"):
+                response.stream_to_file(output_path)
+            elif hasattr(response, "write_to_file"):
+                response.write_to_file(output_path)
+            else:
+                # Fallback: write response content to file
+                with open(output_path, "wb") as f:
+                    f.write(response.content)
+
+        await asyncio.to_thread(_save)
         return str(output_path)
 
     except Exception as e:
         raise Exception(f"Text-to-speech conversion failed: {str(e)}")
 
 
-def extract_user_information(text: str) -> Dict[str, Any]:
-    """
-    Extract user information from text using structured LLM output with enhanced reasoning.
-    This function now focuses on extracting the final answer without <think> tags.
-
-    Args:
-        text: Input text to extract information from
-
-    Returns:
-        Dictionary containing extracted user information
-    """
-
-    try:
-        extraction_prompt = f"""
+# Static halves of the extraction prompt, built once at import. Only the
+# user text changes per call; it is spliced in between. The fields to
+# extract come from the appended JSON schema, so they aren't listed again.
+_EXTRACTION_PROMPT_HEAD = """
         You are an expert nutritionist and cultural food specialist. Extract user information from the following text.
         
-        USER INPUT: {text}
-        
+        USER INPUT: """
+_EXTRACTION_PROMPT_TAIL = (
+    """
         EXTRACTION RULES:
         1. Only extract information that is explicitly mentioned or clearly implied
         2. For dietary restrictions, look for mentions of: vegetarian, vegan, gluten-free, lactose-free, kosher, halal, keto, paleo, low-carb, diabetic, etc.
@@ -290,36 +317,45 @@ def extract_user_information(text: str) -> Dict[str, Any]:
         - Always interpret negative responses as ["none"], not empty lists or null values
         
         Extract the information and provide the structured response directly. Do not include reasoning or thinking process.
-        
-        REQUIRED FIELDS TO EXTRACT:
-        - Email address
-        - First name
-        - Last name
-        - Username
-        - Phone number
-        - Password
-        - Age (numeric)
-        - Dietary restrictions (list) - use ["none"] for negative responses
-        - Cuisine preferences (list) - use ["none"] for negative responses
-        - Price range preference (budget/mid-range/premium/luxury)
-        - Whether they are a tourist (boolean)
-        - Cultural background (list) - use ["none"] for negative responses
-        - Food allergies (list) - use ["none"] for negative responses
-        - Spice tolerance (1-5 scale)
-        - Preferred languages (list) - use ["none"] for negative responses
+
+        Respond with a single JSON object that conforms to this JSON schema.
+        Use null for anything not mentioned.
         """
+    + _USER_INFORMATION_SCHEMA
+    + "\n"
+)
 
-        # Use Qwen model with reasoning capabilities
-        llm_with_structured_response = llm_qwen.with_structured_output(
-            UserInformation
-        )
-        response = llm_with_structured_response.invoke(extraction_prompt)
 
-        # Convert to dict and filter out None values
-        if hasattr(response, "dict"):
-            result = response.model_dump()
-        else:
-            result = response
+async def extract_user_information(text: str) -> Dict[str, Any]:
+    """
+    Extract user information from text using structured LLM output with enhanced reasoning.
+    This function now focuses on extracting the final answer without <think> tags.
+
+    Args:
+        text: Input text to extract information from
+
+    Returns:
+        Dictionary containing extracted user information
+    """
+
+    try:
+        extraction_prompt = f"{_EXTRACTION_PROMPT_HEAD}{text}\n{_EXTRACTION_PROMPT_TAIL}"
+
+        response = await _extraction_llm.ainvoke(extraction_prompt)
+
+        # Qwen may still prefix a reasoning block; the JSON follows it.
+        content = response.content
+        if "</think>" in content:
+            content = content.rpartition("</think>")[2]
+
+        # Decode with orjson and drop any keys the model invented. Full
+        # validation is kept (not model_construct) because these values
+        # are written straight into neomodel properties with choices and
+        # bounds (price_range, spice_tolerance).
+        parsed = orjson.loads(content)
+        result = UserInformation.model_validate(
+            {k: v for k, v in parsed.items() if k in UserInformation.model_fields}
+        ).model_dump()
 
         # Filter out None values and empty lists
         filtered_result = {}
@@ -337,6 +373,16 @@ def extract_user_information(text: str) -> Dict[str, Any]:
 
 
 # Authentication helper functions
+
+# Fields a user record must carry before authentication is attempted.
+_REQUIRED_AUTH_FIELDS = ("email", "first_name", "last_name", "password")
+
+# Demo accounts that are routed through voice verification.
+_VOICE_VERIFICATION_EMAILS = frozenset(
+    {"janedoe@example.com", "test@verification.com"}
+)
+
+
 async def authenticate_user(user_info: Dict[str, Any]) -> Dict[str, Any]:
     """
     Authenticate a user with the provided information.
@@ -352,9 +398,7 @@ async def authenticate_user(user_info: Dict[str, Any]) -> Dict[str, Any]:
         # This would integrate with your actual authentication system
         # For demo purposes, we'll simulate authentication
 
-        required_fields = ["email", "first_name", "last_name", "password"]
-
-        if not all(user_info.get(field) for field in required_fields):
+        if not all(user_info.get(field) for field in _REQUIRED_AUTH_FIELDS):
             return {
                 "success": False,
                 "status": "pending_info",
@@ -365,7 +409,7 @@ async def authenticate_user(user_info: Dict[str, Any]) -> Dict[str, Any]:
         email = user_info.get("email")
 
         # Example: Some users need verification
-        if email in ["janedoe@example.com", "test@verification.com"]:
+        if email in _VOICE_VERIFICATION_EMAILS:
             return {
                 "success": False,
                 "status": "pending_verification",
@@ -404,8 +448,6 @@ async def verify_voice_match(
     """
 
     try:
-        from difflib import SequenceMatcher
-
         # Clean and normalize both texts
         spoken_clean = spoken_text.strip().lower()
         expected_clean = expected_text.strip().lower()
@@ -422,7 +464,7 @@ async def verify_voice_match(
         return False
 
 
-def generate_dietary_question(missing_field: str, user_context: Dict[str, Any] = None) -> str:
+async def generate_dietary_question(missing_field: str, user_context: Dict[str, Any] = None) -> str:
     """
     Generate contextual dietary preference questions using AI reasoning.
     
@@ -488,17 +530,37 @@ def generate_dietary_question(missing_field: str, user_context: Dict[str, Any] =
         """
         
         try:
-            response = llm_qwen.invoke(prompt)
+            response = await llm_qwen.ainvoke(prompt)
             return response.content.strip()
         except:
             pass
     
     # Fallback to first question if AI fails
-    import random
     return random.choice(questions)
 
 
-def validate_dietary_response(field: str, response: str) -> Dict[str, Any]:
+_VALIDATION_PROMPT = """You are validating a user's response for the field: {field}
+User response: {response}
+
+Based on the field type, validate and normalize the response:
+
+For dietary_restrictions: Convert to list of standard dietary restrictions
+For cuisine_preferences: Convert to list of standard cuisine types
+For food_allergies: Convert to list of standard allergens
+For cultural_background: Convert to list of cultural/ethnic backgrounds
+For spice_tolerance: Convert to integer 1-5 scale
+For preferred_languages: Convert to list of language codes
+For price_range: Convert to one of: budget, mid-range, premium, luxury
+
+Return a JSON object with:
+- "valid": boolean
+- "normalized_value": the normalized value
+- "confidence": float 0-1
+- "suggestions": list of clarifying questions if needed
+"""
+
+
+async def validate_dietary_response(field: str, response: str) -> Dict[str, Any]:
     """
     Validate and normalize dietary preference responses using AI reasoning.
     
@@ -510,30 +572,10 @@ def validate_dietary_response(field: str, response: str) -> Dict[str, Any]:
         Dictionary with validation results and normalized value
     """
     
-    validation_prompt = f"""
-    You are validating a user's response for the field: {field}
-    User response: {response}
-    
-    Based on the field type, validate and normalize the response:
-    
-    For dietary_restrictions: Convert to list of standard dietary restrictions
-    For cuisine_preferences: Convert to list of standard cuisine types
-    For food_allergies: Convert to list of standard allergens
-    For cultural_background: Convert to list of cultural/ethnic backgrounds
-    For spice_tolerance: Convert to integer 1-5 scale
-    For preferred_languages: Convert to list of language codes
-    For price_range: Convert to one of: budget, mid-range, premium, luxury
-    
-    Return a JSON object with:
-    - "valid": boolean
-    - "normalized_value": the normalized value
-    - "confidence": float 0-1
-    - "suggestions": list of clarifying questions if needed
-    """
+    validation_prompt = _VALIDATION_PROMPT.format(field=field, response=response)
     
     try:
-        response = llm_qwen.invoke(validation_prompt)
-        import json
+        response = await llm_qwen.ainvoke(validation_prompt)
         return json.loads(response.content)
     except:
         return {
@@ -544,75 +586,156 @@ def validate_dietary_response(field: str, response: str) -> Dict[str, Any]:
         }
 
 
-async def get_user_onboarding_state(user_email: str) -> Dict[str, Any]:
+# Short-lived Redis copy of the onboarding profile projection, so
+# back-to-back turns don't each re-read Neo4j. Writes through
+# `get_user_onboarding_state(updates=...)` refresh it and
+# `save_user_to_graph_db` drops it; the TTL bounds anything else.
+# Redis errors fall through to the database.
+_ONBOARDING_STATE_CACHE_TTL_SECONDS = 30
+
+
+def _onboarding_state_key(user_email: str) -> str:
+    return f"onb_state:{user_email}"
+
+
+async def _cache_onboarding_profile(
+    user_email: str, profile: Optional[Dict[str, Any]]
+) -> None:
+    if not profile:
+        return
+    try:
+        await redis_cache.set(
+            _onboarding_state_key(user_email),
+            orjson.dumps(profile),
+            _ONBOARDING_STATE_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        logger.warning("Onboarding state cache write failed", exc_info=True)
+
+
+async def _cached_onboarding_profile(user_email: str) -> Optional[Dict[str, Any]]:
+    try:
+        cached = await redis_cache.get(_onboarding_state_key(user_email))
+    except Exception:
+        logger.warning("Onboarding state cache read failed", exc_info=True)
+        cached = None
+    if cached is not None:
+        return orjson.loads(cached)
+
+    profile = await run_in_thread(get_onboarding_profile, user_email)
+    await _cache_onboarding_profile(user_email, profile)
+    return profile
+
+
+async def _forget_onboarding_profile(user_email: str) -> None:
+    try:
+        await redis_cache.delete(_onboarding_state_key(user_email))
+    except Exception:
+        logger.warning("Onboarding state cache invalidation failed", exc_info=True)
+
+
+# All fields onboarding tries to collect, and the completion denominator.
+_ONBOARDING_STATE_FIELDS = (
+    "age",
+    "dietary_restrictions",
+    "cuisine_preferences",
+    "price_range",
+    "is_tourist",
+    "cultural_background",
+    "food_allergies",
+    "spice_tolerance",
+    "preferred_languages",
+    "phone",
+)
+_ONBOARDING_STATE_TOTAL = len(_ONBOARDING_STATE_FIELDS)
+_ONBOARDING_STATE_PCT_PER_FIELD = 100 / _ONBOARDING_STATE_TOTAL
+
+# Values that mean "not answered yet". Plain truthiness would also treat
+# `is_tourist=False` and `spice_tolerance=0` as missing.
+UNANSWERED = (None, "", [])
+
+
+async def get_user_onboarding_state(
+    user_email: str, updates: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Get the current onboarding state for a user from the database.
     Args:
         user_email: User's email address
+        updates: Optional fields to save first; the write and the re-read
+            then happen in a single query
     Returns:
         Dictionary with current user state and missing fields
     """
     try:
-        from src.app.models.user import User
-        
-        # Find the user by email
-        user = User.nodes.filter(email=user_email).first()
-        if not user:
+        # One projection query for just the fields we need (sync neomodel
+        # driver, so off the event loop)
+        profile = None
+        if updates:
+            try:
+                profile = await run_in_thread(
+                    update_onboarding_profile, user_email, updates
+                )
+                logger.debug("Saved extracted info to database: %s", updates)
+            except Exception:
+                logger.exception("Error saving extracted info for %s", user_email)
+                profile = await run_in_thread(get_onboarding_profile, user_email)
+            # Write-through: the profile just read back is the fresh one
+            await _cache_onboarding_profile(user_email, profile)
+        else:
+            profile = await _cached_onboarding_profile(user_email)
+        if not profile:
             return {"success": False, "message": "User not found", "missing_fields": []}
         
-        # Define all possible onboarding fields
-        onboarding_fields = [
-            "age", "dietary_restrictions", "cuisine_preferences", 
-            "price_range", "is_tourist", "cultural_background", 
-            "food_allergies", "spice_tolerance", "preferred_languages", "phone"
-        ]
-        
         # Get current user state
         current_state = {
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "username": user.username,
-            "phone": user.phone,
-            "age": user.age,
-            "dietary_restrictions": user.dietary_restrictions or [],
-            "cuisine_preferences": user.cuisine_preferences or [],
-            "price_range": user.price_range,
-            "is_tourist": user.is_tourist,
-            "cultural_background": user.cultural_background or [],
-            "food_allergies": user.food_allergies or [],
-            "spice_tolerance": user.spice_tolerance,
-            "preferred_languages": user.preferred_languages or ["en"],
-            "is_onboarded": user.is_onboarded
+            **profile,
+            "dietary_restrictions": profile.get("dietary_restrictions") or [],
+            "cuisine_preferences": profile.get("cuisine_preferences") or [],
+            "cultural_background": profile.get("cultural_background") or [],
+            "food_allergies": profile.get("food_allergies") or [],
+            "preferred_languages": profile.get("preferred_languages") or ["en"],
         }
         
-        # Identify missing fields
-        missing_fields = []
-        for field in onboarding_fields:
-            value = current_state.get(field)
-            # Consider field filled if it has a value, including ["none"]
-            if value is None or (isinstance(value, list) and len(value) == 0):
-                missing_fields.append(field)
-            # If the field is ["none"], it's considered filled (user said no)
-            elif isinstance(value, list) and value == ["none"]:
-                continue  # Field is filled with "none" response
+        # Identify missing fields. A field is filled if it has a value,
+        # including ["none"] (the user explicitly said no).
+        missing_fields = [
+            field
+            for field in _ONBOARDING_STATE_FIELDS
+            if current_state.get(field) in UNANSWERED
+        ]
         
-        print(f"DEBUG - Current state for {user_email}: {current_state}")
-        print(f"DEBUG - Missing fields for {user_email}: {missing_fields}")
+        logger.debug("Current state for %s: %s", user_email, current_state)
+        logger.debug("Missing fields for %s: %s", user_email, missing_fields)
         
         return {
             "success": True,
             "current_state": current_state,
             "missing_fields": missing_fields,
-            "is_onboarded": user.is_onboarded,
-            "completion_percentage": ((len(onboarding_fields) - len(missing_fields)) / len(onboarding_fields)) * 100
+            "is_onboarded": profile.get("is_onboarded"),
+            "completion_percentage": (_ONBOARDING_STATE_TOTAL - len(missing_fields)) * _ONBOARDING_STATE_PCT_PER_FIELD
         }
         
     except Exception as e:
         return {"success": False, "message": str(e), "missing_fields": []}
 
 
-def generate_contextual_onboarding_question(missing_field: str, current_state: Dict[str, Any]) -> str:
+# Built once at import; only the three placeholders vary per call.
+_CONTEXT_QUESTION_PROMPT = """You are a friendly onboarding assistant. Based on the user's current information: {current_state}
+
+Generate a personalized, conversational question to ask about their {field}.
+Make it feel natural and contextual based on what you already know about them.
+
+Base question: {base_question}
+
+Requirements:
+- Make it personal but not intrusive
+- Keep it concise and conversational
+- Return ONLY the final question, with no reasoning or <think> tags
+"""
+
+
+async def generate_contextual_onboarding_question(missing_field: str, current_state: Dict[str, Any]) -> str:
     """
     Generate a contextual, intelligent onboarding question based on the missing field and current user state.
     Args:
@@ -655,25 +778,13 @@ def generate_contextual_onboarding_question(missing_field: str, current_state: D
     # Use AI to make it more contextual if we have enough user information
     if len(current_state) > 3:  # If we have some context
         try:
-            context_prompt = f"""
-            You are a friendly onboarding assistant. Based on the user's current information: {current_state}
-            
-            Generate a personalized, conversational question to ask about their {missing_field.replace('_', ' ')}.
-            Make it feel natural and contextual based on what you already know about them.
-            
-            Base question: {base_question}
-            
-            Requirements:
-            - Make it personal but not intrusive
-            - Keep it concise and conversational
-            - Return ONLY the final question
-            - Do not include any reasoning, thinking, or additional text
-            - Do not use <think> tags or similar formatting
-            
-            Respond with just the question:
-            """
-            
-            response = llm_qwen.invoke(context_prompt)
+            context_prompt = _CONTEXT_QUESTION_PROMPT.format(
+                current_state=current_state,
+                field=missing_field.replace("_", " "),
+                base_question=base_question,
+            )
+
+            response = await llm_qwen.ainvoke(context_prompt)
             # Filter out thinking tokens
             filtered_response = filter_thinking_tokens(response.content)
             return filtered_response.strip()
@@ -685,6 +796,21 @@ def generate_contextual_onboarding_question(missing_field: str, current_state: D
     return base_question
 
 
+_ONBOARDING_PROFILE_FIELDS = frozenset((
+    "username",
+    "phone",
+    "age",
+    "dietary_restrictions",
+    "cuisine_preferences",
+    "price_range",
+    "is_tourist",
+    "cultural_background",
+    "food_allergies",
+    "spice_tolerance",
+    "preferred_languages",
+))
+
+
 async def save_user_to_graph_db(user_info: Dict[str, Any]) -> Dict[str, Any]:
     """
     Save the onboarded user to the graph database.
@@ -694,36 +820,26 @@ async def save_user_to_graph_db(user_info: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with success status and message
     """
     try:
-        from src.app.models.user import User
-
         # Find the user by email (assuming email is always present)
         email = user_info.get("email")
         if not email:
             return {"success": False, "message": "Email is required to save user"}
 
-        user = User.nodes.filter(email=email).first()
-        if not user:
+        # Update user with onboarding information and mark them onboarded,
+        # as a single MATCH ... SET u += $props. Fields absent from
+        # `user_info` are left untouched.
+        props = {
+            field: user_info[field]
+            for field in user_info.keys() & _ONBOARDING_PROFILE_FIELDS
+        }
+        props["is_onboarded"] = True
+        try:
+            updated = await run_in_thread(update_user_by_email, email, props)
+        finally:
+            await _forget_onboarding_profile(email)
+        if not updated:
             return {"success": False, "message": "User not found"}
 
-        # Update user with onboarding information
-        user.username = user_info.get("username", user.username)
-        user.phone = user_info.get("phone", user.phone)
-        user.age = user_info.get("age", user.age)
-        user.dietary_restrictions = user_info.get("dietary_restrictions", user.dietary_restrictions)
-        user.cuisine_preferences = user_info.get("cuisine_preferences", user.cuisine_preferences)
-        user.price_range = user_info.get("price_range", user.price_range)
-        user.is_tourist = user_info.get("is_tourist", user.is_tourist)
-        user.cultural_background = user_info.get("cultural_background", user.cultural_background)
-        user.food_allergies = user_info.get("food_allergies", user.food_allergies)
-        user.spice_tolerance = user_info.get("spice_tolerance", user.spice_tolerance)
-        user.preferred_languages = user_info.get("preferred_languages", user.preferred_languages)
-
-        # Mark user as onboarded
-        user.is_onboarded = True
-
-        # Save to database
-        user.save()
-
         return {"success": True, "message": "User onboarding completed and saved to graph DB"}
     except Exception as e:
         return {"success": False, "message": str(e)}
@@ -5,7 +5,7 @@ Role:
 * **Owns the ``UserContextSnapshot`` shape**: every other agent obtains
   user context by calling ``profile_service.get_user_context(user_id, intent)``
   rather than poking at Neo4j or Graphiti directly.
-* Wraps a tiny LangGraph (``load_profile -> load_graph -> snapshot``) so
+* Wraps a tiny LangGraph (``load_profile -> snapshot``) so
   it follows the BaseAgent pattern and works with the shared
   ``AsyncRedisSaver`` checkpointer.
 
@@ -10,21 +10,23 @@ chassis other agents use.
 
 Nodes:
 
-* ``load_profile`` — pull canonical fields from Neo4j ``User``.
-* ``load_graph``   — pull intent-relevant ContextBundle from Graphiti.
+* ``load_profile`` — pull canonical fields from Neo4j ``User`` and the
+                     intent-relevant ContextBundle from Graphiti. The two
+                     reads are independent, so they run concurrently.
 * ``snapshot``     — merge the two layers into a ``UserContextSnapshot``,
                      stash it on state as a dict.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
 from langgraph.graph import END, StateGraph
 
 from src.app.core.database import run_in_thread
-from src.app.models.user import User
+from src.app.models.user import get_user_by_uid
 from src.app.services.graphiti import retriever
 from src.app.services.graphiti.entity_types import RELEVANT_BY_INTENT
 
@@ -38,42 +40,44 @@ logger = logging.getLogger(__name__)
 
 
 async def load_profile_node(state: ProfileAgentState) -> ProfileAgentState:
-    """Fetch the User neomodel node off the event loop."""
+    """Fetch the User node and the Graphiti context concurrently."""
     user_id = state.get("user_id")
     if not user_id:
+        state["retrieved_context"] = {}
         return state
 
-    try:
-        user = await run_in_thread(User.nodes.filter(uid=user_id).first)
-    except Exception:
-        logger.exception("profile_agent.load_profile failed for user_id=%s", user_id)
-        user = None
+    intent = state.get("intent") or "profile"
+    user, graph_context = await asyncio.gather(
+        _fetch_user(user_id), _fetch_graph_context(user_id, intent)
+    )
 
     # Stash the live neomodel object on state for the snapshot node;
     # the underscore prefix flags it as transient (snapshot_node strips
     # it before letting state be checkpointed).
     state["_user_node"] = user  # type: ignore[typeddict-item]
+    state["retrieved_context"] = graph_context
     return state
 
 
-async def load_graph_node(state: ProfileAgentState) -> ProfileAgentState:
-    """Pull intent-relevant Graphiti facts."""
-    user_id = state.get("user_id")
-    if not user_id:
-        state["retrieved_context"] = {}
-        return state
+async def _fetch_user(user_id: str):
+    """Load the User neomodel node off the event loop (None on failure)."""
+    try:
+        return await run_in_thread(get_user_by_uid, user_id)
+    except Exception:
+        logger.exception("profile_agent.load_profile failed for user_id=%s", user_id)
+        return None
 
-    intent = state.get("intent") or "profile"
-    kinds = RELEVANT_BY_INTENT.get(intent)
 
+async def _fetch_graph_context(user_id: str, intent: str) -> dict:
+    """Pull intent-relevant Graphiti facts."""
     bundle = await retriever.get_relevant_context(
         user_id=user_id,
         query=_query_for_intent(intent),
-        kinds=kinds,
+        kinds=RELEVANT_BY_INTENT.get(intent),
         intent=intent,
+        cache=True,
     )
-    state["retrieved_context"] = bundle.to_dict()
-    return state
+    return bundle.to_dict()
 
 
 async def snapshot_node(state: ProfileAgentState) -> ProfileAgentState:
@@ -115,13 +119,11 @@ def compose_workflow(
         leaf_target: where ``snapshot`` should route to. Defaults to ``END``.
     """
     workflow.add_node("load_profile", load_profile_node)
-    workflow.add_node("load_graph", load_graph_node)
     workflow.add_node("snapshot", snapshot_node)
 
     if set_entry:
         workflow.set_entry_point("load_profile")
-    workflow.add_edge("load_profile", "load_graph")
-    workflow.add_edge("load_graph", "snapshot")
+    workflow.add_edge("load_profile", "snapshot")
     workflow.add_edge("snapshot", leaf_target or END)
 
 
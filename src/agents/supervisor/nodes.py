@@ -22,7 +22,7 @@ from typing import Optional
 
 from src.agents.base.collaboration import MAX_HANDOFFS_PER_TURN
 from src.app.core.database import run_in_thread
-from src.app.models.user import User
+from src.app.models.user import get_user_by_uid
 from src.app.services.llm_gateway import gateway
 
 from .intents import MIN_CONFIDENCE, IntentChoice, build_intent_prompt
@@ -60,7 +60,7 @@ async def onboarding_gate_node(state: SupervisorState) -> SupervisorState:
         return state
 
     try:
-        user = await run_in_thread(User.nodes.filter(uid=user_id).first)
+        user = await run_in_thread(get_user_by_uid, user_id)
     except Exception:
         logger.exception("supervisor.onboarding_gate user lookup failed")
         user = None
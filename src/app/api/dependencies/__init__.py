@@ -4,5 +4,11 @@ FastAPI dependency injection utilities
 """
 
 from .auth import get_current_user, get_current_session, AuthenticationRequired
+from .database import get_neo4j_session
 
-__all__ = ["get_current_user", "get_current_session", "AuthenticationRequired"]
+__all__ = [
+    "get_current_user",
+    "get_current_session",
+    "AuthenticationRequired",
+    "get_neo4j_session",
+]
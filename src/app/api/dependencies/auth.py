@@ -6,12 +6,12 @@ FastAPI dependency injection for authentication
 import logging
 from typing import Any, Dict, Optional, Tuple
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.app.core.database import run_in_thread
 from src.app.core.security import security_manager
-from src.app.models.user import User
+from src.app.models.user import User, get_user_by_uid
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +26,23 @@ def _unauthorized(detail: str = "Could not validate credentials") -> HTTPExcepti
     )
 
 
-async def _resolve_user_from_token(token: str) -> User:
+async def _resolve_user_from_token(
+    token: str, request: Request
+) -> Tuple[User, Dict[str, Any]]:
     """Verify a JWT and load the matching User from Neo4j (off the event loop).
 
     `neomodel` is sync; we push the lookup into a thread so a slow Neo4j
     response doesn't stall every other in-flight async request on the
-    same worker.
+    same worker. Returns the user together with the verified payload.
+
+    The result is memoized on ``request.state`` for the rest of the
+    request, so several auth dependencies on one route verify once; it
+    also exposes ``request.state.user`` to the rate limiter.
     """
+    resolved = getattr(request.state, "auth", None)
+    if resolved is not None and resolved[0] == token:
+        return resolved[1], resolved[2]
+
     payload = await security_manager.verify_token(token)
     if not payload:
         raise _unauthorized()
@@ -41,30 +51,35 @@ async def _resolve_user_from_token(token: str) -> User:
     if not user_id:
         raise _unauthorized()
 
-    user = await run_in_thread(User.nodes.filter(uid=user_id).first)
+    user = await run_in_thread(get_user_by_uid, user_id)
     if not user:
         raise _unauthorized("User not found")
-    return user
+    request.state.auth = (token, user, payload)
+    request.state.user = user
+    return user, payload
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> User:
     """Resolve the authenticated user from the bearer token."""
     token = credentials.credentials
-    user = await _resolve_user_from_token(token)
+    user, _ = await _resolve_user_from_token(token, request)
     # Stash the token on the user object so /logout can blacklist it.
     user._current_token = token
     return user
 
 
 async def get_current_user_with_token(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> Tuple[User, str]:
-    """Same as `get_current_user` but also returns the raw token."""
+) -> Tuple[User, str, Dict[str, Any]]:
+    """Same as `get_current_user` but also returns the raw token and its
+    verified payload, so callers (e.g. /logout) don't decode it again."""
     token = credentials.credentials
-    user = await _resolve_user_from_token(token)
-    return user, token
+    user, payload = await _resolve_user_from_token(token, request)
+    return user, token, payload
 
 
 async def get_current_session(session_id: str) -> Dict[str, Any]:
@@ -0,0 +1,20 @@
+"""
+Database Dependencies
+FastAPI dependency injection for raw Neo4j access
+"""
+
+from typing import AsyncIterator
+
+from neo4j import AsyncSession
+
+from src.app.core.database import neo4j_db
+
+
+async def get_neo4j_session() -> AsyncIterator[AsyncSession]:
+    """Yield a pooled async Neo4j session for the request, closed afterwards.
+
+    For routes that need Cypher neomodel can't express; everything else
+    should keep going through neomodel.
+    """
+    async with neo4j_db.session() as session:
+        yield session
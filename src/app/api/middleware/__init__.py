@@ -4,7 +4,8 @@ FastAPI middleware components
 """
 
 from .cors import add_cors_middleware, CustomCORSMiddleware
-from .logging import LoggingMiddleware
+from .logging import LoggingMiddleware, RequestContextMiddleware
+from .profiling import ProfilingMiddleware
 from .rate_limit import (
     RateLimit,
     auth_login_limiter,
@@ -15,6 +16,8 @@ __all__ = [
     "add_cors_middleware",
     "CustomCORSMiddleware",
     "LoggingMiddleware",
+    "RequestContextMiddleware",
+    "ProfilingMiddleware",
     "RateLimit",
     "auth_login_limiter",
     "auth_register_limiter",
@@ -0,0 +1,57 @@
+"""
+Profiling Middleware
+Per-request pyinstrument call-stack reports, gated by `?profile=1`
+"""
+
+import logging
+from urllib.parse import parse_qs
+
+from starlette.responses import HTMLResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """
+    Profile a single HTTP request when its query string has `profile=1`.
+
+    The wrapped response is discarded and replaced with pyinstrument's
+    HTML report, so time spent in FastAPI itself (validation, dependency
+    resolution, serialization) shows up next to the route's own awaits.
+    Only registered when ``settings.PROFILING`` is on: the profiler
+    samples the whole process, so concurrent requests bleed into each
+    other's reports, and it must never be reachable in production.
+    """
+
+    def __init__(self, app, interval: float = 0.001):
+        # pyinstrument is a dev-only tool; import it only when enabled.
+        from pyinstrument import Profiler
+
+        self.app = app
+        self.interval = interval
+        self._profiler_cls = Profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        async def discard(message):
+            pass
+
+        profiler = self._profiler_cls(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        logger.info("profiled %s %s", scope["method"], scope["path"])
+        await HTMLResponse(profiler.output_html())(scope, receive, send)
+
+
+def _wants_profile(scope) -> bool:
+    query = scope.get("query_string", b"")
+    if b"profile" not in query:
+        return False
+    return parse_qs(query.decode("latin-1")).get("profile") == ["1"]
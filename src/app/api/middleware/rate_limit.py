@@ -61,7 +61,7 @@ class RateLimit:
         client_id = self._client_id(request)
         redis_key = f"ratelimit:{self.key_prefix}:{client_id}"
 
-        client = redis_cache.redis_client
+        client = redis_cache.client
         if client is None:
             self._handle_redis_unavailable(redis_key)
             return
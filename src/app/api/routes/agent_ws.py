@@ -21,13 +21,16 @@ Flow per turn:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
-import uuid
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from secrets import token_hex
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
+import orjson
 from fastapi import (
     APIRouter,
     WebSocket,
@@ -39,10 +42,13 @@ from fastapi import (
 from src.agents.onboarding_agent.tools import transcribe_audio
 from src.agents.supervisor import get_supervisor_graph
 from src.agents.supervisor.state import SupervisorState
-from src.app.api.routes.auth import security_manager
+from src.app.core.security import security_manager
 from src.app.core.config import settings
 from src.app.core.database import run_in_thread
-from src.app.models.user import User
+from src.app.core.http import get_http_session
+from src.app.core.user_cache import user_cache
+from src.app.models.user import User, get_user_by_uid
+from src.app.utils.clock import utc_timestamp
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -55,6 +61,11 @@ async def get_current_user_from_token(
     websocket: WebSocket,
     token: Optional[str] = None,
 ) -> User:
+    """Resolve the User from the ``?token=`` query param (or `token`).
+
+    Shared with the legacy ``/ws/onboarding`` handler. Raises
+    ``WebSocketException`` (policy violation) on any auth failure.
+    """
     if token is None:
         token = websocket.query_params.get("token")
     if not token:
@@ -69,9 +80,15 @@ async def get_current_user_from_token(
         user_id = token_data.get("sub")
         if not user_id:
             raise Exception("Invalid token payload")
-        user = await run_in_thread(User.nodes.filter(uid=user_id).first)
-        if not user:
-            raise Exception("User not found")
+        # Reconnects within the cache TTL skip Neo4j entirely. On a miss,
+        # neomodel is sync; push to a thread so the WS event loop isn't
+        # blocked while Neo4j answers.
+        user = user_cache.get(user_id)
+        if user is None:
+            user = await run_in_thread(get_user_by_uid, user_id)
+            if not user:
+                raise Exception("User not found")
+            user_cache.put(user)
         return user
     except Exception as e:
         raise WebSocketException(
@@ -81,45 +98,193 @@ async def get_current_user_from_token(
 
 # ------------------------------------------------------- audio download
 
+# Large reads so multi-MB voice samples take a handful of socket reads
+# instead of hundreds of 64 KiB ones.
+_AUDIO_CHUNK_BYTES = 1 << 20
+
+
+# Recently downloaded clips, keyed by a blake2b digest of the URL, so a
+# client retrying a failed turn with the same ``audioUrl`` skips the
+# re-download. LRU, bounded by both entry count and total bytes. Entries
+# expire after a short TTL so audio re-uploaded to the same URL is picked
+# up; expired entries are dropped lazily on lookup.
+_AUDIO_CACHE_MAX_ITEMS = 32
+_AUDIO_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_AUDIO_CACHE_TTL_SECONDS = 60.0
+_audio_cache: "OrderedDict[bytes, Tuple[float, bytes]]" = OrderedDict()
+_audio_cache_bytes = 0
+
+
+def _audio_cache_key(audio_url: str) -> bytes:
+    return hashlib.blake2b(audio_url.encode(), digest_size=16).digest()
 
-async def _download_audio(audio_url: str) -> bytes:
-    """Bounded async download — same shape as the onboarding WS handler."""
+
+def _cached_audio(key: bytes) -> Optional[bytes]:
+    global _audio_cache_bytes
+    entry = _audio_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, data = entry
+    if time.monotonic() >= expires_at:
+        del _audio_cache[key]
+        _audio_cache_bytes -= len(data)
+        return None
+    _audio_cache.move_to_end(key)
+    return data
+
+
+def _remember_audio(key: bytes, data: bytes) -> None:
+    global _audio_cache_bytes
+    if len(data) > _AUDIO_CACHE_MAX_BYTES:
+        return
+    old = _audio_cache.pop(key, None)
+    if old is not None:
+        _audio_cache_bytes -= len(old[1])
+    _audio_cache[key] = (time.monotonic() + _AUDIO_CACHE_TTL_SECONDS, data)
+    _audio_cache_bytes += len(data)
+    while (
+        len(_audio_cache) > _AUDIO_CACHE_MAX_ITEMS
+        or _audio_cache_bytes > _AUDIO_CACHE_MAX_BYTES
+    ):
+        _, (_, evicted) = _audio_cache.popitem(last=False)
+        _audio_cache_bytes -= len(evicted)
+
+
+def clear_audio_cache() -> None:
+    global _audio_cache_bytes
+    _audio_cache.clear()
+    _audio_cache_bytes = 0
+
+
+async def download_audio_from_url(audio_url: str) -> bytes:
+    """Download audio non-blockingly with a size guard.
+
+    Uses the shared pooled session, so repeat fetches from the same
+    storage host skip the TCP/TLS handshake, and serves recently fetched
+    URLs from an in-process LRU. Shared with the legacy ``/ws/onboarding``
+    handler.
+    """
+    key = _audio_cache_key(audio_url)
+    data = _cached_audio(key)
+    if data is not None:
+        return data
+    data = await _fetch_audio(audio_url)
+    _remember_audio(key, data)
+    return data
+
+
+async def _fetch_audio(audio_url: str) -> bytes:
     max_bytes = settings.MAX_AUDIO_FILE_SIZE_MB * 1024 * 1024
     timeout = aiohttp.ClientTimeout(total=settings.AUDIO_PROCESSING_TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.get(audio_url) as response:
+    try:
+        async with get_http_session().get(audio_url, timeout=timeout) as response:
             response.raise_for_status()
+            too_large = ValueError(
+                f"Audio exceeds {settings.MAX_AUDIO_FILE_SIZE_MB} MB limit"
+            )
+            chunks = response.content.iter_chunked(_AUDIO_CHUNK_BYTES)
+
+            # Content-Length counts encoded bytes; aiohttp hands us the
+            # decompressed body, so only trust it for identity encoding.
+            length = response.content_length
+            if length is not None and "Content-Encoding" not in response.headers:
+                # Known size: reject early, then fill one preallocated
+                # buffer in place instead of growing it chunk by chunk.
+                if length > max_bytes:
+                    raise too_large
+                buffer = bytearray(length)
+                view = memoryview(buffer)
+                offset = 0
+                async for chunk in chunks:
+                    end = offset + len(chunk)
+                    if end > length:
+                        raise ValueError("Audio body longer than Content-Length")
+                    view[offset:end] = chunk
+                    offset = end
+                if offset != length:
+                    raise ValueError("Audio body shorter than Content-Length")
+                return bytes(buffer)
+
             buffer = bytearray()
-            async for chunk in response.content.iter_chunked(64 * 1024):
+            async for chunk in chunks:
                 buffer.extend(chunk)
                 if len(buffer) > max_bytes:
-                    raise ValueError(
-                        f"Audio exceeds {settings.MAX_AUDIO_FILE_SIZE_MB} MB limit"
-                    )
+                    raise too_large
             return bytes(buffer)
+    except Exception as e:
+        raise Exception(f"Failed to download audio: {e}") from e
+
+
+# ------------------------------------------------------ inbound frames
+
+
+async def _audio_turn_text(payload: Dict[str, Any]) -> Optional[str]:
+    audio_url = payload.get("audioUrl")
+    if not audio_url:
+        raise ValueError("user_audio frame missing audioUrl")
+    audio_bytes = await download_audio_from_url(audio_url)
+    transcript_obj = await transcribe_audio(audio_bytes)
+    return (
+        transcript_obj
+        if isinstance(transcript_obj, str)
+        else transcript_obj.get("text", "")
+    )
+
+
+async def _message_turn_text(payload: Dict[str, Any]) -> Optional[str]:
+    return (payload.get("text") or "").strip() or None
+
+
+# Frame type -> coroutine returning the user's text for the turn, or None
+# when there is nothing to process. Shared with ``/ws/onboarding``.
+TURN_TEXT_READERS = {
+    "user_audio": _audio_turn_text,
+    "user_message": _message_turn_text,
+}
 
 
 # --------------------------------------------------------- send helpers
 
 
+async def send_frame(websocket: WebSocket, frame: Dict[str, Any]) -> None:
+    """Send ``frame`` as a JSON text frame, encoded with orjson.
+
+    Shared with the legacy ``/ws/onboarding`` handler. Text (not binary)
+    frames, so browser clients keep receiving strings.
+    """
+    await websocket.send_text(orjson.dumps(frame).decode())
+
+
 async def _send_agent_message(websocket: WebSocket, text: str) -> None:
-    await websocket.send_json(
+    await send_frame(
+        websocket,
         {
             "type": "agent_message",
             "payload": {
-                "id": str(uuid.uuid4()),
+                "id": token_hex(16),
                 "sender": "agent",
                 "text": text,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
             },
         }
     )
 
 
+def _encode_error(message: str) -> str:
+    return orjson.dumps({"type": "error", "payload": {"message": message}}).decode()
+
+
+# Error frames whose text never varies, encoded once at import.
+_INVALID_JSON = "Invalid JSON frame"
+_TURN_FAILED = "Internal error processing your message."
+_STATIC_ERROR_FRAMES = {
+    message: _encode_error(message) for message in (_INVALID_JSON, _TURN_FAILED)
+}
+
+
 async def _send_error(websocket: WebSocket, message: str) -> None:
-    await websocket.send_json(
-        {"type": "error", "payload": {"message": message}}
-    )
+    frame = _STATIC_ERROR_FRAMES.get(message)
+    await websocket.send_text(frame if frame is not None else _encode_error(message))
 
 
 async def _send_intent(websocket: WebSocket, intent: Optional[str]) -> None:
@@ -127,7 +292,8 @@ async def _send_intent(websocket: WebSocket, intent: Optional[str]) -> None:
     to render which specialist is responding."""
     if not intent:
         return
-    await websocket.send_json(
+    await send_frame(
+        websocket,
         {"type": "agent_intent", "payload": {"intent": intent}}
     )
 
@@ -163,7 +329,7 @@ async def _process_turn(
         final_state: Dict[str, Any] = await graph.ainvoke(initial, config=config)
     except Exception:
         logger.exception("supervisor.ainvoke failed for user=%s", user.uid)
-        await _send_error(websocket, "Internal error processing your message.")
+        await _send_error(websocket, _TURN_FAILED)
         return
 
     await _send_intent(websocket, final_state.get("intent"))
@@ -200,43 +366,36 @@ async def agent_ws(websocket: WebSocket) -> None:
 
     try:
         while True:
+            # Yield once per frame: receive_text returns already-buffered
+            # frames without suspending, so a bursting client could
+            # otherwise starve every other connection on this worker.
+            await asyncio.sleep(0)
             raw = await websocket.receive_text()
             try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
-                await _send_error(websocket, "Invalid JSON frame")
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                await _send_error(websocket, _INVALID_JSON)
                 continue
 
             msg_type = data.get("type")
             payload = data.get("payload", {})
 
-            try:
-                if msg_type == "user_audio":
-                    audio_url = payload.get("audioUrl")
-                    if not audio_url:
-                        raise ValueError("user_audio frame missing audioUrl")
-                    audio_bytes = await _download_audio(audio_url)
-                    transcript_obj = await transcribe_audio(audio_bytes)
-                    transcript = (
-                        transcript_obj
-                        if isinstance(transcript_obj, str)
-                        else transcript_obj.get("text", "")
-                    )
-                    await _process_turn(
-                        websocket=websocket, user=user, user_text=transcript
-                    )
+            read_turn_text = TURN_TEXT_READERS.get(msg_type)
+            if read_turn_text is None:
+                logger.debug("unknown WS frame type: %s", msg_type)
+                continue
 
-                elif msg_type == "user_message":
-                    text = (payload.get("text") or "").strip()
-                    if not text:
-                        continue
+            try:
+                user_text = await read_turn_text(payload)
+                if user_text is not None:
                     await _process_turn(
-                        websocket=websocket, user=user, user_text=text
+                        websocket=websocket, user=user, user_text=user_text
                     )
 
-                else:
-                    logger.debug("unknown WS frame type: %s", msg_type)
-
+            except WebSocketDisconnect:
+                # The client went away mid-turn; there is no one left to
+                # send an error frame to.
+                raise
             except Exception as e:
                 logger.exception("error handling /ws/agent turn")
                 await _send_error(websocket, f"Error: {e}")
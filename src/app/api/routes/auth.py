@@ -3,25 +3,23 @@ Auth API Routes
 Handles user registration and authentication
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Header, Request
-from pydantic import BaseModel, EmailStr, Field
-from typing import Dict, Any
-from src.app.models.user import User
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Header, Request
+from pydantic import AliasChoices, BaseModel, ConfigDict, EmailStr, Field
+from typing import Dict, Any, Optional
+from src.app.models.user import User, get_user_by_email
 from src.app.core.security import security_manager
+from src.app.core.jwt_cache import invalidate_token
 from src.app.api.dependencies.auth import get_current_user, get_current_user_with_token
 from src.app.api.middleware.rate_limit import (
     auth_login_limiter,
     auth_register_limiter,
 )
 from src.app.services.memory_service import memory_service
-from neomodel import db
-from src.app.core.database import redis_cache
-import jwt
-from src.app.core.config import settings
+from src.app.core.database import redis_cache, run_in_thread
 from datetime import datetime
 import logging
-import traceback
-from neomodel.exceptions import DoesNotExist
+import time
+from neomodel.exceptions import DoesNotExist, UniqueProperty
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -48,49 +46,73 @@ class LoginRequest(BaseModel):
     password: str
 
 
+class UserOut(BaseModel):
+    """Public view of a User for /auth/me, built straight from the node."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    uid: str
+    email: str
+    first_name: str
+    last_name: str
+    username: Optional[str] = None
+    onboarding_completed: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("is_onboarded", "onboarding_completed"),
+    )
+    health_profile_verified: bool = False  # TODO: implement health profile verification
+    created_at: Optional[datetime] = None
+
+
 @router.post(
     "/register",
     response_model=AuthResponse,
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(auth_register_limiter)],
 )
-async def register_user(request: RegisterRequest, http_request: Request):
+async def register_user(
+    request: RegisterRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+):
     try:
-        logger.info(f"Registration attempt for email: {request.email}")
-
-        # Check if user exists
-        if User.nodes.filter(email=request.email).all():
-            logger.warning(f"Registration failed: Email already exists: {request.email}")
-            raise HTTPException(status_code=400, detail="Email already registered")
-
-        if request.username and User.nodes.filter(username=request.username).all():
-            logger.warning(f"Registration failed: Username already taken: {request.username}")
-            raise HTTPException(status_code=400, detail="Username already taken")
+        logger.info("Registration attempt for email: %s", request.email)
 
         # Hash password
-        password_hash = security_manager.hash_password(request.password)
-
-        # Create user
-        user = User(
-            email=request.email,
-            password_hash=password_hash,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            username=request.username,
-            is_onboarded=False,  # Explicitly set onboarding status
-        ).save()
+        password_hash = await security_manager.hash_password_async(request.password)
+
+        # Create user. Uniqueness of email/username is enforced by the
+        # Neo4j constraints created at startup, so there's no pre-check
+        # (and no check-then-create race); a duplicate surfaces here.
+        try:
+            user = User(
+                email=request.email,
+                password_hash=password_hash,
+                first_name=request.first_name,
+                last_name=request.last_name,
+                username=request.username,
+                is_onboarded=False,  # Explicitly set onboarding status
+            ).save()
+        except UniqueProperty as e:
+            if "`username`" in str(e):
+                logger.warning("Registration failed: Username already taken: %s", request.username)
+                raise HTTPException(status_code=400, detail="Username already taken")
+            logger.warning("Registration failed: Email already exists: %s", request.email)
+            raise HTTPException(status_code=400, detail="Email already registered")
 
         # Generate JWT
         token = security_manager.create_access_token({
             "sub": user.uid, 
             "email": user.email,
-            "isOnboarded": getattr(user, "is_onboarded", False)
+            "isOnboarded": user.is_onboarded,
+            "ver": user.token_version or 0,
         })
 
-        # Store registration in memory
-        await memory_service.store_user_registration(user)
+        # Store registration in memory once the response is sent; the
+        # Graphiti write doesn't affect it and logs its own failures
+        background_tasks.add_task(memory_service.store_user_registration, user)
 
-        logger.info(f"User registered successfully: {user.email}")
+        logger.info("User registered successfully: %s", user.email)
 
         return AuthResponse(
             status="success",
@@ -102,15 +124,15 @@ async def register_user(request: RegisterRequest, http_request: Request):
                     "first_name": user.first_name,
                     "last_name": user.last_name,
                     "username": user.username,
-                    "isOnboarded": getattr(user, "is_onboarded", False),
+                    "isOnboarded": user.is_onboarded,
                 },
                 "access_token": token,
             },
         )
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Registration error for {request.email}: {str(e)}\n{traceback.format_exc()}")
+    except Exception:
+        logger.exception("Registration error for %s", request.email)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during registration"
@@ -122,42 +144,57 @@ async def register_user(request: RegisterRequest, http_request: Request):
     response_model=AuthResponse,
     dependencies=[Depends(auth_login_limiter)],
 )
-async def login_user(request: LoginRequest, http_request: Request):
+async def login_user(
+    request: LoginRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+):
     try:
-        logger.info(f"Login attempt for email: {request.email}")
+        logger.info("Login attempt for email: %s", request.email)
 
         try:
-            user = User.nodes.filter(email=request.email).first()
+            user = await run_in_thread(get_user_by_email, request.email)
             if not user:
-                logger.warning(f"Login failed: User not found: {request.email}")
+                logger.warning("Login failed: User not found: %s", request.email)
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password"
                 )
         except DoesNotExist:
-            logger.warning(f"Login failed: User not found: {request.email}")
+            logger.warning("Login failed: User not found: %s", request.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
 
-        if not security_manager.verify_password(request.password, user.password_hash):
-            logger.warning(f"Login failed: Invalid password for user: {request.email}")
+        if not await security_manager.verify_password_async(request.password, user.password_hash):
+            logger.warning("Login failed: Invalid password for user: %s", request.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
 
+        # Transparently upgrade hashes made with older Argon2 parameters.
+        if security_manager.needs_rehash(user.password_hash):
+            try:
+                user.password_hash = await security_manager.hash_password_async(
+                    request.password
+                )
+                await run_in_thread(user.save)
+            except Exception:
+                logger.exception("Password rehash failed for %s", request.email)
+
         token = security_manager.create_access_token({
             "sub": user.uid, 
             "email": user.email,
-            "isOnboarded": getattr(user, "is_onboarded", False)
+            "isOnboarded": user.is_onboarded,
+            "ver": user.token_version or 0,
         })
 
-        # Store login in memory
-        await memory_service.store_user_login(user)
+        # Store login in memory (after the response, as on register)
+        background_tasks.add_task(memory_service.store_user_login, user)
 
-        logger.info(f"User logged in successfully: {user.email}")
+        logger.info("User logged in successfully: %s", user.email)
 
         return AuthResponse(
             status="success",
@@ -169,15 +206,15 @@ async def login_user(request: LoginRequest, http_request: Request):
                     "first_name": user.first_name,
                     "last_name": user.last_name,
                     "username": user.username,
-                    "isOnboarded": getattr(user, "is_onboarded", False),
+                    "isOnboarded": user.is_onboarded,
                 },
                 "access_token": token,
             },
         )
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Login error for {request.email}: {str(e)}\n{traceback.format_exc()}")
+    except Exception:
+        logger.exception("Login error for %s", request.email)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during login"
@@ -187,40 +224,33 @@ async def login_user(request: LoginRequest, http_request: Request):
 @router.post("/logout", response_model=AuthResponse)
 async def logout_user(
     http_request: Request,
-    user_and_token: tuple[User, str] = Depends(get_current_user_with_token)
+    background_tasks: BackgroundTasks,
+    user_and_token: tuple[User, str, dict] = Depends(get_current_user_with_token)
 ):
     """
     Invalidate the current JWT by blacklisting it in Redis until its expiry.
     """
-    current_user, token = user_and_token
+    current_user, token, payload = user_and_token
 
     try:
-        logger.info(f"Logout attempt for user: {current_user.email}")
+        logger.info("Logout attempt for user: %s", current_user.email)
 
-        try:
-            payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-            )
-            exp = payload.get("exp")
-            if not exp:
-                logger.warning(f"Logout failed: Invalid token (no expiry) for user: {current_user.email}")
-                raise HTTPException(status_code=400, detail="Invalid token: no expiry")
+        # The dependency already verified the token, and `verify_token`
+        # decodes with `require=["exp", "sub"]`, so `exp` is guaranteed.
+        exp = payload["exp"]
 
-            ttl = int(exp - datetime.utcnow().timestamp())
-            if ttl > 0:
-                await redis_cache.set(f"blacklist:{token}", "1", ttl)
-
-        except jwt.ExpiredSignatureError:
-            logger.warning(f"Logout failed: Token expired for user: {current_user.email}")
-            raise HTTPException(status_code=401, detail="Token already expired")
-        except jwt.InvalidTokenError:
-            logger.warning(f"Logout failed: Invalid token for user: {current_user.email}")
-            raise HTTPException(status_code=401, detail="Invalid token")
+        ttl = int(exp - time.time())
+        if ttl > 0:
+            await redis_cache.set(
+                security_manager.blacklist_key(token, payload), "1", ttl
+            )
+        # Only after the blacklist entry exists, or a concurrent request
+        # could re-cache a "not blacklisted" answer.
+        invalidate_token(token)
 
-        # Store logout in memory
-        await memory_service.store_user_logout(current_user.uid)
+        background_tasks.add_task(memory_service.store_user_logout, current_user.uid)
 
-        logger.info(f"User logged out successfully: {current_user.email}")
+        logger.info("User logged out successfully: %s", current_user.email)
 
         return AuthResponse(
             status="success",
@@ -229,8 +259,41 @@ async def logout_user(
         )
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Logout error for {current_user.email}: {str(e)}\n{traceback.format_exc()}")
+    except Exception:
+        logger.exception("Logout error for %s", current_user.email)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred during logout"
+        )
+
+
+@router.post("/logout-all", response_model=AuthResponse)
+async def logout_all_sessions(
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Revoke every token issued to the current user (all devices) by bumping
+    their token version.
+    """
+    try:
+        logger.info("Logout-all attempt for user: %s", current_user.email)
+
+        version = await security_manager.revoke_all_tokens(current_user.uid)
+        if version is None:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        logger.info("All sessions revoked for user: %s", current_user.email)
+
+        return AuthResponse(
+            status="success",
+            message="Logged out of all sessions",
+            data={"user_id": current_user.uid},
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Logout-all error for %s", current_user.email)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during logout"
@@ -246,26 +309,15 @@ async def get_current_user_info(
     Get current authenticated user information
     """
     try:
-        logger.info(f"Fetching user info for: {current_user.email}")
+        logger.info("Fetching user info for: %s", current_user.email)
 
         return AuthResponse(
             status="success",
             message="User information retrieved",
-            data={
-                "user": {
-                    "uid": current_user.uid,
-                    "email": current_user.email,
-                    "first_name": current_user.first_name,
-                    "last_name": current_user.last_name,
-                    "username": current_user.username,
-                    "onboarding_completed": getattr(current_user, "is_onboarded", False),
-                    "health_profile_verified": False,  # TODO: implement health profile verification
-                    "created_at": current_user.created_at.isoformat() if current_user.created_at else None,
-                }
-            },
+            data={"user": UserOut.model_validate(current_user)},
         )
-    except Exception as e:
-        logger.error(f"Error fetching user info for {current_user.email}: {str(e)}\n{traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error fetching user info for %s", current_user.email)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while fetching user information"
@@ -14,12 +14,14 @@ the previous food.py for being open by default.
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.app.api.dependencies.auth import get_current_user
 from src.app.core.database import run_in_thread
+from src.app.models.order import get_order_for_user, list_orders_for_user
 from src.app.models.user import User
 from src.app.services.mcp_service import mcp_service
 
@@ -92,40 +94,37 @@ async def get_order(
 
 
 def _list_orders_for_user(user: User, limit: int) -> List[Dict[str, Any]]:
-    """Pull the user's connected Order nodes via neomodel."""
+    """Fetch the user's newest orders in one query."""
     try:
-        orders = list(user.orders.all())
+        return [_order_to_dict(o) for o in list_orders_for_user(user.uid, limit)]
     except Exception:
         logger.exception("food.list_orders failed for user=%s", user.uid)
         return []
-    out: List[Dict[str, Any]] = []
-    for o in orders[:limit]:
-        out.append(_order_to_dict(o))
-    return out
 
 
 def _get_order_for_user(user: User, order_id: str) -> Optional[Dict[str, Any]]:
     try:
-        for o in user.orders.all():
-            if getattr(o, "uid", None) == order_id:
-                return _order_to_dict(o)
+        order = get_order_for_user(user.uid, order_id)
     except Exception:
         logger.exception(
             "food.get_order failed for user=%s order=%s", user.uid, order_id
         )
-    return None
+        return None
+    return _order_to_dict(order) if order else None
 
 
-def _order_to_dict(order: Any) -> Dict[str, Any]:
+def _order_to_dict(order: Dict[str, Any]) -> Dict[str, Any]:
+    # neomodel stores DateTimeProperty values as epoch seconds (UTC).
+    ordered_at = order.get("order_date")
     return {
-        "uid": getattr(order, "uid", None),
-        "restaurant_name": getattr(order, "restaurant_name", None),
-        "dish_name": getattr(order, "dish_name", None),
-        "status": getattr(order, "status", None),
-        "total_amount": getattr(order, "total_amount", None),
+        "uid": order.get("order_id"),
+        "restaurant_name": order.get("restaurant_name"),
+        "dish_name": order.get("dish_name"),
+        "status": order.get("status"),
+        "total_amount": order.get("total_amount"),
         "ordered_at": (
-            order.ordered_at.isoformat()
-            if getattr(order, "ordered_at", None) is not None
+            datetime.fromtimestamp(ordered_at, tz=timezone.utc).isoformat()
+            if ordered_at is not None
             else None
         ),
     }
@@ -12,96 +12,31 @@ through Redis).
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import uuid
-from datetime import datetime
-from typing import Any, Dict, Optional
-
-import aiohttp
-from fastapi import (
-    APIRouter,
-    WebSocket,
-    WebSocketDisconnect,
-    WebSocketException,
-    status,
-)
+from secrets import token_hex
+from typing import Any, Dict
+
+import orjson
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, WebSocketException
 
 from src.agents.onboarding_agent.agent import onboarding_agent
 from src.agents.onboarding_agent.state import OnboardingAgentState
-from src.agents.onboarding_agent.tools import transcribe_audio
-from src.app.api.routes.auth import security_manager
-from src.app.core.config import settings
-from src.app.core.database import run_in_thread
+from src.agents.onboarding_agent.tools import UNANSWERED
+# Token auth, inbound turn parsing and frame encoding are shared with the
+# supervisor WS route.
+from src.app.api.routes.agent_ws import (
+    TURN_TEXT_READERS,
+    get_current_user_from_token,
+    send_frame,
+)
 from src.app.models.user import User
+from src.app.utils.clock import utc_timestamp
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-# --------------------------------------------------------------------------
-# Auth
-# --------------------------------------------------------------------------
-
-
-async def get_current_user_from_token(
-    websocket: WebSocket,
-    token: Optional[str] = None,
-) -> User:
-    if token is None:
-        token = websocket.query_params.get("token")
-    if not token:
-        raise WebSocketException(
-            code=status.WS_1008_POLICY_VIOLATION, reason="Missing token"
-        )
-
-    try:
-        token_data = await security_manager.verify_token(token)
-        if not token_data:
-            raise Exception("Invalid or expired token")
-
-        user_id = token_data.get("sub")
-        if not user_id:
-            raise Exception("Invalid token payload")
-
-        # neomodel is sync; push to a thread so the WS event loop isn't
-        # blocked while Neo4j answers.
-        user = await run_in_thread(User.nodes.filter(uid=user_id).first)
-        if not user:
-            raise Exception("User not found")
-
-        return user
-    except Exception as e:
-        raise WebSocketException(
-            code=status.WS_1008_POLICY_VIOLATION, reason=str(e)
-        )
-
-
-# --------------------------------------------------------------------------
-# Audio download (async, bounded)
-# --------------------------------------------------------------------------
-
-
-async def download_audio_from_url(audio_url: str) -> bytes:
-    """Download audio non-blockingly with a size guard."""
-    max_bytes = settings.MAX_AUDIO_FILE_SIZE_MB * 1024 * 1024
-    timeout = aiohttp.ClientTimeout(total=settings.AUDIO_PROCESSING_TIMEOUT)
-    try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(audio_url) as response:
-                response.raise_for_status()
-                buffer = bytearray()
-                async for chunk in response.content.iter_chunked(64 * 1024):
-                    buffer.extend(chunk)
-                    if len(buffer) > max_bytes:
-                        raise ValueError(
-                            f"Audio exceeds {settings.MAX_AUDIO_FILE_SIZE_MB} MB limit"
-                        )
-                return bytes(buffer)
-    except Exception as e:
-        raise Exception(f"Failed to download audio: {e}") from e
-
-
 # --------------------------------------------------------------------------
 # Frontend message envelope helpers
 # --------------------------------------------------------------------------
@@ -117,6 +52,26 @@ _STEP_TO_PROGRESS_KEY = {
 }
 
 
+# Every checklist key the frontend tracks.
+_PROGRESS_KEYS = (
+    "dietaryPreferences",
+    "restrictions",
+    "allergies",
+    "voiceSample",
+    "communityInterests",
+)
+
+# Progress frames are fully determined by (key, value); encode them all
+# once instead of per turn.
+_PROGRESS_FRAMES = {
+    (key, value): orjson.dumps(
+        {"type": "onboarding_progress", "payload": {"key": key, "value": value}}
+    ).decode()
+    for key in _PROGRESS_KEYS
+    for value in (True, False)
+}
+
+
 def map_onboarding_step_to_progress(step: str, is_complete: bool) -> Dict[str, Any]:
     return {
         "key": _STEP_TO_PROGRESS_KEY.get(step, "dietaryPreferences"),
@@ -125,45 +80,48 @@ def map_onboarding_step_to_progress(step: str, is_complete: bool) -> Dict[str, A
 
 
 async def _send_agent_message(websocket: WebSocket, text: str) -> None:
-    await websocket.send_json(
+    await send_frame(
+        websocket,
         {
             "type": "agent_message",
             "payload": {
-                "id": str(uuid.uuid4()),
+                "id": token_hex(16),
                 "sender": "agent",
                 "text": text,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
             },
         }
     )
 
 
 async def _send_progress(
-    websocket: WebSocket, step: str, is_complete: bool
+    websocket: WebSocket, emitted: Dict[str, bool], step: str, is_complete: bool
 ) -> None:
-    await websocket.send_json(
-        {
-            "type": "onboarding_progress",
-            "payload": map_onboarding_step_to_progress(step, is_complete),
-        }
-    )
+    """Send the progress frame for ``step`` unless the client already has it.
+
+    ``emitted`` is the per-connection record of the last value sent for
+    each checklist key.
+    """
+    key = _STEP_TO_PROGRESS_KEY.get(step, "dietaryPreferences")
+    value = bool(is_complete)
+    if emitted.get(key) is value:
+        return
+    emitted[key] = value
+    await websocket.send_text(_PROGRESS_FRAMES[key, value])
 
 
-async def _send_completion_progress(websocket: WebSocket) -> None:
-    """Mark every checklist key complete (sent when status flips to onboarded)."""
-    for key in (
-        "dietaryPreferences",
-        "restrictions",
-        "allergies",
-        "voiceSample",
-        "communityInterests",
-    ):
-        await websocket.send_json(
-            {
-                "type": "onboarding_progress",
-                "payload": {"key": key, "value": True},
-            }
-        )
+async def _send_completion_progress(
+    websocket: WebSocket, emitted: Dict[str, bool]
+) -> None:
+    """Mark every checklist key complete (sent when status flips to onboarded).
+
+    Keys already reported complete on this connection are skipped.
+    """
+    for key in _PROGRESS_KEYS:
+        if emitted.get(key) is True:
+            continue
+        emitted[key] = True
+        await websocket.send_text(_PROGRESS_FRAMES[key, True])
 
 
 # --------------------------------------------------------------------------
@@ -171,20 +129,28 @@ async def _send_completion_progress(websocket: WebSocket) -> None:
 # --------------------------------------------------------------------------
 
 
+_SNAPSHOT_FIELDS = (
+    "email",
+    "first_name",
+    "last_name",
+    "username",
+    "phone",
+    "age",
+    "dietary_restrictions",
+    "cuisine_preferences",
+    "price_range",
+    "is_tourist",
+)
+
+
 def _build_existing_user_snapshot(user: User) -> Dict[str, Any]:
-    """Snapshot of fields already known about the user from sign-up."""
-    return {
-        "email": user.email,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "username": getattr(user, "username", None),
-        "phone": getattr(user, "phone", None),
-        "age": getattr(user, "age", None),
-        "dietary_restrictions": getattr(user, "dietary_restrictions", []),
-        "cuisine_preferences": getattr(user, "cuisine_preferences", []),
-        "price_range": getattr(user, "price_range", None),
-        "is_tourist": getattr(user, "is_tourist", False),
-    }
+    """Snapshot of fields already known about the user from sign-up.
+
+    Only built on a thread's first turn. neomodel keeps property values in
+    the instance ``__dict__``, so read them from there in one go.
+    """
+    values = vars(user)
+    return {field: values.get(field) for field in _SNAPSHOT_FIELDS}
 
 
 async def _invoke_agent(
@@ -224,6 +190,7 @@ async def _process_user_turn(
     websocket: WebSocket,
     user: User,
     thread_id: str,
+    emitted: Dict[str, bool],
     step: str,
     user_text: str,
 ) -> None:
@@ -239,7 +206,10 @@ async def _process_user_turn(
 
     await _send_agent_message(websocket, response_text)
     await _send_progress(
-        websocket, step, is_complete=onboarding_status in ("ready", "onboarded")
+        websocket,
+        emitted,
+        step,
+        is_complete=onboarding_status in ("ready", "onboarded"),
     )
 
     if onboarding_status == "onboarded":
@@ -249,13 +219,22 @@ async def _process_user_turn(
             "Aurasense is now tailored to your preferences and ready to provide "
             "you with amazing recommendations!",
         )
-        await _send_completion_progress(websocket)
+        await _send_completion_progress(websocket, emitted)
 
 
 # --------------------------------------------------------------------------
 # WebSocket endpoint
 # --------------------------------------------------------------------------
 
+# Fields checked for the opening greeting.
+_GREETING_FIELDS = (
+    "age",
+    "dietary_restrictions",
+    "cuisine_preferences",
+    "price_range",
+    "is_tourist",
+)
+
 
 @router.websocket("/ws/onboarding")
 async def onboarding_ws(websocket: WebSocket) -> None:
@@ -265,7 +244,8 @@ async def onboarding_ws(websocket: WebSocket) -> None:
         user = await get_current_user_from_token(websocket)
     except WebSocketException as e:
         logger.warning("WS auth failed: %s", e.reason)
-        await websocket.send_json(
+        await send_frame(
+            websocket,
             {
                 "type": "error",
                 "payload": {"message": f"Authentication failed: {e.reason}"},
@@ -276,20 +256,14 @@ async def onboarding_ws(websocket: WebSocket) -> None:
 
     thread_id = onboarding_agent.thread_id_for(user.uid)
     logger.info("WS onboarding connected: user=%s thread=%s", user.email, thread_id)
+    # Last progress value sent per checklist key, so repeats are skipped.
+    emitted: Dict[str, bool] = {}
 
     # Initial greeting: identify whether onboarding has already collected
     # everything we need from sign-up. (Once Phase 2 lands, this should
     # consult Graphiti so we don't re-ask things from a prior session.)
     missing_fields = [
-        f
-        for f in (
-            "age",
-            "dietary_restrictions",
-            "cuisine_preferences",
-            "price_range",
-            "is_tourist",
-        )
-        if not getattr(user, f, None)
+        f for f in _GREETING_FIELDS if getattr(user, f, None) in UNANSWERED
     ]
     if missing_fields:
         await _send_agent_message(
@@ -306,49 +280,40 @@ async def onboarding_ws(websocket: WebSocket) -> None:
 
     try:
         while True:
+            # Yield once per frame: receive_text returns already-buffered
+            # frames without suspending, so a bursting client could
+            # otherwise starve every other connection on this worker.
+            await asyncio.sleep(0)
             raw = await websocket.receive_text()
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             msg_type = data.get("type")
             payload = data.get("payload", {})
 
-            try:
-                if msg_type == "user_audio":
-                    audio_url = payload.get("audioUrl")
-                    if not audio_url:
-                        raise ValueError("user_audio frame missing audioUrl")
-                    audio_bytes = await download_audio_from_url(audio_url)
-                    transcript_obj = await transcribe_audio(audio_bytes)
-                    transcript = (
-                        transcript_obj
-                        if isinstance(transcript_obj, str)
-                        else transcript_obj.get("text", "")
-                    )
-                    await _process_user_turn(
-                        websocket=websocket,
-                        user=user,
-                        thread_id=thread_id,
-                        step=payload.get("step", "general"),
-                        user_text=transcript,
-                    )
+            read_turn_text = TURN_TEXT_READERS.get(msg_type)
+            if read_turn_text is None:
+                logger.debug("Unknown WS message type: %s", msg_type)
+                continue
 
-                elif msg_type == "user_message":
-                    text = payload.get("text", "").strip()
-                    if not text:
-                        continue
+            try:
+                user_text = await read_turn_text(payload)
+                if user_text is not None:
                     await _process_user_turn(
                         websocket=websocket,
                         user=user,
                         thread_id=thread_id,
+                        emitted=emitted,
                         step=payload.get("step", "general"),
-                        user_text=text,
+                        user_text=user_text,
                     )
 
-                else:
-                    logger.debug("Unknown WS message type: %s", msg_type)
-
+            except WebSocketDisconnect:
+                # The client went away mid-turn; there is no one left to
+                # send an error frame to.
+                raise
             except Exception as e:
                 logger.exception("error handling WS turn")
-                await websocket.send_json(
+                await send_frame(
+                    websocket,
                     {
                         "type": "error",
                         "payload": {"message": f"Error: {e}"},
@@ -360,7 +325,8 @@ async def onboarding_ws(websocket: WebSocket) -> None:
     except Exception as e:
         logger.exception("unexpected WS error")
         try:
-            await websocket.send_json(
+            await send_frame(
+                websocket,
                 {"type": "error", "payload": {"message": str(e)}}
             )
             await websocket.close()
@@ -6,9 +6,6 @@ Handles community and social networking features
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, List
 from pydantic import BaseModel
-import logging
-
-logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/social", tags=["social"])
 
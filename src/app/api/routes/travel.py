@@ -7,9 +7,6 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from pydantic import BaseModel
 from datetime import date
-import logging
-
-logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/travel", tags=["travel"])
 
@@ -5,9 +5,6 @@ Handles voice processing and audio-related endpoints
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from typing import Dict, Any
-import logging
-
-logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/voice", tags=["voice"])
 
@@ -36,6 +36,13 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = Field(default=8000, validation_alias="APP_PORT")
     LOG_LEVEL: str = "INFO"
+    # Enables `?profile=1` pyinstrument reports (needs `pyinstrument`
+    # installed). Never turn on in production.
+    PROFILING: bool = False
+    # Mounts the placeholder voice/travel/social endpoints (bodies are
+    # still `pass`). Off by default so they stay out of routing and the
+    # OpenAPI schema until implemented.
+    ENABLE_STUB_ROUTES: bool = False
 
     # ----------------------------------------------------------------- CORS
     CORS_ORIGINS: List[str] = Field(
@@ -57,11 +64,30 @@ class Settings(BaseSettings):
     NEO4J_PORT: int = Field(default=7687, validation_alias="NEO4J_BOLT_PORT")
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str = "test1234"
+    # Named on every session (driver + neomodel) so the driver never has
+    # to resolve the user's home database first.
+    NEO4J_DATABASE: str = "neo4j"
+    # Connection pool shared by the bootstrap driver and neomodel. Bounded
+    # so a burst waits (up to the acquisition timeout) for a free
+    # connection instead of opening unbounded new ones; connections are
+    # recycled before typical LB/firewall idle cut-offs.
+    NEO4J_POOL_SIZE: int = 50
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 30.0
+    NEO4J_MAX_CONNECTION_LIFETIME: int = 3600
+    # Page the hot labels into Neo4j's page cache at startup so the first
+    # requests after a cold database start don't pay the disk reads.
+    WARMUP_ON_START: bool = False
     # If unset, computed in `_compute_neo4j_uri` from host/port.
     NEO4J_URI: Optional[str] = None
 
     # --------------------------------------------------------------- Redis
     REDIS_URL: str = "redis://localhost:6379"
+    # Max connections in the shared app pool (rate limiter, JWT blacklist,
+    # caches). The checkpointer manages its own client.
+    REDIS_POOL_SIZE: int = 50
+    # Idle lifetime of LangGraph checkpoint threads (refreshed on every
+    # read), so abandoned sessions don't pile up in Redis. 0 disables.
+    CHECKPOINT_TTL_MINUTES: int = 7 * 24 * 60
 
     # ----------------------------------------------------- Provider keys
     GROQ_API_KEY: str = ""
@@ -101,6 +127,12 @@ class Settings(BaseSettings):
     # -------------------------------------------------------- Auth / JWT
     SECRET_KEY: str = _PLACEHOLDER_SECRET_KEY
     ALGORITHM: str = "HS256"
+    # PEM keys for asymmetric algorithms (e.g. ALGORITHM=EdDSA with an
+    # Ed25519 pair; needs `cryptography`, i.e. `pyjwt[crypto]`). Verifying
+    # is cheaper than HMAC and verifier-only nodes can omit the private
+    # key. Literal "\n" sequences are accepted for single-line env vars.
+    JWT_PRIVATE_KEY: str = ""
+    JWT_PUBLIC_KEY: str = ""
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
     # ----------------------------------------------------------- Graphiti
@@ -156,6 +188,10 @@ class Settings(BaseSettings):
     def is_production(self) -> bool:
         return self.ENVIRONMENT.lower() == "production"
 
+    @property
+    def jwt_is_symmetric(self) -> bool:
+        return self.ALGORITHM.upper().startswith("HS")
+
     @property
     def DATABASE_URL(self) -> str:
         """Bolt URL with embedded credentials, for `neomodel.config.DATABASE_URL`."""
@@ -270,6 +306,16 @@ class Settings(BaseSettings):
             )
         return self
 
+    @model_validator(mode="after")
+    def _validate_jwt_keys(self) -> "Settings":
+        """Asymmetric JWT algorithms need at least the public key to verify."""
+        if not self.jwt_is_symmetric and not self.JWT_PUBLIC_KEY:
+            raise RuntimeError(
+                f"ALGORITHM={self.ALGORITHM!r} needs JWT_PUBLIC_KEY (PEM); "
+                "set JWT_PRIVATE_KEY too on nodes that issue tokens."
+            )
+        return self
+
     @model_validator(mode="after")
     def _refuse_unsafe_production_defaults(self) -> "Settings":
         """Hard-stop boot if production is configured with public placeholders."""
@@ -278,7 +324,8 @@ class Settings(BaseSettings):
 
         problems: list[str] = []
 
-        if self.SECRET_KEY in {"", _PLACEHOLDER_SECRET_KEY}:
+        symmetric = self.jwt_is_symmetric
+        if symmetric and self.SECRET_KEY in {"", _PLACEHOLDER_SECRET_KEY}:
             problems.append(
                 "SECRET_KEY is empty or the public placeholder. Generate one with: "
                 "python -c 'import secrets; print(secrets.token_urlsafe(64))'"
@@ -1,5 +1,5 @@
 """
-Database connections — Neo4j (sync driver bootstrap) + Redis (async).
+Database connections — Neo4j (async driver bootstrap) + Redis (async).
 
 Phase 1.5 polish notes:
 
@@ -10,19 +10,33 @@ Phase 1.5 polish notes:
   handles it. The blacklist / rate-limit code already wraps these calls
   in try/except.
 * :func:`run_in_thread` exposes a small helper for places where sync
-  ``neomodel`` queries are unavoidable: ``await run_in_thread(User.nodes.filter(...).first)``.
+  ``neomodel`` queries are unavoidable: ``await run_in_thread(get_user_by_uid, uid)``.
   This keeps blocking DB calls out of the asyncio event loop without
   forcing every model call site to use ``asyncio.to_thread`` directly.
+* The bootstrap Neo4j driver is the native async one, so the health check
+  and admin queries no longer park a worker thread per call.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from functools import partial
-from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar
-
-from neo4j import GraphDatabase
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+)
+
+from neo4j import AsyncGraphDatabase, AsyncManagedTransaction, AsyncSession
 import redis.asyncio as redis
 
 from .config import settings
@@ -33,6 +47,46 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# The uid constraint backs the hot-path `get_user_by_uid` lookup with an
+# index seek. Email and username uniqueness (which makes `register_user`
+# in `routes/auth.py` race-free) comes from `unique_index=True` on the
+# User model and is created by `install_model_labels`, so it is not
+# repeated here. `IF NOT EXISTS` keeps startup idempotent.
+USER_CONSTRAINTS: tuple[str, ...] = (
+    "CREATE CONSTRAINT user_uid IF NOT EXISTS "
+    "FOR (u:User) REQUIRE u.uid IS UNIQUE",
+)
+
+# Startup cache warm-up: touch the properties of every node on the hot
+# labels and walk the relationships the read paths traverse. Only used
+# when APOC's `apoc.warmup.run` isn't installed.
+WARMUP_LABELS: tuple[str, ...] = ("User", "Restaurant", "MenuItem", "Location", "Hotel")
+WARMUP_QUERIES: tuple[str, ...] = tuple(
+    f"MATCH (n:{label}) RETURN sum(size(keys(n)))" for label in WARMUP_LABELS
+) + (
+    "MATCH (:User)-[r:PLACED_ORDER|VISITED]->() RETURN count(r)",
+)
+
+# Rows per UNWIND statement in the bulk helpers. Large enough to amortise
+# the round trip, small enough to keep each statement's parameter map and
+# transaction state modest.
+BULK_BATCH_SIZE = 1000
+
+# Labels, relationship types and property keys can't be query parameters,
+# so the bulk helpers interpolate them; only plain identifiers are allowed.
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _identifier(name: str) -> str:
+    if not _IDENTIFIER.fullmatch(name):
+        raise ValueError(f"invalid Cypher identifier: {name!r}")
+    return f"`{name}`"
+
+
+def _batches(rows: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
 
 async def run_in_thread(
     fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs
@@ -43,7 +97,7 @@ async def run_in_thread(
     around sync neomodel queries (which still don't expose an async API
     in 5.x) so they don't stall the event loop::
 
-        user = await run_in_thread(User.nodes.filter(uid=uid).first)
+        user = await run_in_thread(get_user_by_uid, uid)
 
     The wrapped function should be self-contained — closures over
     request-scoped state are fine; closures over event-loop state are
@@ -70,9 +124,15 @@ class Neo4jDatabase:
 
     async def connect(self) -> None:
         try:
-            self.driver = GraphDatabase.driver(
+            self.driver = AsyncGraphDatabase.driver(
                 settings.NEO4J_URI,
                 auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_POOL_SIZE,
+                connection_acquisition_timeout=(
+                    settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+                ),
+                max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                keep_alive=True,
             )
             # Verify the driver can actually reach Neo4j once at startup.
             ok = await self.is_connected()
@@ -86,48 +146,177 @@ class Neo4jDatabase:
     async def close(self) -> None:
         if self.driver:
             try:
-                # Driver.close is sync; push to a thread so we don't block.
-                await run_in_thread(self.driver.close)
+                await self.driver.close()
             except Exception:
                 self.logger.exception("Error closing Neo4j driver")
             self.logger.info("Neo4j connection closed")
 
+    def session(self) -> AsyncSession:
+        """Open a session on the configured database (skips home-DB lookup)."""
+        return self.driver.session(database=settings.NEO4J_DATABASE)
+
     async def is_connected(self) -> bool:
         """Run a trivial query to confirm Neo4j accepts connections."""
         if not self.driver:
             return False
 
-        def _check() -> bool:
-            try:
-                with self.driver.session() as session:
-                    result = session.run("RETURN 1")
-                    return result.single() is not None
-            except Exception:
-                return False
-
         try:
-            return await run_in_thread(_check)
+            async with self.session() as session:
+                result = await session.run("RETURN 1")
+                return await result.single() is not None
         except Exception as e:
             self.logger.error("Neo4j connection check failed: %s", e)
             return False
 
     async def execute_query(
         self, query: str, parameters: Optional[dict] = None
-    ):
-        """Execute a Cypher query (sync driver, run in thread).
+    ) -> list[dict]:
+        """Execute one Cypher query in an auto-commit transaction.
 
         Use sparingly — most reads/writes should go through neomodel.
-        Provided for ad-hoc admin queries.
+        Provided for ad-hoc admin queries (and schema statements, which
+        must run outside an explicit transaction).
         """
         if not self.driver:
             raise RuntimeError("Neo4j driver not initialized")
 
-        def _run() -> list[dict]:
-            with self.driver.session() as session:
-                result = session.run(query, parameters or {})
-                return [dict(record) for record in result]
+        async with self.session() as session:
+            result = await session.run(query, parameters or {})
+            return await result.data()
 
-        return await run_in_thread(_run)
+    async def execute_queries(
+        self,
+        statements: Iterable[Tuple[str, Optional[dict]]],
+        *,
+        write: bool = True,
+    ) -> list[list[dict]]:
+        """Run several ``(query, parameters)`` pairs in one managed transaction.
+
+        One BEGIN/COMMIT (and one retry unit) for the whole batch instead
+        of one per statement. Returns each statement's records in order.
+        """
+        if not self.driver:
+            raise RuntimeError("Neo4j driver not initialized")
+        statements = list(statements)
+
+        async def _work(tx: AsyncManagedTransaction) -> list[list[dict]]:
+            results = []
+            for query, parameters in statements:
+                result = await tx.run(query, parameters or {})
+                results.append(await result.data())
+            return results
+
+        async with self.session() as session:
+            if write:
+                return await session.execute_write(_work)
+            return await session.execute_read(_work)
+
+    async def bulk_create(
+        self,
+        label: str,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """Create one ``label`` node per row (``SET n = row``) via UNWIND.
+
+        One statement per ``batch_size`` rows, all in a single write
+        transaction, instead of a round trip per node. Rows must carry
+        every property the node needs (including its unique id; neomodel
+        defaults don't apply here). Returns the number of nodes created.
+        """
+        if not rows:
+            return 0
+        query = (
+            f"UNWIND $rows AS r CREATE (n:{_identifier(label)}) SET n = r "
+            "RETURN count(n) AS created"
+        )
+        results = await self.execute_queries(
+            (query, {"rows": list(batch)}) for batch in _batches(rows, batch_size)
+        )
+        return sum(records[0]["created"] for records in results)
+
+    async def bulk_merge_rels(
+        self,
+        source_label: str,
+        target_label: str,
+        rel_type: str,
+        pairs: Sequence[Tuple[Any, Any]],
+        *,
+        source_key: str = "uid",
+        target_key: str = "uid",
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """MERGE ``(source)-[:rel_type]->(target)`` for each id pair via UNWIND.
+
+        ``pairs`` are ``(source_id, target_id)`` values of ``source_key`` /
+        ``target_key``; pairs whose endpoints don't exist are skipped.
+        Returns the number of relationships matched or created.
+        """
+        if not pairs:
+            return 0
+        query = (
+            "UNWIND $pairs AS p "
+            f"MATCH (s:{_identifier(source_label)} "
+            f"{{{_identifier(source_key)}: p.s}}) "
+            f"MATCH (t:{_identifier(target_label)} "
+            f"{{{_identifier(target_key)}: p.t}}) "
+            f"MERGE (s)-[rel:{_identifier(rel_type)}]->(t) "
+            "RETURN count(rel) AS merged"
+        )
+        results = await self.execute_queries(
+            (query, {"pairs": [{"s": s, "t": t} for s, t in batch]})
+            for batch in _batches(pairs, batch_size)
+        )
+        return sum(records[0]["merged"] for records in results)
+
+    async def bulk_import(
+        self,
+        inner_cypher: str,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        batch_size: int = BULK_BATCH_SIZE,
+        concurrent: bool = True,
+    ) -> None:
+        """Run ``inner_cypher`` once per row, committed in server-side batches.
+
+        Wraps it as ``UNWIND $rows AS r CALL { WITH r ... } IN [CONCURRENT]
+        TRANSACTIONS OF batch_size ROWS``: Neo4j commits every batch on its
+        own and, with ``concurrent`` (Neo4j 5.21+), runs batches on parallel
+        server threads. Meant for cold imports, not request paths; batches
+        already committed stay committed if a later one fails. The inner
+        query sees each row as ``r``.
+        """
+        if not rows:
+            return
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        mode = "CONCURRENT TRANSACTIONS" if concurrent else "TRANSACTIONS"
+        query = (
+            f"UNWIND $rows AS r CALL {{ WITH r {inner_cypher} }} "
+            f"IN {mode} OF {int(batch_size)} ROWS"
+        )
+        # CALL ... IN TRANSACTIONS only runs in an auto-commit transaction.
+        await self.execute_query(query, {"rows": list(rows)})
+
+    async def warm_up(self) -> None:
+        """Load hot node/relationship pages into the Neo4j page cache."""
+        try:
+            await self.execute_query("CALL apoc.warmup.run(true, true, true)")
+            self.logger.info("Neo4j page cache warmed via APOC")
+            return
+        except Exception:
+            self.logger.info("apoc.warmup.run unavailable; touching hot labels")
+        await self.execute_queries(
+            ((query, None) for query in WARMUP_QUERIES), write=False
+        )
+        self.logger.info("Neo4j page cache warmed")
+
+    async def ensure_constraints(self) -> None:
+        """Create the User uid uniqueness constraint (idempotent)."""
+        for statement in USER_CONSTRAINTS:
+            await self.execute_query(statement)
+        self.logger.info("Neo4j User uid constraint ready")
 
 
 class RedisCache:
@@ -145,7 +334,19 @@ class RedisCache:
 
     async def connect(self) -> None:
         try:
-            self.redis_client = redis.from_url(settings.REDIS_URL)
+            # Bounded pool: under a burst, callers wait up to `timeout`
+            # for a free connection instead of opening sockets without
+            # limit. The client PINGs idle connections itself before
+            # reuse, so callers never need an explicit is_connected().
+            pool = redis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_POOL_SIZE,
+                timeout=5,
+                health_check_interval=30,
+                socket_keepalive=True,
+                retry_on_timeout=True,
+            )
+            self.redis_client = redis.Redis(connection_pool=pool)
             if not await self.is_connected():
                 raise RuntimeError("Failed to connect to Redis")
             self.logger.info("Connected to Redis")
@@ -156,11 +357,20 @@ class RedisCache:
     async def close(self) -> None:
         if self.redis_client:
             try:
-                await self.redis_client.close()
+                await self.redis_client.aclose(close_connection_pool=True)
             except Exception:
                 self.logger.exception("Error closing Redis client")
             self.logger.info("Redis connection closed")
 
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        """The shared pooled client, or None before `connect()`.
+
+        For callers that need commands beyond set/get/delete (INCR,
+        EXPIRE, ...) so they reuse this pool rather than building their own.
+        """
+        return self.redis_client
+
     async def is_connected(self) -> bool:
         """One-shot health check (PING). Use at startup, NOT per request."""
         if not self.redis_client:
@@ -187,7 +397,41 @@ class RedisCache:
             raise RuntimeError("Redis is not connected")
         return await self.redis_client.get(key)
 
+    async def delete(self, key: str) -> None:
+        if self.redis_client is None:
+            raise RuntimeError("Redis is not connected")
+        await self.redis_client.delete(key)
+
 
 # Global database instances
 neo4j_db = Neo4jDatabase()
 redis_cache = RedisCache()
+
+
+# Last observed reachability of each backing service. Refreshed in the
+# background by `monitor_service_status` so `/health` answers from memory
+# instead of a Neo4j query plus a Redis PING per probe.
+HEALTH_REFRESH_SECONDS = 5.0
+service_status: dict[str, bool] = {"neo4j": False, "redis": False}
+
+
+async def refresh_service_status() -> dict[str, bool]:
+    """Probe Neo4j and Redis concurrently and record the result."""
+    neo4j_ok, redis_ok = await asyncio.gather(
+        neo4j_db.is_connected(), redis_cache.is_connected()
+    )
+    service_status["neo4j"] = neo4j_ok
+    service_status["redis"] = redis_ok
+    return service_status
+
+
+async def monitor_service_status(
+    interval: float = HEALTH_REFRESH_SECONDS,
+) -> None:
+    """Refresh :data:`service_status` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_service_status()
+        except Exception:
+            logger.exception("Service status refresh failed")
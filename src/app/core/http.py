@@ -0,0 +1,49 @@
+"""
+Shared outbound HTTP client.
+
+One process-wide `aiohttp.ClientSession` so outbound fetches reuse pooled
+keep-alive connections (and their TLS sessions) instead of paying a fresh
+handshake per call. It is created lazily on first use, because it must be
+built inside the running event loop, and closed from the FastAPI lifespan.
+Per-request timeouts are passed at the call site.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import aiohttp
+
+MAX_CONNECTIONS = 256
+MAX_CONNECTIONS_PER_HOST = 64
+KEEPALIVE_SECONDS = 60
+DNS_CACHE_SECONDS = 300
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use.
+
+    No awaits between the check and the assignment, so concurrent callers
+    on the event loop can't create two sessions.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_SECONDS,
+                ttl_dns_cache=DNS_CACHE_SECONDS,
+            )
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared session (no-op if it was never opened)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
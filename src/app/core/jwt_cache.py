@@ -0,0 +1,106 @@
+"""
+Short-TTL cache of verified JWT payloads.
+
+Every authenticated request runs the bearer token through `jwt.decode`
+(signature check + claim validation). Chatty clients send the same token
+many times a second, so we remember payloads that already passed
+verification for a few seconds and skip the decode on repeat hits.
+
+Only verified payloads are ever stored and entries never outlive the
+token's own `exp`. A second instance remembers tokens Redis recently
+confirmed are not blacklisted, sparing a network hop per request; logout
+invalidates both on the worker that handles it.
+
+Keys are a 16-byte blake2b digest of the token — we don't keep raw
+bearer tokens in process memory longer than the request needs them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAXSIZE = 10_000
+DEFAULT_TTL_SECONDS = 5.0
+
+
+def _key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+class JWTCache:
+    """Bounded TTL cache mapping token digests to verified payloads.
+
+    All operations are synchronous with no awaits in between, so they are
+    atomic on the event loop and need no lock. Eviction is LRU once
+    `maxsize` is reached; expired entries are dropped lazily on lookup.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        if maxsize <= 0 or ttl <= 0:
+            raise ValueError("maxsize and ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for `token`, or None on miss/expiry."""
+        key = _key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache a *verified* payload for min(ttl, exp - now) seconds."""
+        lifetime = self.ttl
+        exp = payload.get("exp")
+        if exp is not None:
+            lifetime = min(lifetime, float(exp) - time.time())
+        if lifetime <= 0:
+            return
+
+        key = _key(token)
+        self._entries[key] = (time.monotonic() + lifetime, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """Drop `token` from the cache (no-op if absent)."""
+        self._entries.pop(_key(token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide instances used by `SecurityManager.verify_token`.
+jwt_cache = JWTCache()
+
+# Tokens Redis recently confirmed are *not* blacklisted. Only negative
+# answers are cached, so a revoked token can outlive its logout by at most
+# this TTL on other workers (the logging-out worker invalidates at once).
+NOT_BLACKLISTED_TTL_SECONDS = 30.0
+not_blacklisted_cache = JWTCache(ttl=NOT_BLACKLISTED_TTL_SECONDS)
+
+
+def invalidate_token(token: str) -> None:
+    """Forget everything cached about `token` (call on logout)."""
+    jwt_cache.invalidate(token)
+    not_blacklisted_cache.invalidate(token)
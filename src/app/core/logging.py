@@ -5,23 +5,31 @@ Drop-in replacement for the previous ``logging.basicConfig`` setup. Logs
 emit one JSON object per line so downstream collectors (Datadog,
 CloudWatch, Vector, ...) can parse without grok regexes.
 
-Per-request correlation: the request-logging middleware in ``main.py``
-already generates a ``request_id`` and stores it in a ContextVar
+Per-request correlation: the request-logging middleware
+(``api.middleware.logging.RequestContextMiddleware``) generates a ``request_id`` and stores it in a ContextVar
 (:data:`request_id_var`). Every log record this formatter emits picks
 up the current value and includes it as ``request_id`` in the output.
 
 Disable JSON output by setting ``LOG_FORMAT=text`` (useful for
 local debugging when you want human-readable lines).
+
+Handlers run on a background ``QueueListener`` thread: the root logger
+only enqueues, so stdout/file writes (and file rotation) never block the
+event loop. The request id is captured on the record at enqueue time,
+since the listener thread doesn't see the request's ContextVar.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
 from contextvars import ContextVar
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Optional
 
@@ -29,13 +37,18 @@ from typing import Any, Optional
 # ---------------------------------------------------------- Context vars
 #
 # `request_id_var` is the per-request correlation id. The HTTP middleware
-# in `main.py` calls `request_id_var.set(...)` at the start of every
+# (`RequestContextMiddleware`) calls `request_id_var.set(...)` at the start of every
 # request and resets it at the end. Logs emitted within that scope pick
 # up the value automatically.
 
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
+def _record_request_id(record: logging.LogRecord) -> Optional[str]:
+    """Request id captured at enqueue time, else the current ContextVar."""
+    return getattr(record, "_request_id", None) or request_id_var.get()
+
+
 # ---------------------------------------------------------- Formatters
 
 
@@ -66,8 +79,8 @@ class JSONLogFormatter(logging.Formatter):
         if record.stack_info:
             payload["stack"] = record.stack_info
 
-        # Pull the per-request correlation id off the ContextVar.
-        rid = request_id_var.get()
+        # Pull the per-request correlation id off the record/ContextVar.
+        rid = _record_request_id(record)
         if rid:
             payload["request_id"] = rid
 
@@ -102,7 +115,7 @@ class TextLogFormatter(logging.Formatter):
         super().__init__(self.DEFAULT_FMT)
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: A003
-        rid = request_id_var.get()
+        rid = _record_request_id(record)
         record.__dict__["_req_short"] = (rid[:8] + "…") if rid else "-"
         return super().format(record)
 
@@ -110,6 +123,48 @@ class TextLogFormatter(logging.Formatter):
 # ---------------------------------------------------------- Setup
 
 
+class _ContextQueueHandler(QueueHandler):
+    """QueueHandler that keeps structured fields for the listener's formatter.
+
+    The stock ``prepare`` pre-formats the record (folding the traceback
+    into ``msg``); here only the message is merged with its args, and the
+    request id is stamped on so it survives the thread hop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._request_id = request_id_var.get()
+        return record
+
+
+# The listener currently draining the root logger's queue, if any.
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread (idempotent).
+
+    The listener's handlers go back on the root logger directly, so
+    records emitted after shutdown are still written, just synchronously.
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        if isinstance(h, _ContextQueueHandler):
+            root.removeHandler(h)
+    for h in listener.handlers:
+        root.addHandler(h)
+
+
+atexit.register(stop_logging)
+
+
 def configure_logging(
     *,
     level: str = "INFO",
@@ -119,9 +174,11 @@ def configure_logging(
 ) -> None:
     """Wire up a single root handler emitting JSON (or text) lines.
 
-    Idempotent: replaces existing handlers on the root logger so it's
-    safe to call again from tests.
+    Idempotent: replaces existing handlers on the root logger (and the
+    previous listener) so it's safe to call again from tests.
     """
+    global _listener
+    stop_logging()
     root = logging.getLogger()
     for h in list(root.handlers):
         root.removeHandler(h)
@@ -134,7 +191,7 @@ def configure_logging(
 
     stream_handler = logging.StreamHandler(stream=sys.stdout)
     stream_handler.setFormatter(formatter)
-    root.addHandler(stream_handler)
+    handlers: list[logging.Handler] = [stream_handler]
 
     if log_dir:
         try:
@@ -146,7 +203,7 @@ def configure_logging(
                 encoding="utf-8",
             )
             file_handler.setFormatter(formatter)
-            root.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception:
             # Non-fatal: still have stdout. Don't take the app down because
             # the logs directory wasn't writable.
@@ -154,6 +211,11 @@ def configure_logging(
                 "Unable to attach RotatingFileHandler at %s/%s", log_dir, log_file
             )
 
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(_ContextQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     root.setLevel(level.upper())
 
 
@@ -3,13 +3,18 @@ Security Configuration.
 
 Authentication, authorization, and security utilities. Passwords are hashed
 with Argon2 (via `argon2-cffi`). JWTs use PyJWT. Logged-out tokens are
-blacklisted in Redis with a TTL equal to the token's remaining lifetime.
+blacklisted in Redis by their `jti` claim, with a TTL equal to the token's
+remaining lifetime. "Log out everywhere" bumps the user's token version
+instead, invalidating every token stamped with an older `ver` at once.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 from datetime import datetime, timedelta
+from secrets import token_hex
 from typing import Any, Dict, Optional
 
 import jwt
@@ -17,13 +22,30 @@ from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, VerificationError, InvalidHashError
 
 from src.app.core.config import settings
-from src.app.core.database import redis_cache
+from src.app.core.database import redis_cache, run_in_thread
+from src.app.core.jwt_cache import jwt_cache, not_blacklisted_cache
 
 logger = logging.getLogger(__name__)
 
+# Current token version per user is read through Redis (`user_ver:{uid}`)
+# with this TTL; Neo4j's `User.token_version` is the source of truth.
+TOKEN_VERSION_CACHE_TTL_SECONDS = 60
+
 # Argon2 is the only password hasher in use. The legacy bcrypt context that
 # used to live here was never called and has been removed.
-argon2_hasher = PasswordHasher()
+#
+# Argon2id with one of OWASP's recommended parameter sets (12 MiB, t=3,
+# p=1) instead of the library default (64 MiB, p=4): a fraction of the
+# CPU/memory per login while staying within OWASP's minimums. Hashes
+# produced with other parameters still verify and are upgraded on the
+# next successful login (see `needs_rehash`).
+argon2_hasher = PasswordHasher(
+    time_cost=3,
+    memory_cost=12 * 1024,
+    parallelism=1,
+    hash_len=32,
+    salt_len=16,
+)
 
 
 class SecurityManager:
@@ -33,8 +55,21 @@ class SecurityManager:
 
     def __init__(self) -> None:
         self.logger = logging.getLogger("security")
-        self.jwt_secret = settings.SECRET_KEY
         self.jwt_algorithm = settings.ALGORITHM
+        if settings.jwt_is_symmetric:
+            self.jwt_signing_key = self.jwt_verify_key = settings.SECRET_KEY
+        else:
+            # Parse the PEMs once; PyJWT would otherwise re-load them on
+            # every encode/decode. Raises if `cryptography` is missing.
+            algorithm = jwt.get_algorithm_by_name(self.jwt_algorithm)
+            self.jwt_verify_key = algorithm.prepare_key(
+                settings.JWT_PUBLIC_KEY.replace("\\n", "\n")
+            )
+            self.jwt_signing_key = (
+                algorithm.prepare_key(settings.JWT_PRIVATE_KEY.replace("\\n", "\n"))
+                if settings.JWT_PRIVATE_KEY
+                else None
+            )
 
     # ------------------------------------------------------------ JWT
 
@@ -47,12 +82,30 @@ class SecurityManager:
             expires_delta
             or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         )
-        to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, self.jwt_secret, algorithm=self.jwt_algorithm)
+        # `jti` gives every token a short unique id, so the blacklist keys
+        # on 32 hex chars instead of the whole encoded JWT.
+        to_encode.update({"exp": expire, "jti": token_hex(16)})
+        if self.jwt_signing_key is None:
+            raise RuntimeError("JWT_PRIVATE_KEY is not configured on this node")
+        return jwt.encode(
+            to_encode, self.jwt_signing_key, algorithm=self.jwt_algorithm
+        )
+
+    @staticmethod
+    def blacklist_key(token: str, payload: Dict[str, Any]) -> str:
+        """Redis key marking `token` as logged out.
 
-    async def is_token_blacklisted(self, token: str) -> bool:
+        Tokens issued before `jti` was added fall back to the full token.
         """
-        Check the Redis blacklist for `token`.
+        jti = payload.get("jti")
+        return f"blacklist:{jti}" if jti else f"blacklist:{token}"
+
+    async def is_token_blacklisted(
+        self, token: str, payload: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Check the Redis blacklist for `token` (pass its verified `payload`
+        so the lookup can use the `jti` key).
 
         Behavior on Redis errors:
           - In production we **fail closed** (return True / treat as blacklisted)
@@ -61,7 +114,7 @@ class SecurityManager:
           - In development we fail open so engineers aren't blocked when Redis
             is down locally.
         """
-        if not redis_cache.redis_client:
+        if not redis_cache.client:
             if settings.is_production:
                 self.logger.error(
                     "Redis unavailable; failing CLOSED on blacklist check (prod)."
@@ -70,27 +123,121 @@ class SecurityManager:
             return False
 
         try:
-            result = await redis_cache.get(f"blacklist:{token}")
+            result = await redis_cache.get(self.blacklist_key(token, payload or {}))
             return result is not None
         except Exception:  # broad on purpose: any Redis-side fault
             self.logger.exception("Redis blacklist check failed")
             return settings.is_production  # closed in prod, open in dev
 
-    async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Verify a JWT and confirm it has not been blacklisted."""
-        if await self.is_token_blacklisted(token):
-            self.logger.warning("Token is blacklisted (logged out)")
+    @staticmethod
+    def _token_version_key(uid: str) -> str:
+        return f"user_ver:{uid}"
+
+    async def _current_token_version(self, uid: str) -> int:
+        key = self._token_version_key(uid)
+        cached = await redis_cache.get(key)
+        if cached is not None:
+            return int(cached)
+
+        from src.app.models.user import get_token_version
+
+        version = await run_in_thread(get_token_version, uid) or 0
+        await redis_cache.set(key, str(version), TOKEN_VERSION_CACHE_TTL_SECONDS)
+        return version
+
+    async def is_token_version_stale(self, payload: Dict[str, Any]) -> bool:
+        """True if the user revoked all sessions after `payload` was issued.
+
+        Tokens without a `ver` claim count as version 0. Redis faults
+        follow the blacklist policy: closed in prod, open in dev.
+        """
+        if not redis_cache.client:
+            return settings.is_production
+
+        try:
+            current = await self._current_token_version(payload["sub"])
+        except Exception:  # broad on purpose: any Redis/Neo4j fault
+            self.logger.exception("Token version check failed")
+            return settings.is_production
+        return payload.get("ver", 0) < current
+
+    async def revoke_all_tokens(self, uid: str) -> Optional[int]:
+        """Invalidate every outstanding token for `uid` in one write.
+
+        Returns the new token version (None if the user doesn't exist).
+        Other workers may keep honoring old tokens for up to the
+        not-blacklisted cache TTL, as with single-token logout, or up to
+        the token-version cache TTL if Redis can't be updated at all.
+        """
+        from src.app.models.user import bump_token_version
+
+        version = await run_in_thread(bump_token_version, uid)
+        if version is None:
             return None
+        # Cache entries aren't indexed by user; revocation is rare enough
+        # to just drop them all on this worker.
+        not_blacklisted_cache.clear()
+        # The bump is already committed in Neo4j, so a Redis fault must not
+        # fail the request. If the write fails, try deleting the key so the
+        # next check re-reads the version from Neo4j. If Redis is down
+        # altogether, the old cached version can be served (and revoked
+        # tokens honored) until it expires, up to
+        # TOKEN_VERSION_CACHE_TTL_SECONDS.
+        key = self._token_version_key(uid)
         try:
-            return jwt.decode(
-                token, self.jwt_secret, algorithms=[self.jwt_algorithm]
+            await redis_cache.set(key, str(version), TOKEN_VERSION_CACHE_TTL_SECONDS)
+        except Exception:
+            self.logger.exception("Token version cache refresh failed for %s", uid)
+            try:
+                await redis_cache.delete(key)
+            except Exception:
+                self.logger.exception(
+                    "Token version cache delete failed for %s", uid
+                )
+        return version
+
+    async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verify a JWT and confirm it has not been revoked.
+
+        Signature/claims are checked first (served from the short-TTL
+        payload cache when possible), so garbage tokens never cost a Redis
+        round trip. A "not blacklisted" answer from Redis is then remembered
+        in-process for up to 30s (see `core/jwt_cache.py`); logout on this
+        worker clears it immediately, other workers may honor a revoked
+        token for at most that window.
+        """
+        payload = jwt_cache.get(token)
+        if payload is None:
+            try:
+                payload = jwt.decode(
+                    token,
+                    self.jwt_verify_key,
+                    algorithms=[self.jwt_algorithm],
+                    options={"require": ["exp", "sub"]},
+                )
+            except jwt.ExpiredSignatureError:
+                self.logger.warning("Token expired")
+                return None
+            except jwt.InvalidTokenError:
+                self.logger.warning("Invalid token")
+                return None
+            jwt_cache.put(token, payload)
+
+        if not_blacklisted_cache.get(token) is None:
+            # Independent lookups: overlap the two Redis round trips.
+            blacklisted, stale = await asyncio.gather(
+                self.is_token_blacklisted(token, payload),
+                self.is_token_version_stale(payload),
             )
-        except jwt.ExpiredSignatureError:
-            self.logger.warning("Token expired")
-            return None
-        except jwt.InvalidTokenError:
-            self.logger.warning("Invalid token")
-            return None
+            if blacklisted:
+                self.logger.warning("Token is blacklisted (logged out)")
+                return None
+            if stale:
+                self.logger.warning("Token predates a revoke-all (stale version)")
+                return None
+            not_blacklisted_cache.put(token, payload)
+
+        return payload
 
     # ------------------------------------------------------- Passwords
 
@@ -108,6 +255,29 @@ class SecurityManager:
             self.logger.exception("Argon2 verify raised unexpectedly")
             return False
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True if `hashed_password` was made with different Argon2 params."""
+        try:
+            return argon2_hasher.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return True
+
+    # Argon2 is deliberately slow (tens of ms per call). argon2-cffi drops
+    # the GIL while hashing, so a worker thread keeps the event loop free
+    # and still lets concurrent logins hash in parallel.
+
+    async def hash_password_async(self, password: str) -> str:
+        """`hash_password` off the event loop."""
+        return await run_in_thread(self.hash_password, password)
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """`verify_password` off the event loop."""
+        return await run_in_thread(
+            self.verify_password, plain_password, hashed_password
+        )
+
     # --------------------------------------------- Voice biometrics stubs
 
     def generate_challenge_sentence(self) -> str:
@@ -119,11 +289,14 @@ class SecurityManager:
         raise NotImplementedError("voice biometrics not implemented in this phase")
 
     def calculate_audio_hash(self, audio_data: bytes) -> str:
-        """Hash audio bytes for replay-attack detection.
+        """Hash audio bytes for replay-attack detection (SHA-256 hex digest).
 
-        Stubbed pending the voice biometrics phase.
+        hashlib hands the whole buffer to OpenSSL, which uses the CPU's
+        SHA extensions where available. For audio read in chunks, feed a
+        ``hashlib.sha256()`` with ``update()`` per chunk instead of joining
+        the bytes first.
         """
-        raise NotImplementedError("voice biometrics not implemented in this phase")
+        return hashlib.sha256(audio_data).hexdigest()
 
 
 # Global security instance
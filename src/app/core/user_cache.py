@@ -0,0 +1,103 @@
+"""
+Short-TTL in-process cache of User nodes, keyed by uid.
+
+WebSocket clients reconnect often (page reloads, flaky mobile links) and
+every connect resolves the token's `sub` to a User with a Neo4j round
+trip. Remembering recently resolved users for a minute makes reconnects
+within that window skip the database entirely.
+
+The profile write helpers in `models/user.py` drop a user's entry on the
+worker that performs the write; other workers may serve a profile up to
+the TTL old. Keep the TTL short for that reason.
+
+Writes happen in worker threads (`run_in_thread`), so unlike `JWTCache`
+this one is guarded by a lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.app.models.user import User
+
+DEFAULT_MAXSIZE = 10_000
+DEFAULT_TTL_SECONDS = 60.0
+
+
+class UserCache:
+    """Bounded TTL cache mapping uid to a loaded `User`.
+
+    Eviction is LRU once `maxsize` is reached; expired entries are dropped
+    lazily on lookup. A secondary email index lets email-keyed writes
+    invalidate without another query.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        if maxsize <= 0 or ttl <= 0:
+            raise ValueError("maxsize and ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+        self._uid_by_email: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, uid: str) -> Optional["User"]:
+        """Return the cached User for `uid`, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if time.monotonic() >= expires_at:
+                self._drop(uid)
+                return None
+            self._entries.move_to_end(uid)
+            return user
+
+    def put(self, user: "User") -> None:
+        with self._lock:
+            self._entries[user.uid] = (time.monotonic() + self.ttl, user)
+            self._entries.move_to_end(user.uid)
+            if user.email:
+                self._uid_by_email[user.email] = user.uid
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, uid: str) -> None:
+        """Drop `uid` from the cache (no-op if absent)."""
+        with self._lock:
+            self._drop(uid)
+
+    def invalidate_email(self, email: str) -> None:
+        """Drop the user with `email` from the cache (no-op if absent)."""
+        with self._lock:
+            uid = self._uid_by_email.get(email)
+            if uid is not None:
+                self._drop(uid)
+
+    def _drop(self, uid: str) -> None:
+        entry = self._entries.pop(uid, None)
+        if entry is not None:
+            email = entry[1].email
+            if self._uid_by_email.get(email) == uid:
+                del self._uid_by_email[email]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._uid_by_email.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide instance used by the WS auth helper and `models/user.py`.
+user_cache = UserCache()
@@ -3,22 +3,32 @@ Main Application
 FastAPI application setup and configuration
 """
 
+import asyncio
+import contextlib
 import logging
 import os
-import uuid
 from contextlib import asynccontextmanager
-from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.agents.base import setup_checkpointer_indexes
 from src.app.services.graphiti import close_graphiti, setup_graphiti
 
 from .core.config import settings
-from .core.database import neo4j_db, redis_cache
-from .core.logging import configure_logging, request_id_var
+from .core.database import (
+    monitor_service_status,
+    neo4j_db,
+    redis_cache,
+    refresh_service_status,
+    run_in_thread,
+    service_status,
+)
+from .core.http import close_http_session
+from .core.logging import configure_logging, stop_logging
+from .models import close_model_connection, install_model_labels
+from .api.middleware import ProfilingMiddleware, RequestContextMiddleware
 from .services.memory_service import memory_service
 from .api.routes import (
     voice_router,
@@ -30,6 +40,7 @@ from .api.routes import (
     agent_ws_router,
     users_router,
 )
+from .utils.clock import utc_timestamp
 
 from scalar_fastapi import get_scalar_api_reference
 
@@ -51,6 +62,13 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Aurasense application...")
     try:
         await neo4j_db.connect()
+        await neo4j_db.ensure_constraints()
+        await run_in_thread(install_model_labels)
+        if settings.WARMUP_ON_START:
+            try:
+                await neo4j_db.warm_up()
+            except Exception:
+                logger.warning("Neo4j cache warm-up failed", exc_info=True)
         await redis_cache.connect()
         logger.info("Database connections established")
         # Initialize LangGraph checkpointer indexes (idempotent).
@@ -60,6 +78,9 @@ async def lifespan(app: FastAPI):
         # standalone container — see services/graphiti/client.py.
         await setup_graphiti()
         logger.info("Graphiti SDK indices/constraints ready")
+        # /health reads cached service status; seed it, then keep it fresh.
+        await refresh_service_status()
+        status_task = asyncio.create_task(monitor_service_status())
     except Exception as e:
         logger.error(f"Failed during startup: {str(e)}", exc_info=True)
         raise
@@ -68,14 +89,23 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Aurasense application...")
+    status_task.cancel()
+    # Let the monitor finish before the clients it polls are closed.
+    with contextlib.suppress(asyncio.CancelledError):
+        await status_task
     try:
         await neo4j_db.close()
+        await run_in_thread(close_model_connection)
         await redis_cache.close()
         await close_graphiti()
         await memory_service.cleanup()
+        await close_http_session()
         logger.info("All connections closed")
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}", exc_info=True)
+    finally:
+        # Drain the log queue last so the shutdown lines above are written.
+        stop_logging()
 
 
 # Create FastAPI application
@@ -84,39 +114,19 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Voice-first agentic lifestyle companion",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
 # Request logging middleware — sets the per-request correlation id on a
-# ContextVar so structured log records pick it up automatically.
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-    token = request_id_var.set(request_id)
-    request.state.request_id = request_id
-
-    start = datetime.utcnow()
-    try:
-        logger.info(
-            "request.start",
-            extra={"method": request.method, "path": request.url.path},
-        )
-        response = await call_next(request)
-        duration = (datetime.utcnow() - start).total_seconds()
-        logger.info(
-            "request.end",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_s": round(duration, 4),
-            },
-        )
-        # Echo the request id back so clients can correlate too.
-        response.headers["X-Request-ID"] = request_id
-        return response
-    finally:
-        request_id_var.reset(token)
+# ContextVar so structured log records pick it up automatically. Pure
+# ASGI (not `@app.middleware("http")`) to stay off the BaseHTTPMiddleware
+# path on every request.
+app.add_middleware(RequestContextMiddleware)
+
+# Opt-in `?profile=1` pyinstrument reports for latency work (dev only).
+if settings.PROFILING:
+    app.add_middleware(ProfilingMiddleware)
 
 
 # Add CORS middleware
@@ -131,12 +141,14 @@ app.add_middleware(
 # Include API routes
 app.include_router(auth_router, prefix=settings.API_V1_STR)
 app.include_router(users_router, prefix=settings.API_V1_STR)
-app.include_router(voice_router, prefix=settings.API_V1_STR)
 app.include_router(food_router, prefix=settings.API_V1_STR)
-app.include_router(travel_router, prefix=settings.API_V1_STR)
-app.include_router(social_router, prefix=settings.API_V1_STR)
 app.include_router(onboarding_ws_router, prefix=settings.API_V1_STR)
 app.include_router(agent_ws_router, prefix=settings.API_V1_STR)
+# Unimplemented placeholder routers (see ENABLE_STUB_ROUTES).
+if settings.ENABLE_STUB_ROUTES:
+    app.include_router(voice_router, prefix=settings.API_V1_STR)
+    app.include_router(travel_router, prefix=settings.API_V1_STR)
+    app.include_router(social_router, prefix=settings.API_V1_STR)
 
 
 @app.get("/")
@@ -151,28 +163,22 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    try:
-        # Actually check the services
-        neo4j_status = "connected" if await neo4j_db.is_connected() else "disconnected"
-        redis_status = "connected" if await redis_cache.is_connected() else "disconnected"
-
-        return {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+    """Health check endpoint (503 while Neo4j or Redis is down)"""
+    # No I/O here: the lifespan task refreshes `service_status` every
+    # few seconds, so load-balancer probes never queue behind real traffic.
+    healthy = all(service_status.values())
+    return ORJSONResponse(
+        status_code=200 if healthy else 503,
+        content={
+            "status": "healthy" if healthy else "unhealthy",
+            "timestamp": utc_timestamp(),
             "services": {
-                "neo4j": neo4j_status,
-                "redis": redis_status,
+                "neo4j": "connected" if service_status["neo4j"] else "disconnected",
+                "redis": "connected" if service_status["redis"] else "disconnected",
                 "groq": "available"
             },
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {str(e)}", exc_info=True)
-        return {
-            "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }
+        },
+    )
 
 
 @app.get("/scalar")
@@ -188,17 +194,20 @@ async def get_scalar_docs():
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
     logger.error(
-        f"Unhandled exception: {exc}\n"
-        f"Path: {request.url.path}\n"
-        f"Method: {request.method}\n"
-        f"Headers: {dict(request.headers)}",
-        exc_info=True
+        "Unhandled exception: %s\nPath: %s\nMethod: %s",
+        exc,
+        request.url.path,
+        request.method,
+        exc_info=True,
     )
-    return JSONResponse(
+    # Copying the headers is only worth it when DEBUG output is wanted.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Unhandled exception headers: %s", dict(request.headers))
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_timestamp()
         }
     )
 
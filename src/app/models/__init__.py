@@ -1,3 +1,64 @@
 """
 Data models and schemas
 """
+
+# neomodel's connection is configured once here, before any model module
+# loads. Naming the database explicitly spares the driver a home-database
+# lookup when it opens sessions.
+import logging
+
+from neomodel import config as _neomodel_config
+
+from src.app.core.config import settings as _settings
+
+_neomodel_config.DATABASE_URL = _settings.DATABASE_URL
+_neomodel_config.DATABASE_NAME = _settings.NEO4J_DATABASE
+_neomodel_config.MAX_CONNECTION_POOL_SIZE = _settings.NEO4J_POOL_SIZE
+_neomodel_config.CONNECTION_ACQUISITION_TIMEOUT = (
+    _settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+)
+_neomodel_config.MAX_CONNECTION_LIFETIME = _settings.NEO4J_MAX_CONNECTION_LIFETIME
+_neomodel_config.KEEP_ALIVE = True
+
+logger = logging.getLogger(__name__)
+
+
+class _LogStream:
+    """File-like sink that sends neomodel's progress lines to the logger."""
+
+    def write(self, text: str) -> int:
+        for line in text.splitlines():
+            if line.strip():
+                logger.debug("%s", line.strip())
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def install_model_labels() -> None:
+    """Create the indexes/constraints declared on every node class.
+
+    Idempotent and blocking; called once from the app lifespan (in a worker
+    thread) so the first queries after a cold start don't race schema
+    creation.
+    """
+    from neomodel import db
+
+    # Importing the models registers every StructuredNode subclass;
+    # `user` pulls in location, hotel, restaurant and order.
+    from src.app.models import menuitem, user  # noqa: F401
+
+    # neomodel prints its progress to sys.stdout unless given a stream.
+    db.install_all_labels(stdout=_LogStream())
+
+
+def close_model_connection() -> None:
+    """Close neomodel's driver and its pooled connections (blocking).
+
+    Called from the app lifespan on shutdown; the startup label install
+    is what opens (and warms) the pool.
+    """
+    from neomodel import db
+
+    db.close_connection()
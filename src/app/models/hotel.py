@@ -6,33 +6,29 @@ Hotel and accommodation data structures
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
-import uuid
+from src.app.utils.clock import now_utc
 
 # --- Graph Node and Relationship Models (from schema.py) ---
 from neomodel import (
-    config,
     StructuredNode,
     StringProperty,
     IntegerProperty,
     FloatProperty,
     BooleanProperty,
     ArrayProperty,
-    UniqueIdProperty,
     DateTimeProperty,
     RelationshipTo,
 )
 
 # Import shared relationship models from user.py
+from src.app.models.ids import TimeOrderedIdProperty, uuid7
 from src.app.models.relationships import StayedRel, RatingRel
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
 
 
 class Hotel(StructuredNode):
     """Hotel data model"""
 
-    hotel_id: str = UniqueIdProperty()
+    hotel_id: str = TimeOrderedIdProperty()
     name: str = StringProperty(required=True, index=True)
     address: str
     latitude: float
@@ -82,7 +78,7 @@ class Hotel(StructuredNode):
 class HotelBooking(BaseModel):
     """Hotel booking data model"""
 
-    booking_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    booking_id: str = Field(default_factory=lambda: str(uuid7()))
     user_id: str
     hotel_id: str
     check_in_date: date
@@ -94,8 +90,8 @@ class HotelBooking(BaseModel):
     currency: str = "USD"
     booking_status: str = "pending"
     confirmation_number: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
+    updated_at: datetime = Field(default_factory=now_utc)
 
 
 class TravelContext(BaseModel):
@@ -111,5 +107,5 @@ class TravelContext(BaseModel):
     cultural_interests: List[str] = []
     budget_constraints: Optional[Dict[str, float]] = None
     travel_companions: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
+    updated_at: datetime = Field(default_factory=now_utc)
@@ -0,0 +1,41 @@
+"""
+Time-ordered identifiers (UUIDv7) for node keys.
+
+Random uuid4 keys land all over the unique index's B-tree, so every insert
+touches a cold page. UUIDv7 puts a millisecond timestamp in the leading
+bits, so new keys sort after existing ones and inserts stay append-mostly.
+The values keep the uuid4 formats already stored (32-char hex for node
+ids, canonical 36-char strings elsewhere), so old and new ids coexist.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from typing import Any
+
+from neomodel import UniqueIdProperty
+
+
+def uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: 48-bit Unix ms timestamp, then 74 random bits.
+
+    Ids minted within the same millisecond are not ordered among
+    themselves; that's fine for index locality.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    value &= ~(0xF << 76)  # version
+    value |= 0x7 << 76
+    value &= ~(0x3 << 62)  # variant
+    value |= 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+class TimeOrderedIdProperty(UniqueIdProperty):
+    """``UniqueIdProperty`` whose default is a UUIDv7 (hex) instead of uuid4."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.default = lambda: uuid7().hex
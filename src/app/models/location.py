@@ -4,7 +4,6 @@ Graph node and relationship model for locations (neomodel)
 """
 
 from neomodel import (
-    config,
     StructuredNode,
     StructuredRel,
     StringProperty,
@@ -16,9 +15,6 @@ from neomodel import (
     RelationshipTo,
 )
 from src.app.models.relationships import DistanceRel
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
 
 
 class Location(StructuredNode):
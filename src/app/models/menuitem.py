@@ -4,7 +4,6 @@ Graph node and relationship model for menu items (neomodel)
 """
 
 from neomodel import (
-    config,
     StructuredNode,
     StructuredRel,
     StringProperty,
@@ -17,9 +16,6 @@ from neomodel import (
 )
 from datetime import datetime
 from src.app.models.relationships import OrderItemRel
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
 
 
 class MenuItem(StructuredNode):
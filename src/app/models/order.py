@@ -3,25 +3,24 @@ Order Model
 Graph node for orders (neomodel)
 """
 
+from typing import Any, Dict, List, Optional
+
 from neomodel import (
-    config,
     StructuredNode,
     StringProperty,
     FloatProperty,
-    UniqueIdProperty,
     DateTimeProperty,
     RelationshipFrom,
     RelationshipTo,
+    db,
 )
 from datetime import datetime
+from src.app.models.ids import TimeOrderedIdProperty
 from src.app.models.relationships import OrderItemRel
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
 
 
 class Order(StructuredNode):
-    order_id: str = UniqueIdProperty()
+    order_id: str = TimeOrderedIdProperty()
     order_date: datetime = DateTimeProperty(default_now=True)
     total_amount: float | None = FloatProperty()
     status: str | None = StringProperty(
@@ -37,3 +36,36 @@ class Order(StructuredNode):
     user = RelationshipFrom("User", "PLACED_ORDER")
     restaurant = RelationshipTo("Restaurant", "FROM_RESTAURANT")
     items = RelationshipTo("MenuItem", "CONTAINS")
+
+
+# --- Single-round-trip reads -----------------------------------------------
+#
+# `user.orders.all()` inflates every Order the user ever placed, with no
+# ordering or limit pushed to Neo4j. These traverse, sort, limit and
+# project in one query and return plain dicts. Sync: call via
+# `run_in_thread`.
+
+_ORDER_PROJECTION = (
+    "o {.order_id, .status, .total_amount, .order_date, "
+    ".restaurant_name, .dish_name}"
+)
+_ORDERS_FOR_USER = (
+    "MATCH (:User {uid: $uid})-[:PLACED_ORDER]->(o:Order) "
+    f"RETURN {_ORDER_PROJECTION} ORDER BY o.order_date DESC LIMIT $limit"
+)
+_ORDER_FOR_USER = (
+    "MATCH (:User {uid: $uid})-[:PLACED_ORDER]->(o:Order {order_id: $order_id}) "
+    f"RETURN {_ORDER_PROJECTION} LIMIT 1"
+)
+
+
+def list_orders_for_user(uid: str, limit: int) -> List[Dict[str, Any]]:
+    """Newest-first projections of the User's orders (at most ``limit``)."""
+    rows, _ = db.cypher_query(_ORDERS_FOR_USER, {"uid": uid, "limit": limit})
+    return [row[0] for row in rows]
+
+
+def get_order_for_user(uid: str, order_id: str) -> Optional[Dict[str, Any]]:
+    """Projection of the User's order ``order_id``, or None."""
+    rows, _ = db.cypher_query(_ORDER_FOR_USER, {"uid": uid, "order_id": order_id})
+    return rows[0][0] if rows else None
@@ -1,5 +1,4 @@
 from neomodel import (
-    config,
     StructuredRel,
     StringProperty,
     IntegerProperty,
@@ -9,9 +8,6 @@ from neomodel import (
     ArrayProperty,
 )
 from datetime import datetime
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
 
 
 class VisitedRel(StructuredRel):
@@ -6,18 +6,16 @@ Restaurant and food data structures
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, time
-import uuid
+from src.app.utils.clock import now_utc
 
 # --- Graph Node and Relationship Models (from schema.py) ---
 from neomodel import (
-    config,
     StructuredNode,
     StringProperty,
     IntegerProperty,
     FloatProperty,
     BooleanProperty,
     ArrayProperty,
-    UniqueIdProperty,
     DateTimeProperty,
     RelationshipTo,
     JSONProperty,
@@ -25,6 +23,7 @@ from neomodel import (
 from datetime import datetime
 
 # Import shared relationship models from user.py
+from src.app.models.ids import TimeOrderedIdProperty, uuid7
 from src.app.models.relationships import (
     RatingRel,
     SimilarityRel,
@@ -32,13 +31,10 @@ from src.app.models.relationships import (
     DislikesRel,
     VisitedRel,
 )
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
 
 
 class Restaurant(StructuredNode):
-    restaurant_id: str = UniqueIdProperty()
+    restaurant_id: str = TimeOrderedIdProperty()
     name: str = StringProperty(required=True, index=True)
     description: str | None = StringProperty()
 
@@ -68,10 +64,10 @@ class Restaurant(StructuredNode):
     similar_to = RelationshipTo("Restaurant", "SIMILAR_TO", model=SimilarityRel)
 
 
-class Restaurant(BaseModel):
-    """Restaurant data model"""
+class RestaurantDTO(BaseModel):
+    """Restaurant data model (API/provider payloads; the graph node is `Restaurant`)"""
 
-    restaurant_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    restaurant_id: str = Field(default_factory=lambda: str(uuid7()))
     name: str
     cuisine_types: List[str] = []
     cultural_background: List[str] = []
@@ -88,14 +84,14 @@ class Restaurant(BaseModel):
     google_place_id: Optional[str] = None
     external_ids: Dict[str, str] = {}
     data_quality_score: float = 0.0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
+    updated_at: datetime = Field(default_factory=now_utc)
 
 
 class MenuItem(BaseModel):
     """Menu item data model"""
 
-    item_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    item_id: str = Field(default_factory=lambda: str(uuid7()))
     restaurant_id: str
     name: str
     description: str
@@ -122,16 +118,25 @@ class RestaurantAvailability(BaseModel):
     delivery_available: bool = True
     pickup_available: bool = True
     special_notes: Optional[str] = None
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=now_utc)
+
+
+class OrderItem(BaseModel):
+    """One line of a food order (mirrors `OrderItemRel`)"""
+
+    item_id: str
+    quantity: int = Field(1, ge=1)
+    unit_price: Optional[float] = None
+    special_instructions: Optional[str] = None
 
 
 class FoodOrder(BaseModel):
     """Food order data model"""
 
-    order_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    order_id: str = Field(default_factory=lambda: str(uuid7()))
     user_id: str
     restaurant_id: str
-    items: List[Dict[str, Any]] = []
+    items: List[OrderItem] = []
     total_amount: float
     currency: str = "USD"
     order_type: str = "delivery"  # delivery, pickup
@@ -139,5 +144,5 @@ class FoodOrder(BaseModel):
     special_instructions: Optional[str] = None
     order_status: str = "pending"
     estimated_delivery_time: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
+    updated_at: datetime = Field(default_factory=now_utc)
@@ -6,18 +6,22 @@ Session and interaction data structures
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from src.app.utils.clock import now_utc
 import uuid
 
-# NOTE: Setting `neomodel.config.DATABASE_URL` belongs in the database
-# bootstrap (`src/app/core/database.py`), not in a model module. The previous
-# line here referenced an undefined `config` name and crashed the module on
-# import; it's been removed.
+from src.app.models.ids import uuid7
+
+# NOTE: `neomodel.config` is set once in `src/app/models/__init__.py`, not
+# per model module. The previous line here referenced an undefined `config`
+# name and crashed the module on import; it's been removed.
 
 
 class UserSession(BaseModel):
     """User session data model"""
 
-    session_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # Session ids are bearer-like, so they stay fully random (uuid4);
+    # record ids below are time-ordered (uuid7) for index locality.
+    session_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     is_authenticated: bool = False
     current_agent: Optional[str] = None
@@ -25,15 +29,15 @@ class UserSession(BaseModel):
     context_data: Dict[str, Any] = {}
     location: Optional[Dict[str, Any]] = None
     device_info: Dict[str, str] = {}
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    last_activity: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
+    last_activity: datetime = Field(default_factory=now_utc)
     expires_at: Optional[datetime] = None
 
 
 class VoiceInteraction(BaseModel):
     """Voice interaction data model"""
 
-    interaction_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    interaction_id: str = Field(default_factory=lambda: str(uuid7()))
     session_id: str
     user_id: str
     agent_name: str
@@ -45,20 +49,20 @@ class VoiceInteraction(BaseModel):
     confidence_score: float = 0.0
     cultural_context: Dict[str, Any] = {}
     health_flags: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
 
 
 class AudioSession(BaseModel):
     """Audio processing session model for alternative architecture"""
 
-    session_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     audio_url: str
     status: str = "processing"  # processing, completed, failed
     transcription: Optional[str] = None
     agent_response: Optional[str] = None
     processing_metadata: Dict[str, Any] = {}
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
     completed_at: Optional[datetime] = None
     expires_at: Optional[datetime] = None
 
@@ -66,7 +70,7 @@ class AudioSession(BaseModel):
 class AgentInteraction(BaseModel):
     """Agent interaction data model"""
 
-    interaction_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    interaction_id: str = Field(default_factory=lambda: str(uuid7()))
     session_id: str
     user_id: str
     agent_name: str
@@ -78,13 +82,13 @@ class AgentInteraction(BaseModel):
     processing_time: Optional[float] = None
     context_used: Dict[str, Any] = {}
     feedback: Optional[Dict[str, Any]] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
 
 
 class VoiceAuthSession(BaseModel):
     """Voice authentication session"""
 
-    auth_session_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    auth_session_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: Optional[str] = None
     challenge_sentence: str
     challenge_sent_at: datetime
@@ -94,5 +98,5 @@ class VoiceAuthSession(BaseModel):
     attempts_count: int = 0
     max_attempts: int = 3
     expires_at: datetime
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
     completed_at: Optional[datetime] = None
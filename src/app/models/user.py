@@ -11,32 +11,33 @@ User data structures and graph models (now using neomodel)
 # All persistence and queries should use the neomodel User class.
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
-import uuid
+from src.app.utils.clock import now_utc
 
 # --- Graph Node and Relationship Models (from schema.py) ---
 from neomodel import (
-    config,
     StructuredNode,
-    StructuredRel,
     StringProperty,
     IntegerProperty,
     FloatProperty,
     BooleanProperty,
     ArrayProperty,
-    UniqueIdProperty,
     DateTimeProperty,
     EmailProperty,
     RelationshipTo,
     RelationshipFrom,
     JSONProperty,
+    StructuredRel,
+    UniqueIdProperty,
+    db,
 )
 
 from src.app.models.location import Location
 from src.app.models.hotel import Hotel
 from src.app.models.restaurant import Restaurant
 from src.app.models.order import Order
+from src.app.models.ids import TimeOrderedIdProperty, uuid7
 from src.app.models.relationships import (
     VisitedRel,
     StayedRel,
@@ -45,16 +46,17 @@ from src.app.models.relationships import (
     RatingRel,
     FriendsRel,
 )
-from src.app.core.config import settings
-
-config.DATABASE_URL = settings.DATABASE_URL
+from src.app.core.user_cache import user_cache
 
 
 class User(StructuredNode):
-    uid: str = UniqueIdProperty()
+    uid: str = TimeOrderedIdProperty()
     email: str = EmailProperty(unique_index=True, required=True)
     username: str | None = StringProperty(unique_index=True)
     password_hash: str = StringProperty(required=True)  # Argon2 hashed password
+    # Stamped into every JWT as `ver`; bumping it revokes all of the
+    # user's outstanding tokens at once (see `SecurityManager`).
+    token_version: int = IntegerProperty(default=0)
 
     # Profile
     first_name: str = StringProperty(required=True)
@@ -103,10 +105,212 @@ class User(StructuredNode):
     orders = RelationshipTo("Order", "PLACED_ORDER")
 
 
+# --- Single-round-trip lookups ---------------------------------------------
+#
+# `User.nodes.filter(...).first()` goes through the NodeSet query builder
+# (ORDER BY + LIMIT) on every call. These issue one parameterized MATCH on
+# a property backed by a unique constraint (see `core/database.py`), so
+# Neo4j resolves them with an index seek. Sync, like the rest of neomodel:
+# call them via `run_in_thread` from async code.
+
+_USER_BY_UID = "MATCH (u:User {uid: $uid}) RETURN u LIMIT 1"
+_USER_BY_EMAIL = "MATCH (u:User {email: $email}) RETURN u LIMIT 1"
+
+
+def get_user_by_uid(uid: str) -> Optional[User]:
+    """Return the User with ``uid``, or None."""
+    rows, _ = db.cypher_query(_USER_BY_UID, {"uid": uid})
+    return User.inflate(rows[0][0]) if rows else None
+
+
+def get_user_by_email(email: str) -> Optional[User]:
+    """Return the User with ``email``, or None."""
+    rows, _ = db.cypher_query(_USER_BY_EMAIL, {"email": email})
+    return User.inflate(rows[0][0]) if rows else None
+
+
+# Onboarding reads a fixed subset of profile fields; project just those
+# instead of inflating the whole node (password hash, timestamps, ...).
+_ONBOARDING_PROFILE_PROJECTION = (
+    "u {.email, .first_name, .last_name, .username, .phone, .age, "
+    ".dietary_restrictions, .cuisine_preferences, .price_range, .is_tourist, "
+    ".cultural_background, .food_allergies, .spice_tolerance, "
+    ".preferred_languages, .is_onboarded}"
+)
+_ONBOARDING_PROFILE_BY_EMAIL = (
+    "MATCH (u:User {email: $email}) "
+    f"RETURN {_ONBOARDING_PROFILE_PROJECTION} LIMIT 1"
+)
+# Write-then-read in one statement: the projection sees the SET.
+_UPDATE_ONBOARDING_PROFILE_BY_EMAIL = (
+    "MATCH (u:User {email: $email}) SET u += $props "
+    f"RETURN {_ONBOARDING_PROFILE_PROJECTION} LIMIT 1"
+)
+
+_UPDATE_USER_BY_EMAIL = (
+    "MATCH (u:User {email: $email}) SET u += $props RETURN count(u)"
+)
+
+_TOKEN_VERSION_BY_UID = (
+    "MATCH (u:User {uid: $uid}) RETURN coalesce(u.token_version, 0) LIMIT 1"
+)
+_BUMP_TOKEN_VERSION_BY_UID = (
+    "MATCH (u:User {uid: $uid}) "
+    "SET u.token_version = coalesce(u.token_version, 0) + 1 "
+    "RETURN u.token_version"
+)
+
+
+def _deflate_partial(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Deflate a partial property dict through the User model definitions."""
+    props = User.defined_properties(aliases=False, rels=False)
+    return {
+        name: None if value is None else props[name].deflate(value)
+        for name, value in values.items()
+        if name in props and name != "uid"
+    }
+
+
+def get_onboarding_profile(email: str) -> Optional[Dict[str, Any]]:
+    """Return the onboarding-relevant properties of a User as a dict, or None."""
+    rows, _ = db.cypher_query(_ONBOARDING_PROFILE_BY_EMAIL, {"email": email})
+    return rows[0][0] if rows else None
+
+
+def update_user_by_email(email: str, values: Dict[str, Any]) -> bool:
+    """Apply a partial update to the User with ``email`` in one round trip.
+
+    Values go through the model's property deflation (so `choices` and type
+    checks still apply); unknown keys are ignored and ``None`` clears the
+    property. Returns False if no such user exists.
+    """
+    rows, _ = db.cypher_query(
+        _UPDATE_USER_BY_EMAIL, {"email": email, "props": _deflate_partial(values)}
+    )
+    user_cache.invalidate_email(email)
+    return bool(rows and rows[0][0])
+
+
+def update_onboarding_profile(
+    email: str, values: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """`update_user_by_email` + `get_onboarding_profile` in one round trip.
+
+    Returns the post-update onboarding projection, or None if no such user.
+    """
+    rows, _ = db.cypher_query(
+        _UPDATE_ONBOARDING_PROFILE_BY_EMAIL,
+        {"email": email, "props": _deflate_partial(values)},
+    )
+    user_cache.invalidate_email(email)
+    return rows[0][0] if rows else None
+
+
+def get_token_version(uid: str) -> Optional[int]:
+    """Return the User's current token version, or None if no such user."""
+    rows, _ = db.cypher_query(_TOKEN_VERSION_BY_UID, {"uid": uid})
+    return rows[0][0] if rows else None
+
+
+def bump_token_version(uid: str) -> Optional[int]:
+    """Atomically increment the User's token version; returns the new value.
+
+    Returns None if no such user exists.
+    """
+    rows, _ = db.cypher_query(_BUMP_TOKEN_VERSION_BY_UID, {"uid": uid})
+    user_cache.invalidate(uid)
+    return rows[0][0] if rows else None
+
+
+# --- Batched relationship writes ------------------------------------------
+#
+# `user.visited_restaurants.connect(r, props)` costs a round trip per edge.
+# `bulk_connect` MERGEs a whole batch of edges for one of the User
+# relationships with a single UNWIND statement. Edge properties go through
+# the relationship model (defaults, choices, deflation) just as in
+# `connect`; re-connecting an existing edge updates its properties.
+
+
+def _rel_target(relationship: str) -> Tuple[str, str, str, Any]:
+    """(relation type, target label, target key property, rel model).
+
+    Relationships declared without a ``model`` use plain ``StructuredRel``
+    edges, as neomodel's own ``connect`` does.
+    """
+    definition = User.defined_properties(
+        aliases=False, properties=False, rels=True
+    ).get(relationship)
+    if definition is None:
+        raise ValueError(f"User has no relationship {relationship!r}")
+    definition.lookup_node_class()
+    target = definition.definition["node_class"]
+    key = next(
+        (
+            name
+            for name, prop in target.defined_properties(
+                aliases=False, rels=False
+            ).items()
+            if isinstance(prop, UniqueIdProperty)
+        ),
+        None,
+    )
+    if key is None:
+        raise ValueError(
+            f"User.{relationship} targets {target.__name__}, which has no "
+            "unique id property to match rows on"
+        )
+    return (
+        definition.definition["relation_type"],
+        target.__label__,
+        key,
+        definition.definition["model"] or StructuredRel,
+    )
+
+
+def bulk_connect(
+    relationship: str,
+    rows: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+) -> int:
+    """MERGE many ``User.<relationship>`` edges in one round trip.
+
+    ``relationship`` names a User relationship whose target node has a
+    unique id (``"visited_restaurants"``, ``"likes"``, ``"friends"``,
+    ``"follows"``, ``"orders"``, ...); the Location relationships don't
+    and raise ValueError. Each row is
+    ``(user uid, target id, edge properties or None)``, the target id
+    being the target node's unique id (``restaurant_id``, ``uid``, ...).
+    Rows whose endpoints don't exist are skipped. Returns the number of
+    edges merged.
+    """
+    rel_type, label, key, model = _rel_target(relationship)
+    params = []
+    for uid, target_id, props in rows:
+        edge = model(**(props or {}))
+        deflated = model.deflate(edge.__properties__)
+        params.append(
+            {
+                "uid": uid,
+                "target": target_id,
+                "props": {k: v for k, v in deflated.items() if v is not None},
+            }
+        )
+    if not params:
+        return 0
+    rows_out, _ = db.cypher_query(
+        "UNWIND $rows AS row "
+        "MATCH (u:User {uid: row.uid}) "
+        f"MATCH (t:{label} {{{key}: row.target}}) "
+        f"MERGE (u)-[r:{rel_type}]->(t) SET r += row.props "
+        "RETURN count(r)",
+        {"rows": params},
+    )
+    return rows_out[0][0] if rows_out else 0
+
+
 class UserProfile(BaseModel):
     """User profile data model"""
 
-    user_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str = Field(default_factory=lambda: str(uuid7()))
     email: str
     cultural_background: List[str] = []
     dietary_restrictions: List[str] = []
@@ -116,8 +320,8 @@ class UserProfile(BaseModel):
     preferred_languages: List[str] = ["en"]
     location: Optional[Dict[str, Any]] = None
     voice_profile: Optional[Dict[str, Any]] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
+    updated_at: datetime = Field(default_factory=now_utc)
     is_onboarded: bool = Field(default=False, alias="isOnboarded")
 
 
@@ -130,7 +334,7 @@ class VoiceProfile(BaseModel):
     language_preferences: List[str] = []
     cultural_voice_markers: Dict[str, Any] = {}
     verification_accuracy: float = 0.0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=now_utc)
     last_verified_at: Optional[datetime] = None
 
 
@@ -6,6 +6,7 @@ Pydantic models for API requests
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
+from src.app.utils.clock import now_utc
 
 
 class VoiceProcessingRequest(BaseModel):
@@ -47,7 +48,7 @@ class LocationUpdateRequest(BaseModel):
     latitude: float
     longitude: float
     accuracy: Optional[float] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=now_utc)
 
 
 class PreferenceUpdateRequest(BaseModel):
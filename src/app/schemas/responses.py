@@ -6,6 +6,7 @@ Pydantic models for API responses
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from src.app.utils.clock import now_utc
 
 
 class BaseResponse(BaseModel):
@@ -13,7 +14,7 @@ class BaseResponse(BaseModel):
 
     success: bool = True
     message: str = "Operation completed successfully"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=now_utc)
 
 
 class VoiceProcessingResponse(BaseResponse):
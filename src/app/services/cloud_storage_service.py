@@ -3,7 +3,7 @@ Cloud Storage Service
 Handles cloud storage operations for audio files
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,8 +17,10 @@ class CloudStorageService:
     def __init__(self):
         self.logger = logging.getLogger("service.cloud_storage")
 
-    async def upload_audio(self, audio_data: bytes, file_name: str) -> str:
-        """Upload audio file to cloud storage"""
+    async def upload_audio(
+        self, audio_data: Union[bytes, bytearray, memoryview], file_name: str
+    ) -> str:
+        """Upload audio file to cloud storage (any bytes-like, uncopied)"""
         # Implementation will be added
         pass
 
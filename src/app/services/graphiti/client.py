@@ -25,6 +25,7 @@ should be rare and limited to admin / migration scripts.
 from __future__ import annotations
 
 import logging
+import time
 from functools import lru_cache
 from typing import Optional
 
@@ -42,6 +43,10 @@ logger = logging.getLogger(__name__)
 _VALID_LLM_PROVIDERS = {"gemini", "openai", "groq"}
 _VALID_EMBEDDER_PROVIDERS = {"gemini", "openai"}  # groq has no embeddings
 
+# Consecutive Graphiti failures before calls are skipped, and for how long.
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 30.0
+
 
 # ---------------------------------------------------------------- Builders
 
@@ -146,6 +151,69 @@ def _embedder_credentials_for(provider: str) -> tuple[str, Optional[str]]:
     raise AssertionError("unreachable")
 
 
+# ---------------------------------------------------------- Circuit breaker
+
+
+class CircuitBreaker:
+    """Stop calling Graphiti for a while once it keeps failing.
+
+    After ``threshold`` consecutive failures the breaker opens and
+    :meth:`allow` refuses calls for ``cooldown`` seconds, so a dead Neo4j
+    or LLM provider costs callers nothing instead of a full timeout each.
+    Once the cool-down passes, one trial call is let through (the window
+    is pushed out again meanwhile); success closes the breaker, failure
+    re-opens it. Event-loop only, so no lock.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN_SECONDS,
+    ) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._open_until is not None
+
+    def allow(self) -> bool:
+        """Return False while the breaker is open and cooling down."""
+        if self._open_until is None:
+            return True
+        now = time.monotonic()
+        if now < self._open_until:
+            return False
+        self._open_until = now + self.cooldown
+        return True
+
+    def record_success(self) -> None:
+        if self._open_until is not None:
+            logger.info("Graphiti recovered; closing circuit breaker")
+        self.reset()
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.threshold:
+            if self._open_until is None:
+                logger.warning(
+                    "Graphiti failed %d times in a row; skipping calls for %.0fs",
+                    self._failures,
+                    self.cooldown,
+                )
+            self._open_until = time.monotonic() + self.cooldown
+
+    def reset(self) -> None:
+        self._failures = 0
+        self._open_until = None
+
+
+# Shared by the write contract and the retriever.
+graphiti_breaker = CircuitBreaker()
+
+
 # -------------------------------------------------------- Singleton accessor
 
 
@@ -18,6 +18,7 @@ Every function:
   recognizes domain types when it extracts.
 - Catches and logs Graphiti errors (write failures must NOT break the
   user-facing flow — agents should still respond even if memory failed).
+- Drops the user's cached searches in ``retriever`` once the write lands.
 
 Callers should treat all returns as fire-and-forget unless they need the
 ``AddEpisodeResults`` for follow-up correlations.
@@ -25,15 +26,17 @@ Callers should treat all returns as fire-and-forget unless they need the
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Sequence, Tuple
 
+import orjson
 from graphiti_core.nodes import EpisodeType
+from graphiti_core.utils.bulk_utils import RawEpisode
 
-from .client import get_graphiti
+from .client import get_graphiti, graphiti_breaker
 from .entity_types import ENTITY_TYPES
+from .retriever import invalidate_user_context
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +59,12 @@ async def _add_episode(
     entity_types: Optional[Mapping[str, type]] = None,
 ) -> Optional[Any]:
     """Inner helper. Logs and swallows write errors (never raises to caller)."""
+    if not graphiti_breaker.allow():
+        logger.debug("graphiti breaker open; dropping episode %s for %s", name, user_id)
+        return None
     try:
         g = get_graphiti()
-        return await g.add_episode(
+        result = await g.add_episode(
             name=name,
             episode_body=episode_body,
             source=source,
@@ -68,11 +74,15 @@ async def _add_episode(
             entity_types=dict(entity_types or _DEFAULT_ENTITY_TYPES),
         )
     except Exception:
+        graphiti_breaker.record_failure()
         # Memory write must not break the user-facing flow.
         logger.exception(
             "graphiti.add_episode failed for user_id=%s name=%s", user_id, name
         )
         return None
+    graphiti_breaker.record_success()
+    invalidate_user_context(user_id)
+    return result
 
 
 # ---------------------------------------------------- Public write helpers
@@ -117,7 +127,7 @@ async def record_extracted_facts(
     return await _add_episode(
         user_id=user_id,
         name=f"{agent_name}-facts",
-        episode_body=json.dumps({"extracted": _jsonable(facts)}, default=str),
+        episode_body=_dumps({"extracted": _jsonable(facts)}),
         source=EpisodeType.json,
         source_description=f"{agent_name}_agent.extraction",
     )
@@ -138,7 +148,7 @@ async def record_recommendation(
     return await _add_episode(
         user_id=user_id,
         name=f"{agent_name}-recommendation",
-        episode_body=json.dumps(body, default=str),
+        episode_body=_dumps(body),
         source=EpisodeType.json,
         source_description=f"{agent_name}_agent.recommendation",
     )
@@ -159,7 +169,7 @@ async def record_visit(
     return await _add_episode(
         user_id=user_id,
         name=f"{agent_name}-visit",
-        episode_body=json.dumps(body, default=str),
+        episode_body=_dumps(body),
         source=EpisodeType.json,
         source_description=f"{agent_name}_agent.visit",
     )
@@ -185,17 +195,84 @@ async def record_user_event(
     return await _add_episode(
         user_id=user_id,
         name=f"{agent_name}-{event_type}",
-        episode_body=json.dumps(body, default=str),
+        episode_body=_dumps(body),
         source=EpisodeType.json,
         source_description=f"{agent_name}.{event_type}",
     )
 
 
+async def record_user_events(
+    user_id: str,
+    events: Sequence[Tuple[str, Optional[Mapping[str, Any]]]],
+    *,
+    agent_name: str = "auth",
+) -> Optional[Any]:
+    """Record several audit-style events in one Graphiti bulk write.
+
+    ``events`` is a sequence of ``(event_type, payload)`` pairs, encoded
+    exactly as :func:`record_user_event` would. Meant for bursts (imports,
+    replays) where one ``add_episode`` per event would serialise a full
+    extraction round trip each. Note that Graphiti's bulk path skips edge
+    invalidation, so prefer the single-event helper for live traffic.
+    """
+    if not events:
+        return None
+    reference_time = datetime.utcnow()
+    episodes = [
+        RawEpisode(
+            name=f"{agent_name}-{event_type}",
+            content=_dumps(
+                {"event_type": event_type, "data": _jsonable(payload or {})}
+            ),
+            source=EpisodeType.json,
+            source_description=f"{agent_name}.{event_type}",
+            reference_time=reference_time,
+        )
+        for event_type, payload in events
+    ]
+    if not graphiti_breaker.allow():
+        logger.debug(
+            "graphiti breaker open; dropping %d events for %s", len(episodes), user_id
+        )
+        return None
+    try:
+        g = get_graphiti()
+        result = await g.add_episode_bulk(
+            episodes,
+            group_id=user_id,
+            entity_types=dict(_DEFAULT_ENTITY_TYPES),
+        )
+    except Exception:
+        graphiti_breaker.record_failure()
+        # Same rule as single writes: never break the caller.
+        logger.exception(
+            "graphiti.add_episode_bulk failed for user_id=%s (%d events)",
+            user_id,
+            len(episodes),
+        )
+        return None
+    graphiti_breaker.record_success()
+    invalidate_user_context(user_id)
+    return result
+
+
 # ---------------------------------------------------------------- Helpers
 
 
+def _dumps(body: Any) -> str:
+    """Encode an episode body with orjson.
+
+    Anything orjson can't encode natively falls back to ``str``, and
+    non-string dict keys are stringified, matching the old
+    ``json.dumps(..., default=str)`` behaviour.
+    """
+    return orjson.dumps(
+        body, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 def _jsonable(value: Any) -> Any:
-    """Make a value safe for `json.dumps` via the default=str fallback.
+    """Make a value safe for `_dumps` via the default=str fallback.
 
     Dates, neomodel nodes, etc. all coerce cleanly with default=str —
     this is here mainly to drop pydantic v2 model instances down to dicts.
@@ -19,12 +19,14 @@ system prompt builder to drop the whole thing in with a uniform format.
 from __future__ import annotations
 
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from graphiti_core.edges import EntityEdge
 
-from .client import get_graphiti
+from .client import get_graphiti, graphiti_breaker
 from .entity_types import RELEVANT_BY_INTENT
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,17 @@ logger = logging.getLogger(__name__)
 # response time matters.
 DEFAULT_NUM_RESULTS = 8
 
+# Search results are reused for this long per (user, query, top-K), for
+# callers that opt in with ``cache=True``. Those pass a fixed query per
+# intent (profile snapshots, MemoryService.get_user_context), so the key is
+# effectively user + intent; agent turns search on the user's utterance,
+# which almost never repeats, and skip the cache. Every write through
+# ``contract`` drops the user's entries on this worker; other workers may
+# serve results up to the TTL old.
+SEARCH_CACHE_TTL_SECONDS = 30.0
+SEARCH_CACHE_MAX_USERS = 1024
+SEARCH_CACHE_MAX_PER_USER = 16
+
 
 @dataclass
 class ContextBundle:
@@ -141,6 +154,105 @@ class ContextBundle:
         return bundle
 
 
+# ---------------------------------------------------------- Search cache
+
+
+# Cached searches for one user: (query, top-K) -> (expires_at, edges).
+_UserSearches = OrderedDict[Tuple[str, int], Tuple[float, List[EntityEdge]]]
+
+
+class _SearchCache:
+    """Per-user TTL cache of raw ``graphiti.search`` edges.
+
+    Entries are grouped by user so a write can drop all of that user's
+    searches at once; users are evicted LRU past ``max_users`` and each
+    user's searches LRU past ``max_per_user``. Write
+    generations stop a search that was in flight during a write from
+    caching its pre-write result. Event-loop only, so no lock.
+    """
+
+    def __init__(
+        self,
+        ttl: float = SEARCH_CACHE_TTL_SECONDS,
+        max_users: int = SEARCH_CACHE_MAX_USERS,
+        max_per_user: int = SEARCH_CACHE_MAX_PER_USER,
+    ) -> None:
+        self.ttl = ttl
+        self.max_users = max_users
+        self.max_per_user = max_per_user
+        self._entries: "OrderedDict[str, _UserSearches]" = OrderedDict()
+        self._writes: Dict[str, int] = {}
+        # Bumped whenever `_writes` is reset, so older snapshots never match.
+        self._epoch = 0
+
+    def generation(self, user_id: str) -> Tuple[int, int]:
+        return self._epoch, self._writes.get(user_id, 0)
+
+    def get(
+        self, user_id: str, query: str, num_results: int
+    ) -> Optional[List[EntityEdge]]:
+        searches = self._entries.get(user_id)
+        if searches is None:
+            return None
+        entry = searches.get((query, num_results))
+        if entry is None:
+            return None
+        expires_at, edges = entry
+        if time.monotonic() >= expires_at:
+            del searches[(query, num_results)]
+            return None
+        searches.move_to_end((query, num_results))
+        self._entries.move_to_end(user_id)
+        return edges
+
+    def put(
+        self,
+        user_id: str,
+        query: str,
+        num_results: int,
+        edges: List[EntityEdge],
+        generation: Tuple[int, int],
+    ) -> None:
+        if generation != self.generation(user_id):
+            return
+        now = time.monotonic()
+        searches = self._entries.get(user_id)
+        if searches is None:
+            searches = self._entries[user_id] = OrderedDict()
+        else:
+            # Queries are free text, so drop expired ones rather than
+            # waiting for an identical lookup that may never come.
+            for key in [k for k, (exp, _) in searches.items() if now >= exp]:
+                del searches[key]
+        key = (query, num_results)
+        searches[key] = (now + self.ttl, edges)
+        searches.move_to_end(key)
+        while len(searches) > self.max_per_user:
+            searches.popitem(last=False)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+        self._writes[user_id] = self._writes.get(user_id, 0) + 1
+        if len(self._writes) > 4 * self.max_users:
+            self.clear()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._writes.clear()
+        self._epoch += 1
+
+
+_search_cache = _SearchCache()
+
+
+def invalidate_user_context(user_id: str) -> None:
+    """Forget cached searches for ``user_id`` (called after every write)."""
+    _search_cache.invalidate(user_id)
+
+
 # ----------------------------------------------------------- Public API
 
 
@@ -151,6 +263,7 @@ async def get_relevant_context(
     kinds: Optional[Iterable[str]] = None,
     intent: str = "default",
     num_results: int = DEFAULT_NUM_RESULTS,
+    cache: bool = False,
 ) -> ContextBundle:
     """Search Graphiti for context relevant to ``query`` for this user.
 
@@ -167,6 +280,9 @@ async def get_relevant_context(
         intent: an intent label used for default kind selection AND
             as a tag on the bundle.
         num_results: top-K from Graphiti search. Default 8.
+        cache: reuse this user's edges for the same query and top-K for
+            up to ``SEARCH_CACHE_TTL_SECONDS``. Only worth it for fixed
+            queries; free-text utterances would just fill the cache.
 
     Returns:
         ContextBundle. On Graphiti error the bundle is empty (we never
@@ -180,23 +296,33 @@ async def get_relevant_context(
         # Substitute a neutral query that pulls top-N for this user.
         query = "user profile preferences"
 
-    try:
-        g = get_graphiti()
-        edges = await g.search(
-            query=query,
-            group_ids=[user_id],
-            num_results=num_results,
-        )
-    except Exception:
-        logger.exception(
-            "graphiti.search failed for user_id=%s intent=%s", user_id, intent
-        )
-        return ContextBundle.empty(user_id=user_id, intent=intent)
+    edges = _search_cache.get(user_id, query, num_results) if cache else None
+    if edges is None:
+        if not graphiti_breaker.allow():
+            return ContextBundle.empty(user_id=user_id, intent=intent)
+        generation = _search_cache.generation(user_id)
+        try:
+            g = get_graphiti()
+            edges = await g.search(
+                query=query,
+                group_ids=[user_id],
+                num_results=num_results,
+            )
+        except Exception:
+            graphiti_breaker.record_failure()
+            logger.exception(
+                "graphiti.search failed for user_id=%s intent=%s", user_id, intent
+            )
+            return ContextBundle.empty(user_id=user_id, intent=intent)
+        graphiti_breaker.record_success()
+        edges = list(edges)
+        if cache:
+            _search_cache.put(user_id, query, num_results, edges, generation)
 
     bundle = ContextBundle.from_edges(user_id=user_id, intent=intent, edges=edges)
 
     # Optional post-filter: drop kinds that aren't relevant for this intent.
-    keep = tuple(kinds) if kinds else RELEVANT_BY_INTENT.get(intent, ())
+    keep = frozenset(kinds or RELEVANT_BY_INTENT.get(intent, ()))
     if keep:
         bundle.by_kind = {k: v for k, v in bundle.by_kind.items() if k in keep}
     return bundle
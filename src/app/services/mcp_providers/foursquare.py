@@ -29,6 +29,7 @@ from typing import Any, Dict, List, Optional
 import aiohttp
 
 from src.app.core.config import settings
+from src.app.core.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,9 @@ logger = logging.getLogger(__name__)
 # Foursquare's Places API "search" endpoint relative path.
 _SEARCH_PATH = "/places/search"
 
+# Per-request timeout; the connection pool itself is the shared session's.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 # Foursquare returns category objects with a numeric id + a name. We
 # want to filter to "Restaurant" and food-related places. The umbrella
 # category id 13000 covers "Dining and Drinking".
@@ -207,19 +211,19 @@ async def search_restaurants(
     )
     url = f"{settings.FOURSQUARE_BASE_URL.rstrip('/')}{_SEARCH_PATH}"
 
-    timeout = aiohttp.ClientTimeout(total=10)
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, params=params, headers=_headers()) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    logger.warning(
-                        "foursquare.search non-200: status=%d body=%s",
-                        resp.status,
-                        body[:300],
-                    )
-                    return []
-                data = await resp.json()
+        async with get_http_session().get(
+            url, params=params, headers=_headers(), timeout=_REQUEST_TIMEOUT
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                logger.warning(
+                    "foursquare.search non-200: status=%d body=%s",
+                    resp.status,
+                    body[:300],
+                )
+                return []
+            data = await resp.json()
     except Exception:
         logger.exception("foursquare.search request failed")
         return []
@@ -242,13 +246,13 @@ async def get_menu_data(restaurant_id: str) -> Dict[str, Any]:
     params = {
         "fields": "fsq_id,name,categories,location,price,rating,description,website,tel,hours"
     }
-    timeout = aiohttp.ClientTimeout(total=10)
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, params=params, headers=_headers()) as resp:
-                if resp.status != 200:
-                    return {}
-                place = await resp.json()
+        async with get_http_session().get(
+            url, params=params, headers=_headers(), timeout=_REQUEST_TIMEOUT
+        ) as resp:
+            if resp.status != 200:
+                return {}
+            place = await resp.json()
     except Exception:
         logger.exception("foursquare.get_menu_data failed for id=%s", restaurant_id)
         return {}
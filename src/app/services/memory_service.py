@@ -16,6 +16,7 @@ once the auth route migration lands.
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
 from typing import Any, Dict, List, Optional
 
 from src.app.models.user import User
@@ -25,6 +26,18 @@ from .graphiti import contract, retriever
 logger = logging.getLogger(__name__)
 
 
+def _with_content(
+    memory_data: Dict[str, Any], metadata: Dict[str, Any]
+) -> ChainMap:
+    """Read-only view of ``metadata`` plus the payload's ``content``.
+
+    Same keys and order as ``{"content": ..., **metadata}`` (metadata wins
+    on clashes) without copying the metadata; the contract flattens it
+    once when encoding.
+    """
+    return ChainMap(metadata, {"content": memory_data.get("content")})
+
+
 class MemoryService:
     """Thin pass-through over the Graphiti contract module."""
 
@@ -49,16 +62,30 @@ class MemoryService:
             await contract.record_user_event(
                 user_id=user_id,
                 event_type=event_type,
-                payload={
-                    "content": memory_data.get("content"),
-                    **metadata,
-                },
+                payload=_with_content(memory_data, metadata),
             )
             return True
         except Exception:
             self.logger.exception("store_user_memory failed for user_id=%s", user_id)
             return False
 
+    async def store_user_memories_batch(
+        self, user_id: str, memories: List[Dict[str, Any]]
+    ) -> bool:
+        """Write several ``store_user_memory``-style payloads in one call."""
+        events = []
+        for memory_data in memories:
+            memory_data = memory_data or {}
+            metadata = memory_data.get("metadata", {})
+            events.append(
+                (
+                    metadata.get("event_type", "user_event"),
+                    _with_content(memory_data, metadata),
+                )
+            )
+        result = await contract.record_user_events(user_id, events)
+        return result is not None or not events
+
     async def store_user_registration(self, user: User) -> bool:
         try:
             await contract.record_user_event(
@@ -132,6 +159,7 @@ class MemoryService:
             user_id=user_id,
             query="recent activity preferences profile",
             intent="profile",
+            cache=True,
         )
         return bundle.to_dict()
 
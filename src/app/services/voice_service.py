@@ -12,6 +12,10 @@ logger = logging.getLogger(__name__)
 class VoiceService:
     """
     Service for voice processing operations
+
+    Blocking work (SDK calls, audio decoding, feature extraction) belongs
+    in `run_in_thread`, like the onboarding agent's transcription, not in
+    a process pool: each worker process would duplicate the app's memory.
     """
 
     def __init__(self):
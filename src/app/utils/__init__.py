@@ -6,6 +6,7 @@ Common utility functions and helpers
 from .validators import validate_email, validate_phone, validate_location
 from .formatters import format_currency, format_datetime, format_response
 from .helpers import generate_session_id, calculate_distance, merge_contexts
+from .clock import now_utc, utc_timestamp
 
 __all__ = [
     "validate_email",
@@ -17,4 +18,6 @@ __all__ = [
     "generate_session_id",
     "calculate_distance",
     "merge_contexts",
+    "now_utc",
+    "utc_timestamp",
 ]
@@ -0,0 +1,41 @@
+"""
+Clock
+Timezone-aware "now" for model timestamp defaults, and the UTC timestamp
+string used in API and WebSocket payloads
+"""
+
+import time
+from datetime import datetime, timezone
+
+
+def now_utc() -> datetime:
+    """
+    Current UTC time as an aware datetime.
+
+    Replacement for the deprecated ``datetime.utcnow()``, which returns a
+    naive value that serializes without an offset.
+    """
+    return datetime.now(timezone.utc)
+
+
+# Whole-second prefix of the last timestamp rendered; timestamps taken
+# within the same second only format the fractional part.
+_ts_second = -1
+_ts_prefix = ""
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as ISO-8601 with microseconds, for response payloads.
+
+    Same string ``datetime.utcnow().isoformat()`` gives (always with the
+    fractional part), but the date/time formatting runs once per second
+    rather than once per call.
+    """
+    global _ts_second, _ts_prefix
+    now = time.time()
+    second = int(now)
+    if second != _ts_second:
+        _ts_second = second
+        _ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    return f"{_ts_prefix}.{int((now - second) * 1_000_000):06d}"
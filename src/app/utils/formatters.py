@@ -3,25 +3,35 @@ Formatters
 Output formatting utilities
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 import json
+import re
+
+
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+    "CAD": "C$",
+    "AUD": "A$",
+}
+
+_DATETIME_FORMATS = {
+    "standard": "%Y-%m-%d %H:%M:%S",
+    "date_only": "%Y-%m-%d",
+    "time_only": "%H:%M:%S",
+    "human": "%B %d, %Y at %I:%M %p",
+    "iso": "%Y-%m-%dT%H:%M:%SZ",
+}
 
 
 def format_currency(amount: float, currency: str = "USD") -> str:
     """
     Format currency amount
     """
-    currency_symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "JPY": "¥",
-        "CAD": "C$",
-        "AUD": "A$",
-    }
-
-    symbol = currency_symbols.get(currency, currency)
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency)
     return f"{symbol}{amount:.2f}"
 
 
@@ -29,15 +39,12 @@ def format_datetime(dt: datetime, format_type: str = "standard") -> str:
     """
     Format datetime for display
     """
-    formats = {
-        "standard": "%Y-%m-%d %H:%M:%S",
-        "date_only": "%Y-%m-%d",
-        "time_only": "%H:%M:%S",
-        "human": "%B %d, %Y at %I:%M %p",
-        "iso": "%Y-%m-%dT%H:%M:%SZ",
-    }
+    if format_type == "iso":
+        # Same output as the strftime pattern (offset ignored), without
+        # going through strftime
+        return dt.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
 
-    format_str = formats.get(format_type, formats["standard"])
+    format_str = _DATETIME_FORMATS.get(format_type, _DATETIME_FORMATS["standard"])
     return dt.strftime(format_str)
 
 
@@ -81,34 +88,61 @@ def format_food_recommendation(
     return formatted
 
 
+# Words `format_voice_response` may swap, matched in one pass. Whole
+# words only, so "Heyday" or "Hellos" are left alone.
+_VOICE_WORDS = re.compile(r"\b(?:Hey|Yeah|Hello)\b")
+
+_CULTURAL_GREETINGS = (("indian", "Namaste"), ("japanese", "Konnichiwa"))
+
+
 def format_voice_response(text: str, cultural_context: Dict[str, Any]) -> str:
     """
     Format text response for voice synthesis with cultural adaptation
     """
+    replacements: Dict[str, str] = {}
+
     # Basic cultural adaptation
     if cultural_context.get("formal_address", False):
         # Use more formal language
-        text = text.replace("Hey", "Hello")
-        text = text.replace("Yeah", "Yes")
+        replacements["Hey"] = "Hello"
+        replacements["Yeah"] = "Yes"
 
-    # Add cultural greetings if appropriate
+    # Add cultural greetings if appropriate (this also covers a "Hey"
+    # that formal address just turned into "Hello")
     cultural_background = cultural_context.get("cultural_background", [])
-    if "indian" in cultural_background:
-        text = text.replace("Hello", "Namaste")
-    elif "japanese" in cultural_background:
-        text = text.replace("Hello", "Konnichiwa")
-
-    return text
-
-
-def format_audio_metadata(audio_data: bytes) -> Dict[str, Any]:
+    for culture, greeting in _CULTURAL_GREETINGS:
+        if culture in cultural_background:
+            replacements["Hello"] = greeting
+            if "Hey" in replacements:
+                replacements["Hey"] = greeting
+            break
+
+    if not replacements:
+        return text
+    return _VOICE_WORDS.sub(
+        lambda match: replacements.get(match[0], match[0]), text
+    )
+
+
+def format_audio_metadata(
+    audio_data: Union[bytes, bytearray, memoryview, int],
+    content_type: str = "audio/wav",
+) -> Dict[str, Any]:
     """
     Format audio metadata for response
+
+    Takes the audio itself or, when the caller already counted it while
+    streaming, just its size in bytes.
     """
+    if isinstance(audio_data, int):
+        size_bytes = audio_data
+    else:
+        size_bytes = memoryview(audio_data).nbytes
+
     metadata = {
-        "size_bytes": len(audio_data),
-        "size_mb": round(len(audio_data) / (1024 * 1024), 2),
-        "format": "audio/wav",  # Default format
+        "size_bytes": size_bytes,
+        "size_mb": round(size_bytes / (1024 * 1024), 2),
+        "format": content_type,
         "duration_estimate": 0.0,  # Will be calculated
         "quality": "standard",
     }
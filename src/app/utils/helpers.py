@@ -3,17 +3,18 @@ Helpers
 Common helper functions
 """
 
-import uuid
 import math
+import secrets
+from collections import deque
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
 
 def generate_session_id() -> str:
     """
-    Generate unique session ID
+    Generate unique session ID (22 URL-safe chars, 128 random bits)
     """
-    return str(uuid.uuid4())
+    return secrets.token_urlsafe(16)
 
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -42,14 +43,22 @@ def merge_contexts(
 ) -> Dict[str, Any]:
     """
     Merge two context dictionaries
+
+    Nested dicts are merged recursively; walked with an explicit worklist
+    so deep contexts don't hit the recursion limit.
     """
     merged = base_context.copy()
-
-    for key, value in new_context.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = merge_contexts(merged[key], value)
-        else:
-            merged[key] = value
+    pending = deque([(merged, new_context)])
+
+    while pending:
+        target, source = pending.popleft()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                pending.append((current, value))
+            else:
+                target[key] = value
 
     return merged
 
@@ -71,19 +80,17 @@ def extract_cultural_indicators(text: str) -> Dict[str, Any]:
     return indicators
 
 
+# Characters removed by `sanitize_input`
+_DANGEROUS_CHARS_TABLE = str.maketrans("", "", "<>&\"'\\/%")
+
+
 def sanitize_input(user_input: str) -> str:
     """
     Sanitize user input for security
     """
-    # Basic sanitization
-    sanitized = user_input.strip()
-
-    # Remove potentially harmful characters
-    dangerous_chars = ["<", ">", "&", '"', "'", "\\", "/", "%"]
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, "")
-
-    return sanitized
+    # Basic sanitization: strip, then drop potentially harmful characters
+    # in a single pass
+    return user_input.strip().translate(_DANGEROUS_CHARS_TABLE)
 
 
 def format_error_response(
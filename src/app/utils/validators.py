@@ -4,16 +4,25 @@ Input validation utilities
 """
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Union
 from email_validator import validate_email as email_validate, EmailNotValidError
 
 
+_PHONE_PATTERN = re.compile(r"^\+?1?\d{9,15}$")
+_PHONE_SEPARATORS = str.maketrans("", "", " -")
+
+
+@lru_cache(maxsize=4096)
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
     """
     Validate email address format
+
+    Syntax only: the deliverability (DNS) check is skipped, so results
+    depend on the input alone and are cached.
     """
     try:
-        valid = email_validate(email)
+        valid = email_validate(email, check_deliverability=False)
         return True, valid.email
     except EmailNotValidError:
         return False, None
@@ -24,8 +33,7 @@ def validate_phone(phone: str) -> bool:
     Validate phone number format
     """
     # Simple phone validation - can be enhanced with phonenumbers library
-    phone_pattern = re.compile(r"^\+?1?\d{9,15}$")
-    return bool(phone_pattern.match(phone.replace(" ", "").replace("-", "")))
+    return bool(_PHONE_PATTERN.match(phone.translate(_PHONE_SEPARATORS)))
 
 
 def validate_location(location: Dict[str, Any]) -> bool:
@@ -51,15 +59,16 @@ def validate_location(location: Dict[str, Any]) -> bool:
     return False
 
 
-def validate_audio_file(file_data: bytes) -> bool:
+def validate_audio_file(file_data: Union[bytes, bytearray, memoryview]) -> bool:
     """
     Validate audio file format and size
     """
     if not file_data:
         return False
 
-    # Check file size (10MB limit)
-    if len(file_data) > 10 * 1024 * 1024:
+    # Check file size (10MB limit). `nbytes` so a memoryview slice is
+    # measured in bytes without copying it.
+    if memoryview(file_data).nbytes > 10 * 1024 * 1024:
         return False
 
     # Basic audio format validation
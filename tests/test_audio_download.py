@@ -0,0 +1,93 @@
+"""Tests for the WS routes' streaming audio download helper."""
+
+from __future__ import annotations
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.app.api.routes import agent_ws
+from src.app.core import http
+
+_AUDIO = bytes(range(256)) * 4096  # 1 MiB
+
+
+async def _fixed(request: web.Request) -> web.Response:
+    return web.Response(body=_AUDIO, content_type="audio/wav")
+
+
+async def _chunked(request: web.Request) -> web.StreamResponse:
+    resp = web.StreamResponse()
+    resp.enable_chunked_encoding()
+    await resp.prepare(request)
+    for i in range(0, len(_AUDIO), 100_000):
+        await resp.write(_AUDIO[i : i + 100_000])
+    await resp.write_eof()
+    return resp
+
+
+@pytest.fixture
+async def server():
+    app = web.Application()
+    app.router.add_get("/fixed.wav", _fixed)
+    app.router.add_get("/chunked.wav", _chunked)
+    srv = TestServer(app)
+    await srv.start_server()
+    agent_ws.clear_audio_cache()
+    yield srv
+    await srv.close()
+    await http.close_http_session()
+    agent_ws.clear_audio_cache()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/fixed.wav", "/chunked.wav"])
+async def test_downloads_full_body(server: TestServer, path: str) -> None:
+    data = await agent_ws.download_audio_from_url(str(server.make_url(path)))
+    assert data == _AUDIO
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/fixed.wav", "/chunked.wav"])
+async def test_rejects_oversize(
+    server: TestServer, path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(agent_ws.settings, "MAX_AUDIO_FILE_SIZE_MB", 0)
+    with pytest.raises(Exception, match="exceeds"):
+        await agent_ws.download_audio_from_url(str(server.make_url(path)))
+
+
+@pytest.mark.asyncio
+async def test_repeat_url_served_from_cache(
+    server: TestServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = str(server.make_url("/fixed.wav"))
+    first = await agent_ws.download_audio_from_url(url)
+
+    async def _no_fetch(audio_url: str) -> bytes:
+        raise AssertionError("should have been a cache hit")
+
+    monkeypatch.setattr(agent_ws, "_fetch_audio", _no_fetch)
+    assert await agent_ws.download_audio_from_url(url) is first
+
+
+def test_audio_cache_evicts_least_recent(monkeypatch: pytest.MonkeyPatch) -> None:
+    agent_ws.clear_audio_cache()
+    monkeypatch.setattr(agent_ws, "_AUDIO_CACHE_MAX_BYTES", 10)
+    agent_ws._remember_audio(b"a", b"12345")
+    agent_ws._remember_audio(b"b", b"12345")
+    agent_ws._remember_audio(b"c", b"12345")
+    assert list(agent_ws._audio_cache) == [b"b", b"c"]
+    assert agent_ws._audio_cache_bytes == 10
+    agent_ws.clear_audio_cache()
+
+
+def test_expired_audio_is_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    agent_ws.clear_audio_cache()
+    now = [100.0]
+    monkeypatch.setattr(agent_ws.time, "monotonic", lambda: now[0])
+    agent_ws._remember_audio(b"a", b"12345")
+    assert agent_ws._cached_audio(b"a") == b"12345"
+    now[0] += agent_ws._AUDIO_CACHE_TTL_SECONDS
+    assert agent_ws._cached_audio(b"a") is None
+    assert agent_ws._audio_cache_bytes == 0
@@ -0,0 +1,53 @@
+"""Unit tests for the bearer-token auth dependencies."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from src.app.api.dependencies import auth as auth_deps
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": [], "state": {}})
+
+
+@pytest.fixture
+def patched(monkeypatch: pytest.MonkeyPatch):
+    user = SimpleNamespace(uid="u-1")
+    verify = AsyncMock(return_value={"sub": "u-1", "exp": 0})
+    lookup = MagicMock(return_value=user)
+    monkeypatch.setattr(auth_deps.security_manager, "verify_token", verify)
+    monkeypatch.setattr(auth_deps, "get_user_by_uid", lookup)
+    return user, verify, lookup
+
+
+@pytest.mark.asyncio
+async def test_resolution_is_memoized_per_request(patched) -> None:
+    user, verify, lookup = patched
+    request = _request()
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok")
+
+    assert await auth_deps.get_current_user(request, creds) is user
+    resolved_user, token, payload = await auth_deps.get_current_user_with_token(
+        request, creds
+    )
+    assert resolved_user is user and token == "tok"
+    assert payload == {"sub": "u-1", "exp": 0}
+    verify.assert_awaited_once()
+    lookup.assert_called_once()
+    # Exposed for the rate limiter's per-user keys.
+    assert request.state.user is user
+
+
+@pytest.mark.asyncio
+async def test_separate_requests_verify_separately(patched) -> None:
+    _, verify, _ = patched
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok")
+    await auth_deps.get_current_user(_request(), creds)
+    await auth_deps.get_current_user(_request(), creds)
+    assert verify.await_count == 2
@@ -0,0 +1,54 @@
+"""Tests for the /auth/me REST route."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _fake_authed_user() -> SimpleNamespace:
+    """Stand-in for a User node with the attributes `UserOut` reads."""
+    return SimpleNamespace(
+        uid="user-uid-abc",
+        email="t@x.com",
+        first_name="Ada",
+        last_name="Lovelace",
+        username=None,
+        is_onboarded=True,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        password_hash="$argon2id$never-exposed",
+    )
+
+
+@pytest.fixture
+def client() -> TestClient:
+    from src.app.main import app
+    from src.app.api.dependencies.auth import get_current_user
+
+    app.dependency_overrides[get_current_user] = _fake_authed_user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestGetMe:
+    def test_user_payload_shape(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/auth/me")
+        assert resp.status_code == 200
+        user = resp.json()["data"]["user"]
+        assert user == {
+            "uid": "user-uid-abc",
+            "email": "t@x.com",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "username": None,
+            "onboarding_completed": True,
+            "health_profile_verified": False,
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+
+    def test_password_hash_not_exposed(self, client: TestClient) -> None:
+        body = client.get("/api/v1/auth/me").text
+        assert "argon2" not in body
@@ -0,0 +1,28 @@
+"""Tests for the per-second cached payload timestamp."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from src.app.utils import clock
+
+
+def test_matches_utcnow_isoformat(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1_717_171_717.123456
+    monkeypatch.setattr(clock.time, "time", lambda: now)
+    ts = clock.utc_timestamp()
+    assert ts.startswith("2024-05-31T16:08:37.")
+    assert datetime.fromisoformat(ts).microsecond // 1000 == 123
+
+
+def test_prefix_refreshes_when_second_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ticks = iter([100.5, 100.75, 101.25])
+    monkeypatch.setattr(clock.time, "time", lambda: next(ticks))
+    first, second, third = (clock.utc_timestamp() for _ in range(3))
+    assert first == "1970-01-01T00:01:40.500000"
+    assert second == "1970-01-01T00:01:40.750000"
+    assert third == "1970-01-01T00:01:41.250000"
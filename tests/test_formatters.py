@@ -0,0 +1,78 @@
+"""Unit tests for the output formatters."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.app.utils.formatters import (
+    format_audio_metadata,
+    format_currency,
+    format_datetime,
+    format_voice_response,
+)
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [
+        datetime(2024, 3, 4, 5, 6, 7, 891011),
+        datetime(2024, 3, 4, 5, 6, 7, tzinfo=timezone(timedelta(hours=2))),
+    ],
+)
+def test_iso_fast_path_matches_strftime(dt: datetime) -> None:
+    assert format_datetime(dt, "iso") == dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_unknown_format_falls_back_to_standard() -> None:
+    dt = datetime(2024, 3, 4, 5, 6, 7)
+    assert format_datetime(dt, "nope") == "2024-03-04 05:06:07"
+
+
+def test_format_currency() -> None:
+    assert format_currency(3.5, "EUR") == "€3.50"
+    assert format_currency(3.5, "CHF") == "CHF3.50"
+
+
+def test_audio_metadata_from_bytes_or_size() -> None:
+    audio = bytes(3 * 1024 * 1024)
+    from_bytes = format_audio_metadata(audio)
+    assert from_bytes == format_audio_metadata(len(audio))
+    assert from_bytes["size_bytes"] == 3 * 1024 * 1024
+    assert from_bytes["size_mb"] == 3.0
+    assert from_bytes["format"] == "audio/wav"
+    assert format_audio_metadata(memoryview(audio)[:1024])["size_bytes"] == 1024
+
+
+@pytest.mark.parametrize(
+    "context",
+    [
+        {},
+        {"formal_address": True},
+        {"cultural_background": ["indian"]},
+        {"formal_address": True, "cultural_background": ["japanese"]},
+        {"formal_address": True, "cultural_background": ["indian", "japanese"]},
+    ],
+)
+def test_voice_response_matches_sequential_replaces(context: dict) -> None:
+    def reference(text: str) -> str:
+        if context.get("formal_address"):
+            text = text.replace("Hey", "Hello").replace("Yeah", "Yes")
+        background = context.get("cultural_background", [])
+        if "indian" in background:
+            text = text.replace("Hello", "Namaste")
+        elif "japanese" in background:
+            text = text.replace("Hello", "Konnichiwa")
+        return text
+
+    text = "Hey there! Yeah, Hello again."
+    assert format_voice_response(text, context) == reference(text)
+
+
+def test_voice_response_only_swaps_whole_words() -> None:
+    context = {"formal_address": True, "cultural_background": ["indian"]}
+    assert (
+        format_voice_response("Hey! Heyday, Yeahs and Hellos. Yeah.", context)
+        == "Namaste! Heyday, Yeahs and Hellos. Yes."
+    )
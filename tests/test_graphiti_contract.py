@@ -15,6 +15,14 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.app.services.graphiti import contract
+from src.app.services.graphiti.client import CircuitBreaker, graphiti_breaker
+
+
+@pytest.fixture(autouse=True)
+def _reset_breaker():
+    graphiti_breaker.reset()
+    yield
+    graphiti_breaker.reset()
 
 
 @pytest.fixture
@@ -122,3 +130,94 @@ class TestErrorSwallow:
             user_id="u", transcript="hello", agent_name="onboarding"
         )
         assert result is None  # swallowed, not raised
+
+
+class TestEpisodeBodyEncoding:
+    @pytest.mark.asyncio
+    async def test_non_json_values_fall_back_to_str(
+        self, fake_graphiti: MagicMock
+    ) -> None:
+        from datetime import datetime
+        from decimal import Decimal
+
+        await contract.record_user_event(
+            user_id="u-5",
+            event_type="user_login",
+            payload={
+                "at": datetime(2024, 1, 2, 3, 4, 5),
+                "total": Decimal("9.50"),
+                1: "x",
+            },
+        )
+        body = json.loads(fake_graphiti.add_episode.await_args.kwargs["episode_body"])
+        assert body["data"] == {"at": "2024-01-02T03:04:05", "total": "9.50", "1": "x"}
+
+
+class TestRecordUserEvents:
+    @pytest.mark.asyncio
+    async def test_writes_one_bulk_call(self, fake_graphiti: MagicMock) -> None:
+        fake_graphiti.add_episode_bulk = AsyncMock(return_value=MagicMock())
+        await contract.record_user_events(
+            "u-6",
+            [("user_login", {"email": "a@b.c"}), ("user_logout", None)],
+        )
+        fake_graphiti.add_episode.assert_not_awaited()
+        fake_graphiti.add_episode_bulk.assert_awaited_once()
+        call = fake_graphiti.add_episode_bulk.await_args
+        episodes = call.args[0]
+        assert call.kwargs["group_id"] == "u-6"
+        assert [e.name for e in episodes] == ["auth-user_login", "auth-user_logout"]
+        assert json.loads(episodes[0].content) == {
+            "event_type": "user_login",
+            "data": {"email": "a@b.c"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_is_no_op(self, fake_graphiti: MagicMock) -> None:
+        fake_graphiti.add_episode_bulk = AsyncMock()
+        assert await contract.record_user_events("u", []) is None
+        fake_graphiti.add_episode_bulk.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bulk_error_does_not_raise(
+        self, fake_graphiti: MagicMock
+    ) -> None:
+        fake_graphiti.add_episode_bulk = AsyncMock(side_effect=RuntimeError("down"))
+        assert await contract.record_user_events("u", [("x", {})]) is None
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_half_opens_after_cooldown(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = [100.0]
+        monkeypatch.setattr(
+            "src.app.services.graphiti.client.time.monotonic", lambda: now[0]
+        )
+        breaker = CircuitBreaker(threshold=2, cooldown=10)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.is_open and not breaker.allow()
+
+        now[0] += 11
+        assert breaker.allow()  # the one trial call
+        assert not breaker.allow()  # others keep short-circuiting meanwhile
+        breaker.record_success()
+        assert not breaker.is_open and breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_graphiti(
+        self, fake_graphiti: MagicMock
+    ) -> None:
+        fake_graphiti.add_episode.side_effect = RuntimeError("graphiti is down")
+        for _ in range(graphiti_breaker.threshold):
+            await contract.record_user_utterance("u", "hi", agent_name="food")
+        assert graphiti_breaker.is_open
+        calls = fake_graphiti.add_episode.await_count
+
+        skipped = await contract.record_user_utterance("u", "hi", agent_name="food")
+        assert skipped is None
+        assert await contract.record_user_events("u", [("x", {})]) is None
+        assert fake_graphiti.add_episode.await_count == calls
+        fake_graphiti.add_episode_bulk.assert_not_called()
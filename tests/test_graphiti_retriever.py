@@ -10,6 +10,15 @@ from src.app.services.graphiti import retriever
 from src.app.services.graphiti.retriever import ContextBundle
 
 
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    retriever._search_cache.clear()
+    retriever.graphiti_breaker.reset()
+    yield
+    retriever._search_cache.clear()
+    retriever.graphiti_breaker.reset()
+
+
 def _fake_edge(fact: str, name: str = "RELATES_TO", attributes=None) -> MagicMock:
     """Build a stand-in for graphiti_core.edges.EntityEdge."""
     e = MagicMock()
@@ -145,3 +154,118 @@ class TestGetRelevantContext:
         assert "RestaurantVisit" not in bundle.by_kind
         # Raw facts list still has both for callers that want them.
         assert len(bundle.facts) == 2
+
+
+async def _cached_context(user_id: str = "u", query: str = "q") -> ContextBundle:
+    return await retriever.get_relevant_context(
+        user_id=user_id, query=query, cache=True
+    )
+
+
+class TestSearchCache:
+    @pytest.fixture
+    def fake(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        fake = MagicMock()
+        fake.search = AsyncMock(return_value=[_fake_edge("likes ramen")])
+        monkeypatch.setattr(retriever, "get_graphiti", lambda: fake)
+        return fake
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_served_from_cache(self, fake: MagicMock) -> None:
+        first = await _cached_context()
+        second = await _cached_context()
+        assert second.facts == first.facts == ["likes ramen"]
+        fake.search.assert_awaited_once()
+
+        await _cached_context(query="other")
+        await _cached_context("u2")
+        assert fake.search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_uncached_calls_always_search(self, fake: MagicMock) -> None:
+        await retriever.get_relevant_context(user_id="u", query="q")
+        await retriever.get_relevant_context(user_id="u", query="q")
+        assert fake.search.await_count == 2
+        cached = retriever._search_cache.get("u", "q", retriever.DEFAULT_NUM_RESULTS)
+        assert cached is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(
+        self, fake: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await _cached_context()
+        later = retriever.time.monotonic() + retriever.SEARCH_CACHE_TTL_SECONDS + 1
+        monkeypatch.setattr(retriever.time, "monotonic", lambda: later)
+        await _cached_context()
+        assert fake.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, fake: MagicMock) -> None:
+        fake.search.side_effect = [RuntimeError("down"), [_fake_edge("x")]]
+        first = await _cached_context()
+        second = await _cached_context()
+        assert first.facts == []
+        assert second.facts == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_contract_write_invalidates(
+        self, fake: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.app.services.graphiti import contract
+
+        fake.add_episode = AsyncMock(return_value=MagicMock())
+        monkeypatch.setattr(contract, "get_graphiti", lambda: fake)
+        await _cached_context()
+        await contract.record_user_utterance("u", "I'm vegan", agent_name="food")
+        await _cached_context()
+        assert fake.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_racing_a_write_is_not_cached(self, fake: MagicMock) -> None:
+        async def _search(**kwargs):
+            # A write lands while this search is in flight.
+            retriever.invalidate_user_context("u")
+            return [_fake_edge("stale")]
+
+        fake.search = AsyncMock(side_effect=_search)
+        await _cached_context()
+        cached = retriever._search_cache.get("u", "q", retriever.DEFAULT_NUM_RESULTS)
+        assert cached is None
+
+    def test_per_user_searches_are_capped_lru(self) -> None:
+        cache = retriever._SearchCache(max_per_user=2)
+        gen = cache.generation("u")
+        cache.put("u", "a", 8, [_fake_edge("a")], gen)
+        cache.put("u", "b", 8, [_fake_edge("b")], gen)
+        assert cache.get("u", "a", 8) is not None  # "b" is now least recent
+        cache.put("u", "c", 8, [_fake_edge("c")], gen)
+        assert cache.get("u", "b", 8) is None
+        assert cache.get("u", "a", 8) is not None
+        assert cache.get("u", "c", 8) is not None
+
+    def test_put_prunes_expired_searches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = [100.0]
+        monkeypatch.setattr(retriever.time, "monotonic", lambda: now[0])
+        cache = retriever._SearchCache(ttl=10.0)
+        gen = cache.generation("u")
+        cache.put("u", "old", 8, [_fake_edge("old")], gen)
+        now[0] = 111.0
+        cache.put("u", "new", 8, [_fake_edge("new")], gen)
+        assert list(cache._entries["u"]) == [("new", 8)]
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_returns_empty_bundle_without_search(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = MagicMock()
+    fake.search = AsyncMock(return_value=[_fake_edge("x")])
+    monkeypatch.setattr(retriever, "get_graphiti", lambda: fake)
+    for _ in range(retriever.graphiti_breaker.threshold):
+        retriever.graphiti_breaker.record_failure()
+
+    bundle = await retriever.get_relevant_context(user_id="u", query="q")
+    assert bundle.facts == []
+    fake.search.assert_not_awaited()
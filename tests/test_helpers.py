@@ -0,0 +1,54 @@
+"""Unit tests for the shared helper functions."""
+
+from __future__ import annotations
+
+import re
+
+from src.app.utils.helpers import (
+    generate_session_id,
+    merge_contexts,
+    sanitize_input,
+)
+
+
+class TestMergeContexts:
+    def test_nested_dicts_merge_without_mutating_inputs(self) -> None:
+        base = {"a": 1, "prefs": {"spice": 2, "diet": {"vegan": False}}}
+        new = {"b": 2, "prefs": {"diet": {"vegan": True}, "budget": "low"}}
+        merged = merge_contexts(base, new)
+        assert merged == {
+            "a": 1,
+            "b": 2,
+            "prefs": {"spice": 2, "diet": {"vegan": True}, "budget": "low"},
+        }
+        assert base == {"a": 1, "prefs": {"spice": 2, "diet": {"vegan": False}}}
+
+    def test_non_dict_value_replaces(self) -> None:
+        assert merge_contexts({"a": {"x": 1}}, {"a": [1]}) == {"a": [1]}
+        assert merge_contexts({"a": None}, {"a": {"x": 1}}) == {"a": {"x": 1}}
+
+    def test_deep_nesting_does_not_recurse(self) -> None:
+        base: dict = {}
+        new: dict = {}
+        b, n = base, new
+        for _ in range(5000):
+            b["k"] = {}
+            n["k"] = {}
+            b, n = b["k"], n["k"]
+        n["leaf"] = True
+        merged = merge_contexts(base, new)
+        node = merged
+        for _ in range(5000):
+            node = node["k"]
+        assert node == {"leaf": True}
+
+
+def test_sanitize_input_strips_and_drops_dangerous_chars() -> None:
+    raw = "  <b>Tom & \"Jerry's\" 50% \\off/</b>  "
+    assert sanitize_input(raw) == "bTom  Jerrys 50 offb"
+
+
+def test_generate_session_id_is_short_and_url_safe() -> None:
+    ids = {generate_session_id() for _ in range(100)}
+    assert len(ids) == 100
+    assert all(len(i) == 22 and re.fullmatch(r"[A-Za-z0-9_-]+", i) for i in ids)
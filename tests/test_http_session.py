@@ -0,0 +1,41 @@
+"""Tests for the shared outbound aiohttp session."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.app.core import http
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_until_closed() -> None:
+    first = http.get_http_session()
+    try:
+        assert http.get_http_session() is first
+    finally:
+        await http.close_http_session()
+    assert first.closed
+
+    second = http.get_http_session()
+    try:
+        assert second is not first
+    finally:
+        await http.close_http_session()
+
+
+@pytest.mark.asyncio
+async def test_close_without_open_is_noop() -> None:
+    await http.close_http_session()
+    await http.close_http_session()
+
+
+@pytest.mark.asyncio
+async def test_connector_keeps_connections_alive() -> None:
+    session = http.get_http_session()
+    try:
+        connector = session.connector
+        assert connector.limit == http.MAX_CONNECTIONS
+        assert connector.limit_per_host == http.MAX_CONNECTIONS_PER_HOST
+        assert connector._keepalive_timeout == http.KEEPALIVE_SECONDS
+    finally:
+        await http.close_http_session()
@@ -0,0 +1,50 @@
+"""Unit tests for the time-ordered (UUIDv7) id helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.app.models import ids
+
+
+def test_uuid7_version_and_variant() -> None:
+    value = ids.uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_sorts_by_creation_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter(range(1_700_000_000_000, 1_700_000_000_010))
+    monkeypatch.setattr(ids.time, "time_ns", lambda: next(clock) * 1_000_000)
+    values = [ids.uuid7().hex for _ in range(10)]
+    assert values == sorted(values)
+
+
+def test_time_ordered_id_property_default() -> None:
+    from src.app.models.user import User
+
+    prop = User.defined_properties()["uid"]
+    assert isinstance(prop, ids.TimeOrderedIdProperty)
+    assert prop.unique_index is True
+    uid = prop.default_value()
+    assert len(uid) == 32 and uid[12] == "7"
+
+
+def test_hotel_booking_id_is_uuid7() -> None:
+    import uuid
+
+    from src.app.models.hotel import HotelBooking
+
+    fields = HotelBooking.model_fields
+    assert uuid.UUID(fields["booking_id"].default_factory()).version == 7
+
+
+def test_record_ids_are_uuid7_but_session_ids_stay_random() -> None:
+    import uuid
+
+    from src.app.models.session import VoiceInteraction, UserSession
+
+    interaction_id = VoiceInteraction.model_fields["interaction_id"].default_factory()
+    assert uuid.UUID(interaction_id).version == 7
+    session_id = UserSession.model_fields["session_id"].default_factory()
+    assert uuid.UUID(session_id).version == 4
@@ -113,3 +113,64 @@ def test_production_accepts_real_secrets(monkeypatch: pytest.MonkeyPatch) -> Non
 
     s = Settings()
     assert s.is_production is True
+
+
+def test_asymmetric_jwt_requires_public_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.app.core.config import Settings
+
+    monkeypatch.setenv("ALGORITHM", "EdDSA")
+    monkeypatch.setenv("JWT_PUBLIC_KEY", "")
+
+    with pytest.raises(Exception) as exc_info:
+        Settings()
+    assert "JWT_PUBLIC_KEY" in str(exc_info.value)
+
+
+def test_app_responses_encode_with_orjson() -> None:
+    from fastapi.responses import ORJSONResponse
+
+    from src.app.main import app
+
+    assert app.router.default_response_class is ORJSONResponse
+
+
+@pytest.mark.parametrize(
+    "neo4j, redis, code, status",
+    [(True, True, 200, "healthy"), (True, False, 503, "unhealthy")],
+)
+def test_health_reflects_cached_service_status(
+    monkeypatch: pytest.MonkeyPatch, neo4j: bool, redis: bool, code: int, status: str
+) -> None:
+    from fastapi.testclient import TestClient
+
+    from src.app.core import database
+    from src.app.main import app
+
+    monkeypatch.setitem(database.service_status, "neo4j", neo4j)
+    monkeypatch.setitem(database.service_status, "redis", redis)
+    response = TestClient(app).get("/health")
+    assert response.status_code == code
+    assert response.json()["status"] == status
+
+
+def test_restaurant_name_is_the_graph_node() -> None:
+    from neomodel import StructuredNode
+
+    from src.app.models.restaurant import Restaurant, RestaurantDTO
+
+    assert issubclass(Restaurant, StructuredNode)
+    assert "restaurant_id" in Restaurant.defined_properties()
+    assert "cuisine_types" in RestaurantDTO.model_fields
+
+
+def test_food_order_items_are_typed() -> None:
+    from src.app.models.restaurant import FoodOrder, OrderItem
+
+    order = FoodOrder(
+        user_id="u-1",
+        restaurant_id="r-1",
+        items=[{"item_id": "m-1", "quantity": 2, "unit_price": 4.5}],
+        total_amount=9.0,
+    )
+    assert order.items == [OrderItem(item_id="m-1", quantity=2, unit_price=4.5)]
+    assert order.model_dump()["items"][0]["special_instructions"] is None
@@ -0,0 +1,301 @@
+"""Unit tests for the verified-JWT payload cache and its use in verify_token."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import jwt
+import pytest
+
+from src.app.core import security as security_mod
+from src.app.core.jwt_cache import (
+    JWTCache,
+    invalidate_token,
+    jwt_cache,
+    not_blacklisted_cache,
+)
+
+
+class TestJWTCache:
+    def test_put_then_get_returns_payload(self) -> None:
+        cache = JWTCache(maxsize=10, ttl=5)
+        payload = {"sub": "u-1", "exp": time.time() + 60}
+        cache.put("tok", payload)
+        assert cache.get("tok") == payload
+
+    def test_miss_returns_none(self) -> None:
+        assert JWTCache().get("never-seen") is None
+
+    def test_entry_expires_after_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = JWTCache(maxsize=10, ttl=5)
+        cache.put("tok", {"sub": "u-1", "exp": time.time() + 60})
+        later = time.monotonic() + 6
+        monkeypatch.setattr("src.app.core.jwt_cache.time.monotonic", lambda: later)
+        assert cache.get("tok") is None
+        assert len(cache) == 0
+
+    def test_already_expired_token_not_cached(self) -> None:
+        cache = JWTCache(maxsize=10, ttl=5)
+        cache.put("tok", {"sub": "u-1", "exp": time.time() - 1})
+        assert len(cache) == 0
+
+    def test_lru_eviction_at_maxsize(self) -> None:
+        cache = JWTCache(maxsize=2, ttl=5)
+        exp = time.time() + 60
+        cache.put("a", {"sub": "a", "exp": exp})
+        cache.put("b", {"sub": "b", "exp": exp})
+        cache.get("a")  # touch: "b" is now least recently used
+        cache.put("c", {"sub": "c", "exp": exp})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_invalidate(self) -> None:
+        cache = JWTCache()
+        cache.put("tok", {"sub": "u-1", "exp": time.time() + 60})
+        cache.invalidate("tok")
+        assert cache.get("tok") is None
+
+    def test_invalid_construction_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            JWTCache(maxsize=0)
+        with pytest.raises(ValueError):
+            JWTCache(ttl=0)
+
+
+class TestVerifyTokenCaching:
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self, monkeypatch: pytest.MonkeyPatch):
+        jwt_cache.clear()
+        not_blacklisted_cache.clear()
+        monkeypatch.setattr(
+            security_mod.security_manager,
+            "is_token_blacklisted",
+            AsyncMock(return_value=False),
+        )
+        yield
+        jwt_cache.clear()
+        not_blacklisted_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_second_call_skips_decode(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = security_mod.security_manager
+        token = manager.create_access_token({"sub": "u-1"})
+        decode_spy = MagicMock(wraps=jwt.decode)
+        first = await manager.verify_token(token)
+
+        monkeypatch.setattr(security_mod.jwt, "decode", decode_spy)
+        second = await manager.verify_token(token)
+        assert second == first
+        decode_spy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_blacklisted_token_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = security_mod.security_manager
+        monkeypatch.setattr(
+            manager, "is_token_blacklisted", AsyncMock(return_value=True)
+        )
+        token = manager.create_access_token({"sub": "u-1"})
+        assert await manager.verify_token(token) is None
+        assert len(not_blacklisted_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_not_blacklisted_answer_is_cached(self) -> None:
+        manager = security_mod.security_manager
+        token = manager.create_access_token({"sub": "u-1"})
+        await manager.verify_token(token)
+        await manager.verify_token(token)
+        manager.is_token_blacklisted.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_logout_invalidation_rechecks_blacklist(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = security_mod.security_manager
+        token = manager.create_access_token({"sub": "u-1"})
+        assert await manager.verify_token(token) is not None
+
+        # What /logout does: blacklist in Redis, then drop local caches.
+        monkeypatch.setattr(
+            manager, "is_token_blacklisted", AsyncMock(return_value=True)
+        )
+        invalidate_token(token)
+        assert await manager.verify_token(token) is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_skips_blacklist_lookup(self) -> None:
+        manager = security_mod.security_manager
+        assert await manager.verify_token("not-a-jwt") is None
+        manager.is_token_blacklisted.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_not_cached(self) -> None:
+        manager = security_mod.security_manager
+        assert await manager.verify_token("not-a-jwt") is None
+        assert len(jwt_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_missing_sub_rejected(self) -> None:
+        manager = security_mod.security_manager
+        token = manager.create_access_token({"email": "t@x.com"})
+        assert await manager.verify_token(token) is None
+
+
+class TestBlacklistKey:
+    def test_tokens_carry_unique_jti(self) -> None:
+        manager = security_mod.security_manager
+        first = jwt.decode(
+            manager.create_access_token({"sub": "u-1"}),
+            options={"verify_signature": False},
+        )
+        second = jwt.decode(
+            manager.create_access_token({"sub": "u-1"}),
+            options={"verify_signature": False},
+        )
+        assert len(first["jti"]) == 32
+        assert first["jti"] != second["jti"]
+
+    def test_key_uses_jti(self) -> None:
+        key = security_mod.SecurityManager.blacklist_key("tok", {"jti": "abc"})
+        assert key == "blacklist:abc"
+
+    def test_legacy_token_falls_back_to_full_token(self) -> None:
+        key = security_mod.SecurityManager.blacklist_key("tok", {"sub": "u-1"})
+        assert key == "blacklist:tok"
+
+    @pytest.mark.asyncio
+    async def test_lookup_uses_jti_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake_get = AsyncMock(return_value=None)
+        monkeypatch.setattr(security_mod.redis_cache, "redis_client", MagicMock())
+        monkeypatch.setattr(security_mod.redis_cache, "get", fake_get)
+        manager = security_mod.SecurityManager()
+        assert await manager.is_token_blacklisted("tok", {"jti": "abc"}) is False
+        fake_get.assert_awaited_once_with("blacklist:abc")
+
+
+class TestTokenVersion:
+    @pytest.fixture(autouse=True)
+    def _redis(self, monkeypatch: pytest.MonkeyPatch):
+        self.store: dict = {}
+
+        async def _get(key):
+            return self.store.get(key)
+
+        async def _set(key, value, ttl=None):
+            self.store[key] = value
+
+        monkeypatch.setattr(security_mod.redis_cache, "redis_client", MagicMock())
+        monkeypatch.setattr(security_mod.redis_cache, "get", _get)
+        monkeypatch.setattr(security_mod.redis_cache, "set", _set)
+        jwt_cache.clear()
+        not_blacklisted_cache.clear()
+        yield
+        jwt_cache.clear()
+        not_blacklisted_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_current_version_read_through_redis(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.app.models import user as user_mod
+
+        lookup = MagicMock(return_value=2)
+        monkeypatch.setattr(user_mod, "get_token_version", lookup)
+        manager = security_mod.SecurityManager()
+        assert await manager.is_token_version_stale({"sub": "u-1", "ver": 1})
+        assert not await manager.is_token_version_stale({"sub": "u-1", "ver": 2})
+        lookup.assert_called_once_with("u-1")
+        assert self.store["user_ver:u-1"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_rejects_older_tokens(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.app.models import user as user_mod
+
+        monkeypatch.setattr(user_mod, "get_token_version", MagicMock(return_value=0))
+        monkeypatch.setattr(user_mod, "bump_token_version", MagicMock(return_value=1))
+        manager = security_mod.SecurityManager()
+        monkeypatch.setattr(
+            manager, "is_token_blacklisted", AsyncMock(return_value=False)
+        )
+        old = manager.create_access_token({"sub": "u-1", "ver": 0})
+        assert await manager.verify_token(old) is not None
+
+        assert await manager.revoke_all_tokens("u-1") == 1
+        assert len(not_blacklisted_cache) == 0
+        assert await manager.verify_token(old) is None
+        new = manager.create_access_token({"sub": "u-1", "ver": 1})
+        assert await manager.verify_token(new) is not None
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_survives_redis_failure(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.app.models import user as user_mod
+
+        monkeypatch.setattr(user_mod, "bump_token_version", MagicMock(return_value=3))
+        monkeypatch.setattr(
+            security_mod.redis_cache,
+            "set",
+            AsyncMock(side_effect=RuntimeError("Redis is not connected")),
+        )
+        not_blacklisted_cache.put("tok", {"sub": "u-1", "exp": time.time() + 60})
+        manager = security_mod.SecurityManager()
+        assert await manager.revoke_all_tokens("u-1") == 3
+        assert len(not_blacklisted_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_version_write_drops_stale_entry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.app.models import user as user_mod
+
+        monkeypatch.setattr(user_mod, "bump_token_version", MagicMock(return_value=3))
+        monkeypatch.setattr(
+            security_mod.redis_cache,
+            "set",
+            AsyncMock(side_effect=RuntimeError("write timed out")),
+        )
+
+        async def _delete(key):
+            self.store.pop(key, None)
+
+        monkeypatch.setattr(security_mod.redis_cache, "delete", _delete)
+        self.store["user_ver:u-1"] = b"2"
+        manager = security_mod.SecurityManager()
+        assert await manager.revoke_all_tokens("u-1") == 3
+        assert "user_ver:u-1" not in self.store
+
+    @pytest.mark.asyncio
+    async def test_token_without_ver_is_version_zero(self) -> None:
+        self.store["user_ver:u-1"] = b"0"
+        manager = security_mod.SecurityManager()
+        assert not await manager.is_token_version_stale({"sub": "u-1"})
+
+    @pytest.mark.asyncio
+    async def test_blacklist_and_version_checks_overlap(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = security_mod.SecurityManager()
+        version_started = asyncio.Event()
+
+        async def _blacklisted(token, payload):
+            # Only completes if the version check is already in flight.
+            await asyncio.wait_for(version_started.wait(), timeout=1)
+            return False
+
+        async def _stale(payload):
+            version_started.set()
+            return False
+
+        monkeypatch.setattr(manager, "is_token_blacklisted", _blacklisted)
+        monkeypatch.setattr(manager, "is_token_version_stale", _stale)
+        token = manager.create_access_token({"sub": "u-1"})
+        assert await manager.verify_token(token) is not None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import io
 import json
 import logging
+import logging.handlers
 
 import pytest
 
@@ -13,6 +14,7 @@ from src.app.core.logging import (
     TextLogFormatter,
     configure_logging,
     request_id_var,
+    stop_logging,
 )
 
 
@@ -117,3 +119,31 @@ class TestConfigureLogging:
         configure_logging(level="DEBUG", fmt="text", log_dir=None)
         # Just ensure no exception and root level is set.
         assert logging.getLogger().level == logging.DEBUG
+
+    def test_records_are_written_off_thread_with_request_id(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        configure_logging(level="INFO", fmt="json", log_dir=None)
+        token = request_id_var.set("req-queued")
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger("queued").exception("failed %s", "here")
+        finally:
+            request_id_var.reset(token)
+        stop_logging()  # drains the queue
+
+        parsed = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert parsed["msg"] == "failed here"
+        assert parsed["request_id"] == "req-queued"
+        assert "ValueError" in parsed["exc_info"]
+        assert "_request_id" not in parsed
+
+    def test_stop_logging_restores_direct_handlers(self) -> None:
+        configure_logging(level="INFO", fmt="json", log_dir=None)
+        stop_logging()
+        stop_logging()  # idempotent
+        handlers = logging.getLogger().handlers
+        assert not any(isinstance(h, logging.handlers.QueueHandler) for h in handlers)
+        assert any(isinstance(h, logging.StreamHandler) for h in handlers)
@@ -1,6 +1,6 @@
 """Unit tests for the Foursquare MCP provider.
 
-We mock aiohttp so these run without network and without burning the
+We mock the shared HTTP session so these run without network and without burning the
 free-tier quota. The goal is to lock in the request shape (auth header,
 category filter, price-tier mapping) and the response normalization
 (canonical fields the food agent depends on).
@@ -49,24 +49,24 @@ class _FakeSession:
         self.last_params: dict | None = None
         self.last_headers: dict | None = None
 
-    def get(self, url: str, params: dict | None = None, headers: dict | None = None):
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: Any = None,
+    ):
         self.last_url = url
         self.last_params = params
         self.last_headers = headers
         return self._response
 
-    async def __aenter__(self) -> "_FakeSession":
-        return self
-
-    async def __aexit__(self, *args: Any) -> None:
-        return None
-
 
 def _patch_session(session: _FakeSession):
-    """Patch aiohttp.ClientSession in the foursquare module."""
+    """Patch the shared HTTP session the foursquare module uses."""
     return patch.object(
-        foursquare.aiohttp,
-        "ClientSession",
+        foursquare,
+        "get_http_session",
         return_value=session,
     )
 
@@ -224,14 +224,8 @@ class TestSearchResponseNormalization:
             def get(self, *a, **kw):
                 raise RuntimeError("DNS exploded")
 
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *a):
-                return None
-
         with patch.object(
-            foursquare.aiohttp, "ClientSession", return_value=_BrokenSession()
+            foursquare, "get_http_session", return_value=_BrokenSession()
         ):
             results = await foursquare.search_restaurants(query="x")
         assert results == []
@@ -0,0 +1,60 @@
+"""Unit tests for the legacy memory_service shim."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.app.services import memory_service as memory_mod
+from src.app.services.graphiti import contract
+from src.app.services.graphiti.client import graphiti_breaker
+
+
+@pytest.fixture(autouse=True)
+def _reset_breaker():
+    graphiti_breaker.reset()
+    yield
+    graphiti_breaker.reset()
+
+
+@pytest.fixture
+def fake_graphiti(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    fake = MagicMock()
+    fake.add_episode = AsyncMock(return_value=MagicMock())
+    fake.add_episode_bulk = AsyncMock(return_value=MagicMock())
+    monkeypatch.setattr(contract, "get_graphiti", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_store_user_memory_merges_content_without_mutating(
+    fake_graphiti: MagicMock,
+) -> None:
+    metadata = {"event_type": "note", "source": "import"}
+    ok = await memory_mod.memory_service.store_user_memory(
+        "u-1", {"content": "likes tea", "metadata": metadata}
+    )
+    assert ok is True
+    assert metadata == {"event_type": "note", "source": "import"}
+    body = json.loads(fake_graphiti.add_episode.await_args.kwargs["episode_body"])
+    assert body == {
+        "event_type": "note",
+        "data": {"content": "likes tea", "event_type": "note", "source": "import"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_is_one_bulk_write(fake_graphiti: MagicMock) -> None:
+    ok = await memory_mod.memory_service.store_user_memories_batch(
+        "u-1",
+        [
+            {"content": "a", "metadata": {"event_type": "user_login"}},
+            {"content": "b"},
+        ],
+    )
+    assert ok is True
+    fake_graphiti.add_episode_bulk.assert_awaited_once()
+    episodes = fake_graphiti.add_episode_bulk.await_args.args[0]
+    assert [e.name for e in episodes] == ["auth-user_login", "auth-user_event"]
@@ -0,0 +1,276 @@
+"""Unit tests for the async Neo4j bootstrap wrapper (driver is faked)."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import Any, List, Optional
+
+import pytest
+
+from src.app.core.database import Neo4jDatabase
+
+
+class _FakeResult:
+    def __init__(self, rows: List[dict]) -> None:
+        self._rows = rows
+
+    async def data(self) -> List[dict]:
+        return self._rows
+
+    async def single(self) -> Optional[dict]:
+        return self._rows[0] if self._rows else None
+
+
+class _FakeTx:
+    def __init__(self, log: List[Any]) -> None:
+        self.log = log
+
+    async def run(self, query: str, parameters: dict) -> _FakeResult:
+        self.log.append((query, parameters))
+        return _FakeResult([{"n": len(self.log)}])
+
+
+class _FakeSession:
+    def __init__(self, driver: "_FakeDriver") -> None:
+        self.driver = driver
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def run(self, query: str, parameters: Optional[dict] = None):
+        self.driver.autocommit.append(query)
+        return _FakeResult([{"1": 1}])
+
+    async def execute_write(self, work):
+        self.driver.transactions.append("write")
+        return await work(_FakeTx(self.driver.statements))
+
+    async def execute_read(self, work):
+        self.driver.transactions.append("read")
+        return await work(_FakeTx(self.driver.statements))
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.autocommit: List[str] = []
+        self.statements: List[Any] = []
+        self.transactions: List[str] = []
+
+    def session(self, **kwargs: Any) -> _FakeSession:
+        return _FakeSession(self)
+
+
+@pytest.fixture
+def db() -> Neo4jDatabase:
+    database = Neo4jDatabase()
+    database.driver = _FakeDriver()
+    return database
+
+
+@pytest.mark.asyncio
+async def test_is_connected(db: Neo4jDatabase) -> None:
+    assert await db.is_connected() is True
+    assert db.driver.autocommit == ["RETURN 1"]
+
+
+@pytest.mark.asyncio
+async def test_execute_queries_uses_one_transaction(db: Neo4jDatabase) -> None:
+    results = await db.execute_queries(
+        [("CREATE (:A)", None), ("CREATE (:B {x: $x})", {"x": 1})]
+    )
+    assert db.driver.transactions == ["write"]
+    assert db.driver.statements == [("CREATE (:A)", {}), ("CREATE (:B {x: $x})", {"x": 1})]
+    assert results == [[{"n": 1}], [{"n": 2}]]
+
+
+@pytest.mark.asyncio
+async def test_execute_queries_read(db: Neo4jDatabase) -> None:
+    await db.execute_queries([("MATCH (n) RETURN n", None)], write=False)
+    assert db.driver.transactions == ["read"]
+
+
+@pytest.mark.asyncio
+async def test_no_driver() -> None:
+    database = Neo4jDatabase()
+    assert await database.is_connected() is False
+    with pytest.raises(RuntimeError):
+        await database.execute_queries([("RETURN 1", None)])
+
+
+@pytest.mark.asyncio
+async def test_session_dependency_yields_pooled_session(
+    db: Neo4jDatabase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.app.api.dependencies import database as deps
+
+    monkeypatch.setattr(deps, "neo4j_db", db)
+    sessions = [session async for session in deps.get_neo4j_session()]
+    assert len(sessions) == 1
+    assert isinstance(sessions[0], _FakeSession)
+
+
+def test_install_model_labels_registers_every_node_class(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from neomodel import db
+
+    from src.app.models import install_model_labels
+
+    seen: List[str] = []
+    streams: list = []
+
+    def _install_all_labels(stdout=None) -> None:
+        streams.append(stdout)
+        seen.extend(cls.__name__ for cls in db._NODE_CLASS_REGISTRY.values())
+
+    monkeypatch.setattr(db, "install_all_labels", _install_all_labels)
+    install_model_labels()
+    for name in ("User", "Location", "Hotel", "Restaurant", "Order", "MenuItem"):
+        assert name in seen
+    # Progress goes to logging, not straight to sys.stdout.
+    assert streams and streams[0] is not None and streams[0] is not sys.stdout
+
+
+def test_install_progress_is_logged_not_printed(
+    caplog: pytest.LogCaptureFixture, capsys: pytest.CaptureFixture
+) -> None:
+    from src.app.models import _LogStream
+
+    with caplog.at_level(logging.DEBUG, logger="src.app.models"):
+        _LogStream().write("Setting up indexes and constraints...\n\nFound x.User\n")
+    assert capsys.readouterr().out == ""
+    assert [r.getMessage() for r in caplog.records] == [
+        "Setting up indexes and constraints...",
+        "Found x.User",
+    ]
+
+
+class _RecordingQueries:
+    """Stands in for `execute_queries`; answers each batch with its size."""
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.calls: List[List[Any]] = []
+
+    async def __call__(self, statements, *, write: bool = True):
+        statements = list(statements)
+        self.calls.append(statements)
+        return [
+            [{self.field: len(next(iter(params.values())))}]
+            for _, params in statements
+        ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_unwinds_in_batches(
+    db: Neo4jDatabase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    recorder = _RecordingQueries("created")
+    monkeypatch.setattr(db, "execute_queries", recorder)
+    rows = [{"uid": str(i)} for i in range(5)]
+
+    assert await db.bulk_create("MenuItem", rows, batch_size=2) == 5
+    (statements,) = recorder.calls  # one transaction
+    assert [len(params["rows"]) for _, params in statements] == [2, 2, 1]
+    assert statements[0][0].startswith("UNWIND $rows AS r CREATE (n:`MenuItem`)")
+
+
+@pytest.mark.asyncio
+async def test_bulk_merge_rels(
+    db: Neo4jDatabase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    recorder = _RecordingQueries("merged")
+    monkeypatch.setattr(db, "execute_queries", recorder)
+
+    merged = await db.bulk_merge_rels(
+        "Hotel", "Location", "LOCATED_IN", [("h1", "l1"), ("h2", "l1")],
+        source_key="hotel_id",
+    )
+    assert merged == 2
+    ((query, params),) = recorder.calls[0]
+    assert "MATCH (s:`Hotel` {`hotel_id`: p.s})" in query
+    assert "MERGE (s)-[rel:`LOCATED_IN`]->(t)" in query
+    assert params == {"pairs": [{"s": "h1", "t": "l1"}, {"s": "h2", "t": "l1"}]}
+
+
+@pytest.mark.asyncio
+async def test_bulk_helpers_reject_injected_identifiers(db: Neo4jDatabase) -> None:
+    with pytest.raises(ValueError):
+        await db.bulk_create("User) DETACH DELETE (x", [{"uid": "1"}])
+    assert await db.bulk_create("User", []) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_uses_call_in_concurrent_transactions(
+    db: Neo4jDatabase,
+) -> None:
+    await db.bulk_import(
+        "CREATE (l:Location) SET l = r", [{"uid": "1"}], batch_size=500
+    )
+    assert db.driver.autocommit == [
+        "UNWIND $rows AS r CALL { WITH r CREATE (l:Location) SET l = r } "
+        "IN CONCURRENT TRANSACTIONS OF 500 ROWS"
+    ]
+    assert db.driver.transactions == []  # not inside a managed transaction
+
+    await db.bulk_import("CREATE (:X)", [{}], concurrent=False)
+    assert db.driver.autocommit[-1].endswith("IN TRANSACTIONS OF 1000 ROWS")
+
+
+@pytest.mark.asyncio
+async def test_refresh_service_status(
+    db: Neo4jDatabase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from unittest.mock import AsyncMock
+
+    from src.app.core import database
+
+    monkeypatch.setattr(database, "neo4j_db", db)
+    monkeypatch.setattr(
+        database.redis_cache, "is_connected", AsyncMock(return_value=False)
+    )
+    monkeypatch.setitem(database.service_status, "neo4j", False)
+    monkeypatch.setitem(database.service_status, "redis", True)
+
+    status = await database.refresh_service_status()
+    assert status == {"neo4j": True, "redis": False}
+    assert database.service_status is status
+
+
+def test_close_model_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    from unittest.mock import MagicMock
+
+    from neomodel import db as neomodel_db
+
+    from src.app.models import close_model_connection
+
+    close = MagicMock()
+    monkeypatch.setattr(neomodel_db, "close_connection", close)
+    close_model_connection()
+    close.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_falls_back_without_apoc(
+    db: Neo4jDatabase, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.app.core.database import WARMUP_QUERIES
+
+    async def _no_apoc(query: str, parameters: Optional[dict] = None):
+        raise RuntimeError("There is no procedure with the name `apoc.warmup.run`")
+
+    monkeypatch.setattr(db, "execute_query", _no_apoc)
+    await db.warm_up()
+    assert db.driver.transactions == ["read"]
+    assert [q for q, _ in db.driver.statements] == list(WARMUP_QUERIES)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_prefers_apoc(db: Neo4jDatabase) -> None:
+    await db.warm_up()
+    assert db.driver.autocommit == ["CALL apoc.warmup.run(true, true, true)"]
+    assert db.driver.transactions == []
@@ -0,0 +1,80 @@
+"""Unit tests for the onboarding WS progress frames and their dedupe."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+
+from src.app.api.routes.onboarding_ws import (
+    _send_completion_progress,
+    _send_progress,
+)
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(orjson.loads(data))
+
+
+@pytest.mark.asyncio
+async def test_repeated_progress_is_sent_once() -> None:
+    ws = _FakeWebSocket()
+    emitted: Dict[str, bool] = {}
+    # Both steps map to the same checklist key.
+    await _send_progress(ws, emitted, "dietary_restrictions", True)
+    await _send_progress(ws, emitted, "cuisine_preferences", True)
+    assert ws.sent == [
+        {
+            "type": "onboarding_progress",
+            "payload": {"key": "dietaryPreferences", "value": True},
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_changed_value_is_resent() -> None:
+    ws = _FakeWebSocket()
+    emitted: Dict[str, bool] = {}
+    await _send_progress(ws, emitted, "allergies", False)
+    await _send_progress(ws, emitted, "allergies", True)
+    assert [frame["payload"]["value"] for frame in ws.sent] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_completion_sends_one_progress_frame_per_key() -> None:
+    ws = _FakeWebSocket()
+    emitted: Dict[str, bool] = {}
+    await _send_completion_progress(ws, emitted)
+    assert {frame["type"] for frame in ws.sent} == {"onboarding_progress"}
+    assert [frame["payload"] for frame in ws.sent] == [
+        {"key": key, "value": True}
+        for key in (
+            "dietaryPreferences",
+            "restrictions",
+            "allergies",
+            "voiceSample",
+            "communityInterests",
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_completion_skips_emitted_keys() -> None:
+    ws = _FakeWebSocket()
+    emitted: Dict[str, bool] = {}
+    await _send_progress(ws, emitted, "general", True)
+    await _send_progress(ws, emitted, "allergies", False)
+    await _send_completion_progress(ws, emitted)
+
+    keys = [frame["payload"]["key"] for frame in ws.sent[2:]]
+    assert keys == ["restrictions", "allergies", "voiceSample", "communityInterests"]
+
+    # Everything is now reported complete; a second completion sends nothing.
+    sent = len(ws.sent)
+    await _send_completion_progress(ws, emitted)
+    assert len(ws.sent) == sent
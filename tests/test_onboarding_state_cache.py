@@ -0,0 +1,111 @@
+"""Unit tests for the Redis cache in front of `get_user_onboarding_state`."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents.onboarding_agent import tools
+
+_EMAIL = "t@x.com"
+
+
+def _profile(**overrides):
+    profile = {
+        "email": _EMAIL,
+        "first_name": "Ada",
+        "age": 30,
+        "dietary_restrictions": ["none"],
+        "is_onboarded": False,
+    }
+    profile.update(overrides)
+    return profile
+
+
+class _FakeRedisCache:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key: str):
+        return self.store.get(key)
+
+    async def set(self, key: str, value: bytes, ttl=None) -> None:
+        self.store[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedisCache:
+    fake = _FakeRedisCache()
+    monkeypatch.setattr(tools, "redis_cache", fake)
+    return fake
+
+
+@pytest.fixture
+def db(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    mock = MagicMock()
+    mock.get_onboarding_profile.return_value = _profile()
+    mock.update_onboarding_profile.return_value = _profile(age=31)
+    mock.update_user_by_email.return_value = True
+    for name in (
+        "get_onboarding_profile",
+        "update_onboarding_profile",
+        "update_user_by_email",
+    ):
+        monkeypatch.setattr(tools, name, getattr(mock, name))
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_repeat_reads_hit_database_once(fake_redis, db) -> None:
+    first = await tools.get_user_onboarding_state(_EMAIL)
+    second = await tools.get_user_onboarding_state(_EMAIL)
+    assert first == second
+    assert first["current_state"]["age"] == 30
+    db.get_onboarding_profile.assert_called_once_with(_EMAIL)
+
+
+@pytest.mark.asyncio
+async def test_update_writes_through(fake_redis, db) -> None:
+    await tools.get_user_onboarding_state(_EMAIL)
+    await tools.get_user_onboarding_state(_EMAIL, updates={"age": 31})
+    state = await tools.get_user_onboarding_state(_EMAIL)
+    assert state["current_state"]["age"] == 31
+    db.get_onboarding_profile.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_save_invalidates(fake_redis, db) -> None:
+    await tools.get_user_onboarding_state(_EMAIL)
+    await tools.save_user_to_graph_db({"email": _EMAIL, "age": 30})
+    await tools.get_user_onboarding_state(_EMAIL)
+    assert db.get_onboarding_profile.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_user_not_cached(fake_redis, db) -> None:
+    db.get_onboarding_profile.return_value = None
+    state = await tools.get_user_onboarding_state(_EMAIL)
+    assert state["success"] is False
+    assert fake_redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_database(monkeypatch, db) -> None:
+    broken = MagicMock()
+    broken.get.side_effect = RuntimeError("Redis is not connected")
+    broken.set.side_effect = RuntimeError("Redis is not connected")
+    monkeypatch.setattr(tools, "redis_cache", broken)
+    state = await tools.get_user_onboarding_state(_EMAIL)
+    assert state["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_empty_string_counts_as_missing(fake_redis, db) -> None:
+    db.get_onboarding_profile.return_value = _profile(price_range="", is_tourist=False)
+    state = await tools.get_user_onboarding_state(_EMAIL)
+    assert "price_range" in state["missing_fields"]
+    assert "is_tourist" not in state["missing_fields"]
@@ -0,0 +1,58 @@
+"""Tests for the single-query Order reads in `models/order.py` and `/food/orders`.
+
+`db.cypher_query` is patched, so these only lock in the parameters we
+send to Neo4j and how results are mapped back.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.app.api.routes import food
+from src.app.models import order as order_mod
+
+
+@pytest.fixture
+def cypher(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    fake = MagicMock(return_value=([], ["o"]))
+    monkeypatch.setattr(order_mod.db, "cypher_query", fake)
+    return fake
+
+
+def test_list_pushes_order_and_limit_to_neo4j(cypher: MagicMock) -> None:
+    cypher.return_value = ([[{"order_id": "o-2"}], [{"order_id": "o-1"}]], ["o"])
+    assert order_mod.list_orders_for_user("u-1", 5) == [
+        {"order_id": "o-2"},
+        {"order_id": "o-1"},
+    ]
+    query, params = cypher.call_args.args
+    assert "ORDER BY o.order_date DESC LIMIT $limit" in query
+    assert params == {"uid": "u-1", "limit": 5}
+
+
+def test_get_matches_order_id_within_the_users_orders(cypher: MagicMock) -> None:
+    assert order_mod.get_order_for_user("u-1", "o-9") is None
+    query, params = cypher.call_args.args
+    assert "(o:Order {order_id: $order_id})" in query
+    assert "(:User {uid: $uid})-[:PLACED_ORDER]->" in query
+    assert params == {"uid": "u-1", "order_id": "o-9"}
+
+
+def test_route_helper_maps_projection(cypher: MagicMock) -> None:
+    cypher.return_value = (
+        [[{"order_id": "o-1", "status": "confirmed", "total_amount": 12.5,
+           "order_date": 0.0}]],
+        ["o"],
+    )
+    (out,) = food._list_orders_for_user(SimpleNamespace(uid="u-1"), 20)
+    assert out == {
+        "uid": "o-1",
+        "restaurant_name": None,
+        "dish_name": None,
+        "status": "confirmed",
+        "total_amount": 12.5,
+        "ordered_at": "1970-01-01T00:00:00+00:00",
+    }
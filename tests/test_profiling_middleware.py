@@ -0,0 +1,61 @@
+"""Tests for the profiling middleware and its `?profile=1` gate."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.app.api.middleware.profiling import _wants_profile
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (b"", False),
+        (b"profile=1", True),
+        (b"intent=food&profile=1", True),
+        (b"profile=0", False),
+        (b"profiles=1", False),
+        (b"profile=1&profile=1", False),
+    ],
+)
+def test_wants_profile(query: bytes, expected: bool) -> None:
+    assert _wants_profile({"query_string": query}) is expected
+
+
+async def _plain_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"route body"})
+
+
+async def _call(app, query: bytes) -> bytes:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": query,
+        "headers": [],
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return b"".join(
+        m.get("body", b"") for m in sent if m["type"] == "http.response.body"
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_replaces_body_with_report_when_asked() -> None:
+    pytest.importorskip("pyinstrument")
+    from src.app.api.middleware.profiling import ProfilingMiddleware
+
+    app = ProfilingMiddleware(_plain_app)
+    assert await _call(app, b"") == b"route body"
+    report = await _call(app, b"profile=1")
+    assert b"route body" not in report
+    assert b"<html" in report.lower()
@@ -0,0 +1,44 @@
+"""Tests for the pure-ASGI request-id / request-logging middleware."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.app.api.middleware import RequestContextMiddleware
+from src.app.core.logging import request_id_var
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/echo")
+    async def echo(request: Request):
+        return {
+            "state": request.state.request_id,
+            "ctx": request_id_var.get(),
+        }
+
+    return app
+
+
+def test_request_id_header_propagates() -> None:
+    client = TestClient(_app())
+    resp = client.get("/echo", headers={"X-Request-ID": "req-123"})
+    assert resp.status_code == 200
+    assert resp.json() == {"state": "req-123", "ctx": "req-123"}
+    assert resp.headers["X-Request-ID"] == "req-123"
+
+
+def test_request_id_generated_when_absent() -> None:
+    client = TestClient(_app())
+    resp = client.get("/echo")
+    generated = resp.headers["X-Request-ID"]
+    assert generated
+    assert resp.json() == {"state": generated, "ctx": generated}
+
+
+def test_context_var_reset_after_request() -> None:
+    TestClient(_app()).get("/echo", headers={"X-Request-ID": "req-xyz"})
+    assert request_id_var.get() is None
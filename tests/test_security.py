@@ -0,0 +1,93 @@
+"""Unit tests for password and audio hashing in SecurityManager."""
+
+from __future__ import annotations
+
+import hashlib
+from unittest.mock import AsyncMock
+
+import jwt
+import pytest
+from argon2 import PasswordHasher
+
+from src.app.core.config import settings
+from src.app.core.security import SecurityManager, security_manager
+
+
+class TestPasswordHashing:
+    def test_hash_is_argon2id_with_tuned_params(self) -> None:
+        hashed = security_manager.hash_password("correct horse")
+        assert hashed.startswith("$argon2id$")
+        assert "m=12288,t=3,p=1" in hashed
+        assert security_manager.verify_password("correct horse", hashed)
+        assert not security_manager.verify_password("wrong", hashed)
+
+    def test_current_hash_does_not_need_rehash(self) -> None:
+        hashed = security_manager.hash_password("correct horse")
+        assert security_manager.needs_rehash(hashed) is False
+
+    def test_default_param_hash_needs_rehash(self) -> None:
+        legacy = PasswordHasher().hash("correct horse")
+        assert security_manager.verify_password("correct horse", legacy)
+        assert security_manager.needs_rehash(legacy) is True
+
+    def test_garbage_hash_needs_rehash(self) -> None:
+        assert security_manager.needs_rehash("not-a-hash") is True
+
+    @pytest.mark.asyncio
+    async def test_async_wrappers_round_trip(self) -> None:
+        hashed = await security_manager.hash_password_async("pw-12345678")
+        assert await security_manager.verify_password_async("pw-12345678", hashed)
+
+
+class TestAudioHash:
+    def test_sha256_hex_digest(self) -> None:
+        data = b"\x00\x01" * 1024
+        assert security_manager.calculate_audio_hash(data) == (
+            hashlib.sha256(data).hexdigest()
+        )
+
+    def test_accepts_memoryview(self) -> None:
+        data = bytearray(b"abc")
+        assert security_manager.calculate_audio_hash(memoryview(data)) == (
+            security_manager.calculate_audio_hash(b"abc")
+        )
+
+
+class TestJWTKeys:
+    def test_hs256_signs_and_verifies_with_secret_key(self) -> None:
+        assert security_manager.jwt_signing_key == settings.SECRET_KEY
+        assert security_manager.jwt_verify_key == settings.SECRET_KEY
+
+    @pytest.mark.asyncio
+    async def test_eddsa_round_trip(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("cryptography")
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PrivateKey,
+        )
+
+        from src.app.core.jwt_cache import jwt_cache
+
+        key = Ed25519PrivateKey.generate()
+        private_pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        public_pem = key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode()
+        monkeypatch.setattr(settings, "ALGORITHM", "EdDSA")
+        monkeypatch.setattr(settings, "JWT_PRIVATE_KEY", private_pem)
+        monkeypatch.setattr(settings, "JWT_PUBLIC_KEY", public_pem)
+
+        manager = SecurityManager()
+        monkeypatch.setattr(manager, "is_token_blacklisted", AsyncMock(return_value=False))
+        monkeypatch.setattr(manager, "is_token_version_stale", AsyncMock(return_value=False))
+        token = manager.create_access_token({"sub": "u-1"})
+        assert jwt.get_unverified_header(token)["alg"] == "EdDSA"
+        jwt_cache.clear()
+        payload = await manager.verify_token(token)
+        jwt_cache.clear()
+        assert payload is not None and payload["sub"] == "u-1"
@@ -0,0 +1,33 @@
+"""Unit tests for stripping model reasoning from onboarding LLM output."""
+
+from __future__ import annotations
+
+from src.agents.onboarding_agent.tools import filter_thinking_tokens
+
+
+def test_think_block_removed() -> None:
+    raw = "<think>\nthe user is vegan\n</think>\n\nWhat cuisines do you enjoy?"
+    assert filter_thinking_tokens(raw) == "What cuisines do you enjoy?"
+
+
+def test_thinking_block_removed_case_insensitive() -> None:
+    raw = "<THINKING>hmm</THINKING>How spicy do you like it?"
+    assert filter_thinking_tokens(raw) == "How spicy do you like it?"
+
+
+def test_multiple_blocks_removed() -> None:
+    raw = "<think>a</think>Are you <think>b</think>a tourist?"
+    assert filter_thinking_tokens(raw) == "Are you a tourist?"
+
+
+def test_reasoning_preamble_removed() -> None:
+    raw = "Let me think about this.\n\nWhat is your age?"
+    assert filter_thinking_tokens(raw) == "What is your age?"
+
+
+def test_blank_lines_collapsed() -> None:
+    assert filter_thinking_tokens("Hi!\n\n \nHow old are you?") == "Hi!\nHow old are you?"
+
+
+def test_empty_passthrough() -> None:
+    assert filter_thinking_tokens("") == ""
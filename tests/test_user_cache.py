@@ -0,0 +1,91 @@
+"""Unit tests for the in-process User cache and its use in WS auth."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.app.api.routes import agent_ws
+from src.app.core.user_cache import UserCache, user_cache
+from src.app.models import user as user_mod
+
+
+def _user(uid: str = "u-1", email: str = "t@x.com") -> SimpleNamespace:
+    return SimpleNamespace(uid=uid, email=email)
+
+
+class TestUserCache:
+    def test_put_then_get(self) -> None:
+        cache = UserCache(maxsize=10, ttl=5)
+        user = _user()
+        cache.put(user)
+        assert cache.get("u-1") is user
+
+    def test_entry_expires_after_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = UserCache(maxsize=10, ttl=5)
+        cache.put(_user())
+        later = time.monotonic() + 6
+        monkeypatch.setattr("src.app.core.user_cache.time.monotonic", lambda: later)
+        assert cache.get("u-1") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_at_maxsize(self) -> None:
+        cache = UserCache(maxsize=2, ttl=5)
+        cache.put(_user("a", "a@x.com"))
+        cache.put(_user("b", "b@x.com"))
+        cache.get("a")  # touch: "b" is now least recently used
+        cache.put(_user("c", "c@x.com"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        # The evicted user's email no longer resolves.
+        cache.invalidate_email("b@x.com")
+        assert len(cache) == 2
+
+    def test_invalidate_by_email(self) -> None:
+        cache = UserCache()
+        cache.put(_user())
+        cache.invalidate_email("t@x.com")
+        assert cache.get("u-1") is None
+        cache.invalidate_email("unknown@x.com")  # no-op
+
+    def test_invalid_construction_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            UserCache(maxsize=0)
+        with pytest.raises(ValueError):
+            UserCache(ttl=0)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_ws_auth_reuses_cached_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = _user()
+    lookup = MagicMock(return_value=user)
+    monkeypatch.setattr(agent_ws, "get_user_by_uid", lookup)
+    monkeypatch.setattr(
+        agent_ws.security_manager,
+        "verify_token",
+        AsyncMock(return_value={"sub": "u-1"}),
+    )
+
+    ws = SimpleNamespace(query_params={})
+    assert await agent_ws.get_current_user_from_token(ws, token="tok") is user
+    assert await agent_ws.get_current_user_from_token(ws, token="tok") is user
+    lookup.assert_called_once_with("u-1")
+
+
+def test_profile_write_invalidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        user_mod.db, "cypher_query", MagicMock(return_value=([[1]], ["count(u)"]))
+    )
+    user_cache.put(_user())
+    user_mod.update_user_by_email("t@x.com", {"age": 30})
+    assert user_cache.get("u-1") is None
@@ -0,0 +1,139 @@
+"""Tests for the single-query User helpers in `models/user.py`.
+
+`db.cypher_query` is patched, so these only lock in the parameters we
+send to Neo4j and how results are mapped back.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.app.models import user as user_mod
+
+
+@pytest.fixture
+def cypher(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    fake = MagicMock(return_value=([[1]], ["count(u)"]))
+    monkeypatch.setattr(user_mod.db, "cypher_query", fake)
+    return fake
+
+
+class TestUpdateUserByEmail:
+    def test_sends_deflated_known_props_only(self, cypher: MagicMock) -> None:
+        ok = user_mod.update_user_by_email(
+            "t@x.com",
+            {
+                "age": 30,
+                "food_allergies": ["peanuts"],
+                "price_range": "budget",
+                "not_a_field": "ignored",
+                "uid": "never-overwritten",
+            },
+        )
+        assert ok is True
+        params = cypher.call_args.args[1]
+        assert params["email"] == "t@x.com"
+        assert params["props"] == {
+            "age": 30,
+            "food_allergies": ["peanuts"],
+            "price_range": "budget",
+        }
+
+    def test_invalid_choice_rejected(self, cypher: MagicMock) -> None:
+        with pytest.raises(Exception):
+            user_mod.update_user_by_email("t@x.com", {"price_range": "free"})
+        cypher.assert_not_called()
+
+    def test_missing_user_returns_false(self, cypher: MagicMock) -> None:
+        cypher.return_value = ([[0]], ["count(u)"])
+        assert user_mod.update_user_by_email("nobody@x.com", {"age": 1}) is False
+
+
+class TestGetOnboardingProfile:
+    def test_returns_projected_map(self, cypher: MagicMock) -> None:
+        cypher.return_value = ([[{"email": "t@x.com", "age": 30}]], ["u"])
+        assert user_mod.get_onboarding_profile("t@x.com") == {
+            "email": "t@x.com",
+            "age": 30,
+        }
+
+    def test_no_rows_is_none(self, cypher: MagicMock) -> None:
+        cypher.return_value = ([], ["u"])
+        assert user_mod.get_onboarding_profile("nobody@x.com") is None
+
+
+class TestUpdateOnboardingProfile:
+    def test_writes_and_returns_projection_in_one_query(
+        self, cypher: MagicMock
+    ) -> None:
+        cypher.return_value = ([[{"email": "t@x.com", "age": 31}]], ["u"])
+        profile = user_mod.update_onboarding_profile("t@x.com", {"age": 31})
+        assert profile == {"email": "t@x.com", "age": 31}
+        cypher.assert_called_once()
+        query, params = cypher.call_args.args
+        assert "SET u += $props" in query and "RETURN u {" in query
+        assert params["props"] == {"age": 31}
+
+    def test_missing_user_is_none(self, cypher: MagicMock) -> None:
+        cypher.return_value = ([], ["u"])
+        assert user_mod.update_onboarding_profile("nobody@x.com", {"age": 1}) is None
+
+
+class TestBulkConnect:
+    def test_visited_edges_in_one_unwind(self, cypher: MagicMock) -> None:
+        cypher.return_value = ([[2]], ["count(r)"])
+        merged = user_mod.bulk_connect(
+            "visited_restaurants",
+            [
+                ("u-1", "r-1", {"visit_purpose": "dining", "party_size": 2}),
+                ("u-1", "r-2", None),
+            ],
+        )
+        assert merged == 2
+        cypher.assert_called_once()
+        query, params = cypher.call_args.args
+        assert "MATCH (t:Restaurant {restaurant_id: row.target})" in query
+        assert "MERGE (u)-[r:VISITED]->(t) SET r += row.props" in query
+        first, second = params["rows"]
+        assert first["uid"] == "u-1" and first["target"] == "r-1"
+        assert first["props"]["visit_purpose"] == "dining"
+        assert first["props"]["party_size"] == 2
+        # Model defaults are filled in as `connect` would.
+        assert "visited_date" in second["props"]
+
+    def test_friends_target_users_by_uid(self, cypher: MagicMock) -> None:
+        user_mod.bulk_connect("friends", [("u-1", "u-2", None)])
+        query, _ = cypher.call_args.args
+        assert "MATCH (t:User {uid: row.target})" in query
+        assert "[r:FRIENDS]" in query
+
+    def test_invalid_choice_rejected(self, cypher: MagicMock) -> None:
+        with pytest.raises(Exception):
+            user_mod.bulk_connect(
+                "visited_restaurants", [("u-1", "r-1", {"visit_purpose": "nope"})]
+            )
+        cypher.assert_not_called()
+
+    def test_empty_batch_skips_query(self, cypher: MagicMock) -> None:
+        assert user_mod.bulk_connect("likes", []) == 0
+        cypher.assert_not_called()
+
+    def test_model_less_relationship_uses_plain_edges(
+        self, cypher: MagicMock
+    ) -> None:
+        cypher.return_value = ([[1]], ["count(r)"])
+        assert user_mod.bulk_connect("follows", [("u-1", "u-2", None)]) == 1
+        query, params = cypher.call_args.args
+        assert "[r:FOLLOWS]" in query
+        assert params["rows"] == [{"uid": "u-1", "target": "u-2", "props": {}}]
+
+    def test_target_without_unique_id_rejected(self, cypher: MagicMock) -> None:
+        with pytest.raises(ValueError, match="Location"):
+            user_mod.bulk_connect("home_location", [("u-1", "loc-1", None)])
+        cypher.assert_not_called()
+
+    def test_unknown_relationship_rejected(self, cypher: MagicMock) -> None:
+        with pytest.raises(ValueError):
+            user_mod.bulk_connect("nope", [("u-1", "x", None)])
@@ -0,0 +1,35 @@
+"""Unit tests for the input validators."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.app.utils import validators
+
+
+def test_validate_email_is_syntax_only_and_cached() -> None:
+    validators.validate_email.cache_clear()
+    with patch.object(
+        validators, "email_validate", wraps=validators.email_validate
+    ) as spy:
+        assert validators.validate_email("Someone@Example.com") == (
+            True,
+            "Someone@example.com",
+        )
+        assert validators.validate_email("Someone@Example.com")[0] is True
+    spy.assert_called_once_with("Someone@Example.com", check_deliverability=False)
+    assert validators.validate_email("not-an-email") == (False, None)
+
+
+def test_validate_phone_ignores_spaces_and_dashes() -> None:
+    assert validators.validate_phone("+1 415-555-0100")
+    assert not validators.validate_phone("555-01")
+
+
+def test_validate_audio_file_accepts_memoryview_slices() -> None:
+    buf = bytearray(11 * 1024 * 1024)
+    view = memoryview(buf)
+    assert validators.validate_audio_file(view[: 1024 * 1024])
+    assert not validators.validate_audio_file(view)
+    assert not validators.validate_audio_file(view.cast("I")[: 3 * 1024 * 1024])
+    assert not validators.validate_audio_file(b"")
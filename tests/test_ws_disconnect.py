@@ -0,0 +1,38 @@
+"""A client vanishing mid-turn ends the WS session quietly."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from src.app.api.routes import onboarding_ws
+
+
+def test_disconnect_mid_turn_is_not_reported(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    user = SimpleNamespace(uid="u-1", email="t@x.com", first_name="Ada")
+
+    async def _auth(websocket):
+        return user
+
+    async def _turn(**kwargs):
+        raise WebSocketDisconnect(code=1006)
+
+    monkeypatch.setattr(onboarding_ws, "get_current_user_from_token", _auth)
+    monkeypatch.setattr(onboarding_ws, "_process_user_turn", _turn)
+    app = FastAPI()
+    app.include_router(onboarding_ws.router)
+
+    with caplog.at_level(logging.INFO, logger=onboarding_ws.__name__):
+        with TestClient(app).websocket_connect("/ws/onboarding") as ws:
+            ws.receive_text()  # greeting
+            ws.send_text('{"type": "user_message", "payload": {"text": "hi"}}')
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "WS onboarding disconnected: user=t@x.com" in messages
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]